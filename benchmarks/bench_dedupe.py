@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fuzzy title matching, pairwise loop vs rapidfuzz cdist.
+
+Compares the per-pair fuzz.ratio loop against the matrix path used by
+dedupe_all (match_titles for the recent window, similar_pairs for the
+batch itself) and checks both give the same matches.
+
+Usage:
+    python benchmarks/bench_dedupe.py [sizes...]    (default: 1000 10000)
+"""
+import random
+import sys
+import os
+import time
+
+# Ensure project root is on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rapidfuzz import fuzz
+
+from processor.dedupe import (
+    BATCH_SIMILARITY_THRESHOLD,
+    best_title_match,
+    match_titles,
+    similar_pairs,
+)
+
+WORDS = (
+    "real madrid barcelona atletico sevilla betis valencia gana pierde empata "
+    "fichaje oficial lesion mbappe vinicius lewandowski griezmann liga copa "
+    "champions final semifinal goles victoria derrota clasico derbi entrenador "
+    "renueva contrato hasta 2028 confirmado parte medico baja semanas"
+).split()
+
+# Titles in the recent window (capped like Repository.get_recent_titles)
+RECENT_WINDOW = 500
+
+
+def make_titles(n: int, seed: int = 42) -> list:
+    """Generate n titles, roughly a fifth of them near-duplicates."""
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(n):
+        if titles and rng.random() < 0.2:
+            base = rng.choice(titles)
+            titles.append(base + rng.choice(["", " hoy", "s", " ya"]))
+        else:
+            titles.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 11))))
+    return titles
+
+
+def pairwise_batch(titles: list, threshold: float) -> list:
+    """Original in-batch loop: compare each title with every accepted one."""
+    accepted = []
+    for title in titles:
+        if any(fuzz.ratio(title, seen) / 100.0 >= threshold for seen in accepted):
+            continue
+        accepted.append(title)
+    return accepted
+
+
+def matrix_batch(titles: list, threshold: float) -> list:
+    """Same walk as dedupe_all, on top of the cdist neighbour sets."""
+    unique = list(dict.fromkeys(titles))
+    index = {title: i for i, title in enumerate(unique)}
+    neighbours = similar_pairs(unique, threshold)
+    accepted, accepted_idx = [], set()
+    for title in titles:
+        i = index[title]
+        if i in accepted_idx or neighbours[i] & accepted_idx:
+            continue
+        accepted_idx.add(i)
+        accepted.append(title)
+    return accepted
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def run(n: int):
+    threshold = BATCH_SIMILARITY_THRESHOLD
+    titles = make_titles(n)
+    recent = [{"id": i, "normalized_title": t} for i, t in enumerate(make_titles(RECENT_WINDOW, seed=7))]
+
+    loop_win, t_loop_win = timed(lambda: [best_title_match(t, recent, threshold) for t in titles])
+    cdist_win, t_cdist_win = timed(match_titles, titles, recent, threshold)
+    assert loop_win == cdist_win, "recent-window matches differ"
+
+    loop_batch, t_loop_batch = timed(pairwise_batch, titles, threshold)
+    cdist_batch, t_cdist_batch = timed(matrix_batch, titles, threshold)
+    assert loop_batch == cdist_batch, "in-batch results differ"
+
+    print(f"n={n}")
+    print(f"  vs recent window ({RECENT_WINDOW}): loop {t_loop_win:8.3f}s  cdist {t_cdist_win:8.3f}s  "
+          f"x{t_loop_win / max(t_cdist_win, 1e-9):.1f}")
+    print(f"  within batch:             loop {t_loop_batch:8.3f}s  cdist {t_cdist_batch:8.3f}s  "
+          f"x{t_loop_batch / max(t_cdist_batch, 1e-9):.1f}  ({len(cdist_batch)} unique)")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000]
+    for size in sizes:
+        run(size)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing queries with SELECT * vs the card projection.
+
+Compares, per page of articles, the result-set bytes sent by the server
+(sum of the text-protocol values, a lower bound of the wire size) and the
+memory held by the rows once loaded: full row dicts vs WebArticleCard.
+
+Without --db, pages are built from synthetic articles sized like the
+pipeline output (a few KB of body_html/body_text each). With --db, the
+real queries run against the configured database.
+
+Usage:
+    python benchmarks/bench_listing_projection.py [--db] [per_page]    (default: 18)
+"""
+import random
+import sys
+import os
+import tracemalloc
+from datetime import datetime, timedelta
+
+# Ensure project root is on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.repo import WEB_ARTICLE_CARD_COLUMNS, WEB_ARTICLE_CARD_SELECT, WebArticleCard
+
+WORDS = (
+    "real madrid barcelona atletico sevilla betis valencia gana pierde empata "
+    "fichaje oficial lesion mbappe vinicius lewandowski griezmann liga copa "
+    "champions final semifinal goles victoria derrota clasico derbi entrenador"
+).split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def synthetic_rows(n: int, seed: int = 7) -> list:
+    """Full web_articles rows (all columns) as the driver would return them."""
+    rng = random.Random(seed)
+    now = datetime(2026, 10, 1, 12, 0)
+    rows = []
+    for i in range(n):
+        paragraphs = [sentence(rng, rng.randint(40, 80)) + "." for _ in range(rng.randint(5, 9))]
+        headline = sentence(rng, 10)
+        rows.append({
+            "id": 10000 - i,
+            "article_id": 50000 - i,
+            "slug": headline.lower().replace(" ", "-")[:80] + f"-{i}",
+            "headline": headline,
+            "subtitle": sentence(rng, 18),
+            "body_html": "".join(f"<p>{p}</p>\n" for p in paragraphs),
+            "body_text": "\n\n".join(paragraphs),
+            "meta_description": sentence(rng, 25)[:160],
+            "meta_keywords": ", ".join(rng.sample(WORDS, 8)),
+            "og_title": headline,
+            "og_description": sentence(rng, 25)[:200],
+            "og_image_url": f"https://cdn.example.com/og/{i}.jpg",
+            "sport": "football_eu",
+            "category": "transfer",
+            "status": "RUMOR",
+            "image_filename": f"article_{i}.webp",
+            "image_url": None,
+            "source_name": "Marca",
+            "source_url": f"https://www.marca.com/futbol/{i}.html",
+            "is_published": 1,
+            "is_featured": 0,
+            "view_count": rng.randint(0, 5000),
+            "score": rng.randint(0, 100),
+            "created_at": now - timedelta(minutes=17 * i),
+            "updated_at": now - timedelta(minutes=17 * i),
+        })
+    return rows
+
+
+def wire_bytes(rows: list, columns) -> int:
+    """Bytes of the values in the text protocol (NULLs count as 1)."""
+    total = 0
+    for row in rows:
+        for column in columns:
+            value = row[column]
+            total += 1 if value is None else len(str(value).encode("utf-8"))
+    return total
+
+
+def encoded(rows: list, columns) -> list:
+    """Rows as raw protocol values, so decoding can be measured."""
+    return [
+        [(column, None if row[column] is None else str(row[column]).encode("utf-8")) for column in columns]
+        for row in rows
+    ]
+
+
+def load_dicts(wire: list) -> list:
+    return [{column: None if raw is None else raw.decode("utf-8") for column, raw in row} for row in wire]
+
+
+def load_cards(wire: list) -> list:
+    return [WebArticleCard(**{column: None if raw is None else raw.decode("utf-8") for column, raw in row})
+            for row in wire]
+
+
+def retained(loader, wire: list):
+    """(retained bytes, peak bytes) of loader(wire)."""
+    tracemalloc.start()
+    result = loader(wire)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def fetch_pages(per_page: int):
+    """Run both projections against the configured database."""
+    from db import get_database
+    db = get_database()
+    query = "SELECT {} FROM web_articles WHERE is_published = 1 ORDER BY created_at DESC, id DESC LIMIT %s"
+    full = db.fetchall(query.format("*"), (per_page,))
+    cards = db.fetchall(query.format(WEB_ARTICLE_CARD_SELECT), (per_page,))
+    return [dict(row) for row in full], [dict(row) for row in cards]
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    per_page = int(args[0]) if args else 18
+
+    if "--db" in sys.argv:
+        full, cards = fetch_pages(per_page)
+        source = "database"
+    else:
+        full = synthetic_rows(per_page)
+        cards = [{column: row[column] for column in WEB_ARTICLE_CARD_COLUMNS} for row in full]
+        source = "synthetic"
+
+    if not full:
+        print("No published web articles to measure.")
+        return
+
+    all_columns = list(full[0].keys())
+    before_bytes = wire_bytes(full, all_columns)
+    after_bytes = wire_bytes(cards, WEB_ARTICLE_CARD_COLUMNS)
+    before_mem, before_peak = retained(load_dicts, encoded(full, all_columns))
+    after_mem, after_peak = retained(load_cards, encoded(cards, WEB_ARTICLE_CARD_COLUMNS))
+
+    n = len(full)
+    print(f"Listing page of {n} articles ({source})")
+    print(f"{'':30s}{'bytes/page':>12s}{'bytes/article':>15s}{'memory/page':>13s}{'peak':>10s}")
+    print(f"{'SELECT * (dicts)':30s}{before_bytes:12,d}{before_bytes // n:15,d}{before_mem:13,d}{before_peak:10,d}")
+    print(f"{'card columns (WebArticleCard)':30s}{after_bytes:12,d}{after_bytes // n:15,d}{after_mem:13,d}{after_peak:10,d}")
+    print(f"Transferred: {before_bytes / max(after_bytes, 1):.1f}x less, "
+          f"memory: {before_mem / max(after_mem, 1):.1f}x less")
+
+
+if __name__ == "__main__":
+    main()
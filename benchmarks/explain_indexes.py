@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Check that the hot web and pipeline queries use the composite indexes.
+
+Captures the exact SQL that the Repository methods send (so the check
+follows the code), runs EXPLAIN for each statement against the configured
+database and verifies both the chosen key and, where the index covers the
+ORDER BY, that MySQL does not filesort.
+
+On a near-empty table the optimizer may prefer a full scan; run against a
+copy of production data for meaningful plans.
+
+Usage:
+    python benchmarks/explain_indexes.py [-v]
+"""
+import sys
+import os
+from datetime import datetime
+
+# Ensure project root is on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import get_database
+from db.repo import Repository
+
+
+class CapturingDatabase:
+    """Database stand-in that records statements instead of running them."""
+
+    def __init__(self):
+        self.statements = []
+
+    def fetchall(self, query, params=()):
+        self.statements.append((query, params))
+        return []
+
+    def fetchone(self, query, params=()):
+        self.statements.append((query, params))
+        return None
+
+
+def capture(call):
+    """Return the (query, params) sent by call(repo)."""
+    db = CapturingDatabase()
+    call(Repository(db))
+    return db.statements[-1]
+
+
+SPORT = "football_eu"
+CURSOR = (datetime(2030, 1, 1), 2 ** 31 - 1)
+
+# (label, repository call, expected key, filesort allowed)
+CHECKS = [
+    ("home page 3 (offset)", lambda r: r.get_web_articles_paginated(page=3, per_page=18),
+     "idx_wa_published_created", False),
+    ("home keyset", lambda r: r.get_web_articles_keyset(limit=19, after=CURSOR),
+     "idx_wa_published_created", False),
+    ("category page 3 (offset)", lambda r: r.get_web_articles_paginated(page=3, sport=SPORT),
+     "idx_wa_published_sport_created", False),
+    ("category keyset", lambda r: r.get_web_articles_keyset(limit=13, sport=SPORT, after=CURSOR),
+     "idx_wa_published_sport_created", False),
+    ("category count", lambda r: r.get_web_article_count_by_sport(SPORT),
+     "idx_wa_published_sport_created", False),
+    ("featured", lambda r: r.get_featured_web_articles(limit=4),
+     "idx_wa_published_featured_created", False),
+    ("latest", lambda r: r.get_latest_web_articles(limit=12),
+     "idx_wa_published_created", False),
+    ("related", lambda r: r.get_related_web_articles(SPORT, "some-slug", limit=4),
+     "idx_wa_published_sport_created", False),
+    ("comments", lambda r: r.get_comments(1),
+     "idx_web_comments_article_created", False),
+    ("post candidates", lambda r: r.get_unposted_candidates(min_score=40, limit=50),
+     "idx_articles_pending_score", False),
+    ("digest candidates", lambda r: r.get_digest_candidates(SPORT),
+     "idx_articles_sport_pending", True),
+    ("recent articles by sport", lambda r: r.get_recent_articles(hours=6, sport=SPORT),
+     "idx_articles_sport_created", True),
+    ("dedupe title window", lambda r: r.get_recent_titles(hours=6),
+     "idx_articles_created_at", False),
+    ("last post by sport", lambda r: r.last_post_time_by_sport(SPORT),
+     "idx_posts_sport_posted", False),
+]
+
+
+def main():
+    verbose = "-v" in sys.argv[1:]
+    db = get_database()
+    failures = 0
+
+    for label, call, expected_key, filesort_ok in CHECKS:
+        query, params = capture(call)
+        plan = db.fetchall("EXPLAIN " + query, params)
+        keys = [row.get('key') for row in plan]
+        extra = " | ".join(row.get('Extra') or "" for row in plan)
+
+        problems = []
+        if expected_key not in keys:
+            problems.append(f"key={keys} expected {expected_key}")
+        if not filesort_ok and "filesort" in extra:
+            problems.append("filesort")
+
+        status = "FAIL" if problems else "ok"
+        failures += bool(problems)
+        print(f"{status:<5} {label:<28} key={','.join(k or '-' for k in keys):<36} {'; '.join(problems)}")
+        if verbose or problems:
+            for row in plan:
+                print(f"      rows={row.get('rows')} type={row.get('type')} extra={row.get('Extra')}")
+
+    print(f"\n{len(CHECKS) - failures}/{len(CHECKS)} queries use the expected index")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,15 @@
 """Collector module for GoalFeed."""
-from .rss_collector import RawItem, fetch_feed, collect_all, collect_by_sport
+from .rss_collector import (
+    RawItem, FetchResult, fetch_feed, fetch_source, collect_results, collect_all, collect_by_sport
+)
 from .og_image import extract_og_image, validate_image_url, get_best_image
 
 __all__ = [
     'RawItem',
+    'FetchResult',
     'fetch_feed',
+    'fetch_source',
+    'collect_results',
     'collect_all',
     'collect_by_sport',
     'extract_og_image',
@@ -3,9 +3,13 @@ RSS Collector for GoalFeed.
 Fetches and parses RSS feeds from configured sources.
 """
 import logging
+import time
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
 
 import feedparser
 import requests
@@ -36,6 +40,20 @@ class RawItem:
     categories: List[str] = field(default_factory=list)
 
 
+@dataclass
+class FetchResult:
+    """Outcome of fetching a single source during a collection run."""
+    source: RSSSource
+    items: List[RawItem] = field(default_factory=list)
+    elapsed: float = 0.0  # Wall time of the fetch in seconds
+    ok: bool = False  # True if the server answered 200 or 304
+    not_modified: bool = False  # True if the server answered 304 (feed unchanged)
+    
+    # HTTP validators to send on the next conditional request
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
 def _extract_image_from_entry(entry: Dict) -> Optional[str]:
     """
     Extract image URL from a feed entry.
@@ -136,18 +154,28 @@ def _extract_categories(entry: Dict) -> List[str]:
     return [c for c in categories if c]
 
 
-def fetch_feed(source: RSSSource, timeout: int = 15) -> List[RawItem]:
+def _fetch(source: RSSSource, timeout: int = 15, conditional: bool = True) -> FetchResult:
     """
-    Fetch and parse a single RSS feed.
+    Fetch and parse a single RSS feed, honouring HTTP validators.
+    
+    When the source carries an ETag / Last-Modified from a previous poll,
+    they are sent as If-None-Match / If-Modified-Since. A 304 answer
+    returns no items and skips parsing entirely.
     
     Args:
         source: RSS source configuration
         timeout: Request timeout in seconds
+        conditional: Send stored validators with the request
         
     Returns:
-        List of RawItem objects
+        FetchResult (elapsed is left at 0, see fetch_source)
     """
-    items = []
+    result = FetchResult(
+        source=source,
+        etag=source.etag,
+        last_modified=source.last_modified
+    )
+    items = result.items
     
     try:
         logger.debug(f"Fetching feed: {source.name} ({source.url})")
@@ -157,6 +185,11 @@ def fetch_feed(source: RSSSource, timeout: int = 15) -> List[RawItem]:
             'User-Agent': 'GoalFeed/1.0 (RSS Reader)',
             'Accept': 'application/rss+xml, application/xml, text/xml, */*'
         }
+        if conditional:
+            if source.etag:
+                headers['If-None-Match'] = source.etag
+            if source.last_modified:
+                headers['If-Modified-Since'] = source.last_modified
         
         response = requests.get(
             source.url,
@@ -164,7 +197,20 @@ def fetch_feed(source: RSSSource, timeout: int = 15) -> List[RawItem]:
             timeout=timeout,
             allow_redirects=True
         )
+        
+        if response.status_code == 304:
+            result.ok = True
+            result.not_modified = True
+            # Servers may rotate validators on 304; keep the old ones otherwise
+            result.etag = response.headers.get('ETag') or source.etag
+            result.last_modified = response.headers.get('Last-Modified') or source.last_modified
+            logger.debug(f"Feed not modified: {source.name}")
+            return result
+        
         response.raise_for_status()
+        result.ok = True
+        result.etag = response.headers.get('ETag')
+        result.last_modified = response.headers.get('Last-Modified')
         
         # Parse the feed
         feed = feedparser.parse(response.content)
@@ -221,7 +267,134 @@ def fetch_feed(source: RSSSource, timeout: int = 15) -> List[RawItem]:
     except Exception as e:
         logger.error(f"Error fetching feed {source.name}: {e}")
     
-    return items
+    return result
+
+
+def fetch_feed(source: RSSSource, timeout: int = 15) -> List[RawItem]:
+    """
+    Fetch and parse a single RSS feed.
+    
+    Args:
+        source: RSS source configuration
+        timeout: Request timeout in seconds
+        
+    Returns:
+        List of RawItem objects
+    """
+    return _fetch(source, timeout=timeout, conditional=False).items
+
+
+def _host_of(url: str) -> str:
+    """Get the lowercase host of a feed URL (used for per-host limits)."""
+    return urlparse(url).netloc.lower()
+
+
+def fetch_source(
+    source: RSSSource,
+    timeout: int = 15
+) -> FetchResult:
+    """
+    Fetch a single source and time it.
+    
+    Args:
+        source: RSS source configuration
+        timeout: Request timeout in seconds
+        
+    Returns:
+        FetchResult with the parsed items and elapsed time
+    """
+    conditional = get_config().collector.conditional_get
+    start = time.monotonic()
+    
+    result = _fetch(source, timeout=timeout, conditional=conditional)
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+def collect_results(
+    sources: Optional[List[RSSSource]] = None,
+    max_workers: Optional[int] = None,
+    max_per_host: Optional[int] = None
+) -> List[FetchResult]:
+    """
+    Fetch all sources concurrently with bounded parallelism.
+    
+    At most ``max_workers`` feeds are in flight at once, and at most
+    ``max_per_host`` of them against the same host, so a cycle takes
+    roughly as long as its slowest feed instead of the sum of all feeds.
+    
+    Each host has its own queue: a host's next feed is only handed to the
+    pool when one of its fetches finishes, so workers never sit blocked on
+    a busy host (e.g. eleven BBC feeds in a row) while other hosts wait.
+    
+    Args:
+        sources: List of sources (uses config if not provided)
+        max_workers: Max parallel fetches (uses config if not provided)
+        max_per_host: Max parallel fetches per host (uses config if not provided)
+        
+    Returns:
+        One FetchResult per source, in the same order as ``sources``
+    """
+    config = get_config()
+    
+    if sources is None:
+        sources = config.rss_sources
+    if max_workers is None:
+        max_workers = config.collector.max_workers
+    if max_per_host is None:
+        max_per_host = config.collector.max_per_host
+    
+    if not sources:
+        return []
+    
+    # Source indexes per host, in config order
+    host_queues: Dict[str, deque] = {}
+    for index, source in enumerate(sources):
+        host_queues.setdefault(_host_of(source.url), deque()).append(index)
+    
+    results: List[Optional[FetchResult]] = [None] * len(sources)
+    
+    start = time.monotonic()
+    workers = max(1, min(max_workers, len(sources)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as pool:
+        in_flight = {}
+        
+        def submit_next(host: str):
+            if host_queues[host]:
+                index = host_queues[host].popleft()
+                future = pool.submit(fetch_source, sources[index], config.request_timeout)
+                in_flight[future] = (index, host)
+        
+        # Round-robin over hosts so the first slots are spread across them
+        for _ in range(max(1, max_per_host)):
+            for host in host_queues:
+                submit_next(host)
+        
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, host = in_flight.pop(future)
+                # _fetch never raises
+                results[index] = future.result()
+                submit_next(host)
+    wall_time = time.monotonic() - start
+    
+    for result in results:
+        outcome = "not modified" if result.not_modified else f"{len(result.items)} items"
+        logger.debug(
+            f"Source timing: {result.source.name} -> {outcome} in {result.elapsed:.2f}s"
+        )
+    
+    slowest = max(results, key=lambda r: r.elapsed)
+    unchanged = sum(1 for r in results if r.not_modified)
+    total_items = sum(len(r.items) for r in results)
+    logger.info(
+        f"Fetched {total_items} items from {len(results)} sources in {wall_time:.2f}s "
+        f"({unchanged} unchanged, slowest: {slowest.source.name} {slowest.elapsed:.2f}s, "
+        f"sum of sources: {sum(r.elapsed for r in results):.2f}s)"
+    )
+    
+    return results
 
 
 def collect_all(sources: Optional[List[RSSSource]] = None) -> List[RawItem]:
@@ -240,12 +413,8 @@ def collect_all(sources: Optional[List[RSSSource]] = None) -> List[RawItem]:
         sources = config.rss_sources
     
     all_items = []
-    
-    for source in sources:
-        items = fetch_feed(source, timeout=config.request_timeout)
-        all_items.extend(items)
-    
-    logger.info(f"Collected {len(all_items)} total items from {len(sources)} sources")
+    for result in collect_results(sources):
+        all_items.extend(result.items)
     
     return all_items
 
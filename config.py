@@ -3,7 +3,7 @@ GoalFeed Configuration Module
 All settings are loaded from environment variables with sensible defaults.
 """
 import os
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
@@ -26,6 +26,8 @@ class LiveConfig:
     poll_seconds: int = 90  # Poll interval for live matches
     max_events_per_match: int = 6  # Max events to publish per match
     event_cooldown_minutes: int = 8  # Cooldown between events of same match
+    stream_poll_seconds: int = 5  # Live version check behind the SSE stream
+    stream_heartbeat_seconds: int = 15  # Keep-alive comment on idle SSE streams
     
     # API Football (RapidAPI) configuration
     api_key: str = ""  # Set via env var FOOTBALL_API_KEY
@@ -80,6 +82,17 @@ class WebConfig:
     claude_api_key: str = ""
     claude_model: str = "claude-sonnet-4-5-20250929"
     articles_per_page: int = 12
+    count_cache_seconds: int = 120  # How long listing totals are reused
+    view_flush_seconds: float = 10.0  # Write buffered article views this often
+    view_flush_max_pending: int = 500  # ...or as soon as this many are buffered
+    page_cache_seconds: int = 60  # Rendered HTML TTL (0 disables the page cache)
+    page_cache_max_entries: int = 500
+    page_cache_version_path: str = "data/page_cache.version"  # Bumped on publish
+    page_cache_dir: str = ""  # Optional on-disk copy shared by all workers
+    sitemap_dir: str = ""  # Optional gzip-precompressed sitemap shards
+    session_cache_seconds: int = 30  # Session -> user lookups reused this long
+    session_cache_max_entries: int = 1000
+    debug_headers: bool = False  # Expose X-DB-Round-Trips headers on responses
     image_storage_path: str = "web/static/images/articles"
     # Google OAuth
     google_client_id: str = ""
@@ -87,6 +100,20 @@ class WebConfig:
     google_redirect_uri: str = ""
 
 
+@dataclass
+class CollectorConfig:
+    """RSS collection configuration settings."""
+    max_workers: int = 8  # Max feeds fetched in parallel
+    max_per_host: int = 2  # Max in-flight requests against the same host
+    conditional_get: bool = True  # Send If-None-Match / If-Modified-Since
+    
+    # Adaptive per-source polling (new sources start at poll_interval_seconds)
+    adaptive_polling: bool = True
+    min_poll_seconds: int = 60  # Hottest sources are polled at most this often
+    max_poll_seconds: int = 1800  # Quietest sources are polled at least this often
+    poll_backoff_factor: float = 1.5  # Interval growth per unchanged poll
+
+
 @dataclass
 class RSSSource:
     """RSS feed source configuration."""
@@ -94,6 +121,11 @@ class RSSSource:
     url: str
     sport_hint: str  # football_eu, nba, tennis
     weight: int = 10  # 1-25, higher = more important source
+    
+    # Filled when loaded from the sources table
+    source_id: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 @dataclass
@@ -143,6 +175,13 @@ class Config:
     db_password: str = ""
     db_name: str = ""
     db_charset: str = "utf8mb4"
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 10
+    db_pool_timeout: float = 10.0  # Seconds to wait for a free connection
+    db_health_check_seconds: float = 30.0  # Ping connections idle this long
+    db_read_only_mode: bool = True  # Autocommit reads: no per-query ping/commit
+    db_instrumentation: bool = False  # Per-query latency histograms and report
+    db_slow_query_ms: float = 200.0  # Log queries slower than this (instrumented)
     
     # Logging
     log_level: str = "INFO"
@@ -150,10 +189,30 @@ class Config:
     
     # Request timeouts
     request_timeout: int = 15
+
+    # RSS collection
+    collector: CollectorConfig = field(default_factory=CollectorConfig)
     
     # Dedupe settings
     dedupe_similarity_threshold: float = 0.88
     dedupe_hours_window: int = 6
+    dedupe_workers: int = -1  # Threads for fuzzy matching (-1 = all cores)
+    
+    # Seen-entry fast path (drops entries already stored as articles)
+    seen_filter_enabled: bool = True
+    seen_filter_warm_hours: int = 168  # Article history loaded at startup and kept in memory
+    seen_filter_bloom: bool = False  # Bloom filter instead of an exact set
+    seen_filter_capacity: int = 500000  # Bloom filter sizing
+    seen_filter_error_rate: float = 0.000001
+    
+    # Near-duplicate index (MinHash + LSH over title and summary shingles)
+    near_dup_enabled: bool = True
+    near_dup_reject: bool = False  # False = only log matches (no measured false-positive rate yet)
+    near_dup_horizon_hours: int = 72  # How long stories stay indexed
+    near_dup_threshold: float = 0.5  # Estimated Jaccard similarity
+    near_dup_num_perm: int = 128
+    near_dup_bands: int = 32
+    near_dup_snapshot_path: str = "data/near_dup_index.npz"
     
     # Fallback images
     fallback_images: Dict[str, str] = field(default_factory=lambda: {
@@ -201,6 +260,46 @@ class Config:
             self.db_password = os.getenv("DB_PASSWORD")
         if os.getenv("DB_NAME"):
             self.db_name = os.getenv("DB_NAME")
+        if os.getenv("DB_POOL_MIN_SIZE"):
+            self.db_pool_min_size = int(os.getenv("DB_POOL_MIN_SIZE"))
+        if os.getenv("DB_POOL_MAX_SIZE"):
+            self.db_pool_max_size = int(os.getenv("DB_POOL_MAX_SIZE"))
+        if os.getenv("DB_POOL_TIMEOUT"):
+            self.db_pool_timeout = float(os.getenv("DB_POOL_TIMEOUT"))
+        if os.getenv("DB_HEALTH_CHECK_SECONDS"):
+            self.db_health_check_seconds = float(os.getenv("DB_HEALTH_CHECK_SECONDS"))
+        if os.getenv("DB_READ_ONLY_MODE") is not None:
+            self.db_read_only_mode = os.getenv("DB_READ_ONLY_MODE", "true").lower() in ("true", "1", "yes")
+        if os.getenv("DB_INSTRUMENTATION") is not None:
+            self.db_instrumentation = os.getenv("DB_INSTRUMENTATION", "false").lower() in ("true", "1", "yes")
+        if os.getenv("DB_SLOW_QUERY_MS"):
+            self.db_slow_query_ms = float(os.getenv("DB_SLOW_QUERY_MS"))
+
+        # Collector config from environment
+        if os.getenv("COLLECTOR_MAX_WORKERS"):
+            self.collector.max_workers = int(os.getenv("COLLECTOR_MAX_WORKERS"))
+        if os.getenv("COLLECTOR_MAX_PER_HOST"):
+            self.collector.max_per_host = int(os.getenv("COLLECTOR_MAX_PER_HOST"))
+        if os.getenv("COLLECTOR_CONDITIONAL_GET") is not None:
+            self.collector.conditional_get = os.getenv("COLLECTOR_CONDITIONAL_GET", "true").lower() in ("true", "1", "yes")
+        if os.getenv("ADAPTIVE_POLLING") is not None:
+            self.collector.adaptive_polling = os.getenv("ADAPTIVE_POLLING", "true").lower() in ("true", "1", "yes")
+        if os.getenv("MIN_POLL_SECONDS"):
+            self.collector.min_poll_seconds = int(os.getenv("MIN_POLL_SECONDS"))
+        if os.getenv("MAX_POLL_SECONDS"):
+            self.collector.max_poll_seconds = int(os.getenv("MAX_POLL_SECONDS"))
+
+        # Near-duplicate index config from environment
+        if os.getenv("NEAR_DUP_ENABLED") is not None:
+            self.near_dup_enabled = os.getenv("NEAR_DUP_ENABLED", "true").lower() in ("true", "1", "yes")
+        if os.getenv("NEAR_DUP_REJECT") is not None:
+            self.near_dup_reject = os.getenv("NEAR_DUP_REJECT").lower() in ("true", "1", "yes")
+        if os.getenv("NEAR_DUP_HORIZON_HOURS"):
+            self.near_dup_horizon_hours = int(os.getenv("NEAR_DUP_HORIZON_HOURS"))
+        if os.getenv("NEAR_DUP_THRESHOLD"):
+            self.near_dup_threshold = float(os.getenv("NEAR_DUP_THRESHOLD"))
+        if os.getenv("NEAR_DUP_SNAPSHOT_PATH") is not None:
+            self.near_dup_snapshot_path = os.getenv("NEAR_DUP_SNAPSHOT_PATH")
 
         # Live config from environment
         if os.getenv("FOOTBALL_API_KEY"):
@@ -217,6 +316,20 @@ class Config:
             self.web.port = int(os.getenv("WEB_PORT"))
         if os.getenv("WEB_BASE_URL"):
             self.web.base_url = os.getenv("WEB_BASE_URL")
+        if os.getenv("WEB_COUNT_CACHE_SECONDS"):
+            self.web.count_cache_seconds = int(os.getenv("WEB_COUNT_CACHE_SECONDS"))
+        if os.getenv("WEB_VIEW_FLUSH_SECONDS"):
+            self.web.view_flush_seconds = float(os.getenv("WEB_VIEW_FLUSH_SECONDS"))
+        if os.getenv("WEB_PAGE_CACHE_SECONDS"):
+            self.web.page_cache_seconds = int(os.getenv("WEB_PAGE_CACHE_SECONDS"))
+        if os.getenv("WEB_PAGE_CACHE_DIR") is not None:
+            self.web.page_cache_dir = os.getenv("WEB_PAGE_CACHE_DIR")
+        if os.getenv("WEB_SITEMAP_DIR") is not None:
+            self.web.sitemap_dir = os.getenv("WEB_SITEMAP_DIR")
+        if os.getenv("WEB_SESSION_CACHE_SECONDS"):
+            self.web.session_cache_seconds = int(os.getenv("WEB_SESSION_CACHE_SECONDS"))
+        if os.getenv("WEB_DEBUG_HEADERS"):
+            self.web.debug_headers = os.getenv("WEB_DEBUG_HEADERS").lower() in ("true", "1", "yes")
         if os.getenv("CLAUDE_API_KEY"):
             self.web.claude_api_key = os.getenv("CLAUDE_API_KEY")
         if os.getenv("CLAUDE_MODEL"):
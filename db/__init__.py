@@ -1,14 +1,24 @@
 """Database module for GoalFeed."""
-from .database import Database, get_database, init_db
-from .repo import Repository, get_repository, ArticleRecord, PostRecord, WebArticleRecord
+from .database import Database, ConnectionPool, PoolTimeoutError, RoundTripStats, get_database, init_db
+from .repo import Repository, get_repository, ArticleRecord, PostRecord, WebArticleRecord, WebArticleCard
+from .async_repo import AsyncRepository, get_async_repository
+from .instrumentation import QueryMetrics, fingerprint
 
 __all__ = [
     'Database',
+    'ConnectionPool',
+    'PoolTimeoutError',
+    'RoundTripStats',
+    'QueryMetrics',
+    'fingerprint',
     'get_database',
     'init_db',
     'Repository',
     'get_repository',
+    'AsyncRepository',
+    'get_async_repository',
     'ArticleRecord',
     'PostRecord',
-    'WebArticleRecord'
+    'WebArticleRecord',
+    'WebArticleCard'
 ]
@@ -0,0 +1,150 @@
+"""
+Async repository for the GoalFeed web portal.
+Runs the blocking Repository reads on a dedicated thread pool so FastAPI
+handlers can await them without blocking the event loop.
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .repo import Repository, WebArticleCard, get_repository
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRepository:
+    """
+    Awaitable wrapper around Repository for the web read paths.
+
+    Queries run on a thread pool sized like the database connection pool,
+    so concurrent requests use separate pooled connections instead of
+    queueing on the event loop.
+    """
+
+    def __init__(self, repo: Optional[Repository] = None, max_workers: Optional[int] = None):
+        self.repo = repo or get_repository()
+        if max_workers is None:
+            max_workers = self.repo.db.pool_max_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="goalfeed-db",
+        )
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the database thread pool.
+
+        Args:
+            func: Callable to run (usually a Repository method)
+            *args, **kwargs: Passed to func
+
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        # Carry the request context (round-trip counters) into the worker
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    # ── Web articles ──
+
+    async def get_web_articles_paginated(
+        self,
+        page: int = 1,
+        per_page: int = 12,
+        sport: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[WebArticleCard]:
+        """Get paginated web articles."""
+        return await self.run(
+            self.repo.get_web_articles_paginated, page=page, per_page=per_page, sport=sport, limit=limit
+        )
+
+    async def get_web_articles_keyset(
+        self,
+        limit: int = 12,
+        sport: Optional[str] = None,
+        after: Optional[tuple] = None,
+        before: Optional[tuple] = None
+    ) -> List[WebArticleCard]:
+        """Get a keyset page of web articles, newest first."""
+        return await self.run(self.repo.get_web_articles_keyset, limit=limit, sport=sport, after=after, before=before)
+
+    async def get_web_article_count_by_sport(self, sport: Optional[str] = None) -> int:
+        """Get total count of published web articles, optionally by sport."""
+        return await self.run(self.repo.get_web_article_count_by_sport, sport=sport)
+
+    async def get_web_articles_version(self) -> str:
+        """Get the version stamp of the web articles content."""
+        return await self.run(self.repo.get_web_articles_version)
+
+    async def get_sitemap_months(self) -> List[Dict]:
+        """Get published web article counts per creation month."""
+        return await self.run(self.repo.get_sitemap_months)
+
+    async def get_sitemap_articles(self, start: str, end: str, limit: int = 50000, offset: int = 0) -> List[Dict]:
+        """Get slug and dates of the web articles created in [start, end)."""
+        return await self.run(self.repo.get_sitemap_articles, start, end, limit=limit, offset=offset)
+
+    async def get_web_article_by_slug(self, slug: str) -> Optional[Dict]:
+        """Get a web article by slug."""
+        return await self.run(self.repo.get_web_article_by_slug, slug)
+
+    async def get_related_web_articles(self, sport: str, exclude_slug: str, limit: int = 4) -> List[WebArticleCard]:
+        """Get related web articles by sport, excluding current."""
+        return await self.run(self.repo.get_related_web_articles, sport=sport, exclude_slug=exclude_slug, limit=limit)
+
+    async def get_featured_web_articles(self, limit: int = 4) -> List[WebArticleCard]:
+        """Get featured web articles."""
+        return await self.run(self.repo.get_featured_web_articles, limit=limit)
+
+    async def get_latest_web_articles(self, limit: int = 12) -> List[WebArticleCard]:
+        """Get the latest web articles."""
+        return await self.run(self.repo.get_latest_web_articles, limit=limit)
+
+    # ── Comments ──
+
+    async def get_comments(self, web_article_id: int) -> List[Dict]:
+        """Get visible comments for a web article."""
+        return await self.run(self.repo.get_comments, web_article_id)
+
+    # ── Live ──
+
+    async def get_active_live_matches(self) -> List[Dict]:
+        """Get all active (non-finished) live matches."""
+        return await self.run(self.repo.get_active_live_matches)
+
+    async def get_active_live_matches_with_events(self) -> List[Dict]:
+        """Get active live matches with their events (two queries in total)."""
+        return await self.run(self.repo.get_active_live_matches_with_events)
+
+    async def get_live_version(self) -> str:
+        """Get the version stamp of the live data."""
+        return await self.run(self.repo.get_live_version)
+
+    async def get_match_events(self, match_id: str) -> List[Dict]:
+        """Get all events for a match."""
+        return await self.run(self.repo.get_match_events, match_id)
+
+    def close(self):
+        """Stop the thread pool (pending queries still finish)."""
+        self._executor.shutdown(wait=True)
+
+
+# Global async repository instance
+_async_repo_instance: Optional[AsyncRepository] = None
+
+
+def get_async_repository() -> AsyncRepository:
+    """Get or create the global AsyncRepository."""
+    global _async_repo_instance
+
+    if _async_repo_instance is None:
+        _async_repo_instance = AsyncRepository()
+
+    return _async_repo_instance
@@ -6,100 +6,422 @@ import pymysql
 import pymysql.cursors
 import os
 import logging
-from typing import Optional
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Callable, Optional, Tuple
 from contextlib import contextmanager
 
+from .instrumentation import InstrumentedCursor, QueryMetrics, install_report_hooks
+
 logger = logging.getLogger(__name__)
 
+# Round-trips per statement before read-only mode: ping + query + commit
+LEGACY_ROUND_TRIPS = 3
+
+# MySQL client errors meaning the server connection is gone
+CONNECTION_LOST_ERRORS = {2006, 2013, 2055}
+
+
+class RoundTripStats:
+    """Counters of statements and network round-trips made for them."""
+
+    __slots__ = ("queries", "round_trips", "saved")
+
+    def __init__(self):
+        self.queries = 0
+        self.round_trips = 0
+        self.saved = 0
+
+    def add(self, round_trips: int):
+        self.queries += 1
+        self.round_trips += round_trips
+        self.saved += max(0, LEGACY_ROUND_TRIPS - round_trips)
+
+    def as_dict(self) -> dict:
+        return {"queries": self.queries, "round_trips": self.round_trips, "saved": self.saved}
+
+
+# Stats of the request being served, set by the web middleware
+request_round_trips: ContextVar[Optional[RoundTripStats]] = ContextVar("request_round_trips", default=None)
+
+
+def _is_connection_lost(error: Exception) -> bool:
+    """True if a PyMySQL error means the connection must be reopened."""
+    if isinstance(error, pymysql.err.InterfaceError):
+        return True
+    return bool(error.args) and error.args[0] in CONNECTION_LOST_ERRORS
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of PyMySQL connections.
+    
+    Connections are opened on demand up to max_size and reused LIFO.
+    Instead of pinging before every query, a connection is pinged only
+    when it has been idle for health_check_interval seconds.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], pymysql.connections.Connection],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        health_check_interval: float = 30.0,
+    ):
+        self._factory = factory
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle = deque()  # (connection, last_used monotonic time)
+        self._size = 0  # Open connections, idle or checked out
+        self._cond = threading.Condition()
+        self._waits = 0
+        self._timeouts = 0
+
+    def fill(self):
+        """Open connections until min_size are available."""
+        while True:
+            with self._cond:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = self._factory()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                raise
+            self.release(conn)
+
+    def acquire(self) -> pymysql.connections.Connection:
+        """Check out a connection (see checkout)."""
+        return self.checkout()[0]
+
+    def checkout(self) -> Tuple[pymysql.connections.Connection, int]:
+        """
+        Check out a connection.
+        
+        Returns:
+            (connection, round-trips spent on its health check: 0 or 1)
+        
+        Raises:
+            PoolTimeoutError: If the pool is exhausted for longer than timeout
+        """
+        deadline = time.monotonic() + self.timeout
+        conn, last_used = None, None
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available after {self.timeout}s "
+                        f"(max_size={self.max_size})"
+                    )
+                self._waits += 1
+                self._cond.wait(remaining)
+
+        try:
+            if conn is None:
+                return self._factory(), 0
+            if not conn.open or time.monotonic() - last_used >= self.health_check_interval:
+                conn.ping(reconnect=True)
+                return conn, 1
+            return conn, 0
+        except Exception:
+            # Slot stays reserved for a fresh connection
+            self._close_quietly(conn)
+            try:
+                return self._factory(), 0
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+
+    def release(self, conn: pymysql.connections.Connection, discard: bool = False):
+        """
+        Return a connection to the pool.
+        
+        Args:
+            conn: Connection obtained from acquire()
+            discard: Close it instead (e.g. after a connection error)
+        """
+        with self._cond:
+            if discard or not conn.open:
+                self._size -= 1
+                self._close_quietly(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._cond:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._size -= 1
+                self._close_quietly(conn)
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Pool usage counters."""
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+            }
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            if conn is not None and conn.open:
+                conn.close()
+        except Exception:
+            pass
+
 
 class Database:
-    """MySQL/MariaDB database connection manager."""
+    """
+    MySQL/MariaDB database access through a thread-safe connection pool.
+    
+    In read-only mode (the default) connections run in autocommit, so
+    fetchone/fetchall send just the query: no ping (connections are only
+    health-checked after idling) and no commit. Reads that hit a dropped
+    connection are retried once on a fresh one. get_cursor still wraps its
+    statements in an explicit transaction.
+    """
 
-    def __init__(self, host: str, user: str, password: str, database: str, charset: str = "utf8mb4"):
+    def __init__(
+        self,
+        host: str,
+        user: str,
+        password: str,
+        database: str,
+        charset: str = "utf8mb4",
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_timeout: float = 10.0,
+        health_check_interval: float = 30.0,
+        read_only_mode: bool = True,
+        metrics: Optional[QueryMetrics] = None,
+    ):
         self.host = host
         self.user = user
         self.password = password
         self.database = database
         self.charset = charset
-        self._connection: Optional[pymysql.connections.Connection] = None
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_timeout = pool_timeout
+        self.health_check_interval = health_check_interval
+        self.read_only_mode = read_only_mode
+        self.metrics = metrics
+        self.stats = RoundTripStats()
+        self._stats_lock = threading.Lock()
+        self._pool: Optional[ConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
 
     def connect(self) -> pymysql.connections.Connection:
-        """Get or create a database connection."""
-        if self._connection is None or not self._connection.open:
-            self._connection = pymysql.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                charset=self.charset,
-                cursorclass=pymysql.cursors.DictCursor,
-                autocommit=False,
-            )
-            logger.info(f"Connected to MySQL database: {self.database}@{self.host}")
-        return self._connection
-
-    def _ping(self):
-        """Reconnect if the connection was lost."""
+        """Open a new database connection."""
+        conn = pymysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            charset=self.charset,
+            cursorclass=pymysql.cursors.DictCursor,
+            autocommit=self.read_only_mode,
+        )
+        logger.debug(f"Connected to MySQL database: {self.database}@{self.host}")
+        return conn
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Connection pool, created on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    pool = ConnectionPool(
+                        self.connect,
+                        min_size=self.pool_min_size,
+                        max_size=self.pool_max_size,
+                        timeout=self.pool_timeout,
+                        health_check_interval=self.health_check_interval,
+                    )
+                    pool.fill()
+                    logger.info(
+                        f"Connected to MySQL database: {self.database}@{self.host} "
+                        f"(pool {pool.min_size}-{pool.max_size})"
+                    )
+                    self._pool = pool
+        return self._pool
+
+    def _record(self, round_trips: int):
+        """Account one statement in the global and per-request counters."""
+        with self._stats_lock:
+            self.stats.add(round_trips)
+        current = request_round_trips.get()
+        if current is not None:
+            current.add(round_trips)
+
+    def _cursor(self, conn):
+        """Open a cursor, timed per statement when instrumentation is on."""
+        cursor = conn.cursor()
+        if self.metrics is not None:
+            return InstrumentedCursor(cursor, self.metrics)
+        return cursor
+
+    def query_report(self, top: int = 20) -> str:
+        """
+        Report of the hottest SQL fingerprints.
+        
+        Args:
+            top: Number of fingerprints to include
+            
+        Returns:
+            Report text (empty if instrumentation is disabled)
+        """
+        if self.metrics is None:
+            return ""
+        return self.metrics.report(top)
+
+    def round_trip_stats(self) -> dict:
+        """Statements, round-trips and round-trips saved since startup."""
+        with self._stats_lock:
+            return self.stats.as_dict()
+
+    def _in_transaction(self) -> bool:
+        return getattr(self._local, "conn", None) is not None
+
+    @contextmanager
+    def connection(self):
+        """
+        Check out a pooled connection for the current thread.
+        
+        Nested use on the same thread (e.g. a query inside get_cursor)
+        reuses the connection already held, so it sees the same transaction.
+        Yields (connection, round-trips spent checking it out).
+        """
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held, 0
+            return
+
+        conn, checkout_trips = self.pool.checkout()
+        self._local.conn = conn
+        broken = False
         try:
-            self.connect().ping(reconnect=True)
+            yield conn, checkout_trips
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            broken = True
+            raise
         except Exception:
-            self._connection = None
-            self.connect()
+            # Never hand out a connection with a half-done transaction
+            try:
+                conn.rollback()
+            except Exception:
+                broken = True
+            raise
+        finally:
+            self._local.conn = None
+            self.pool.release(conn, discard=broken)
 
     @contextmanager
     def get_cursor(self):
         """Context manager for database cursor."""
-        self._ping()
-        conn = self.connect()
-        cursor = conn.cursor()
-        try:
-            yield cursor
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            cursor.close()
+        with self.connection() as (conn, _):
+            if conn.get_autocommit():
+                conn.begin()
+            cursor = self._cursor(conn)
+            try:
+                yield cursor
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                cursor.close()
+
+    def _write(self, query: str, params, many: bool = False):
+        """Run a statement that changes data and commit it."""
+        nested = self._in_transaction()
+        with self.connection() as (conn, round_trips):
+            cursor = self._cursor(conn)
+            if many:
+                cursor.executemany(query, params)
+            else:
+                cursor.execute(query, params)
+            round_trips += 1
+            # Autocommit connections commit on their own; inside get_cursor
+            # the surrounding transaction commits
+            if not conn.get_autocommit() and not nested:
+                conn.commit()
+                round_trips += 1
+            self._record(round_trips)
+            return cursor
+
+    def _read(self, query: str, params: tuple, one: bool):
+        """Run a SELECT, reconnecting once if the connection was dropped."""
+        nested = self._in_transaction()
+        retry = self.read_only_mode and not nested
+        while True:
+            try:
+                with self.connection() as (conn, round_trips):
+                    cursor = self._cursor(conn)
+                    cursor.execute(query, params)
+                    round_trips += 1
+                    if not conn.get_autocommit() and not nested:
+                        conn.commit()
+                        round_trips += 1
+                    self._record(round_trips)
+                    return cursor.fetchone() if one else cursor.fetchall()
+            except (pymysql.err.OperationalError, pymysql.err.InterfaceError) as e:
+                if not retry or not _is_connection_lost(e):
+                    raise
+                retry = False
+                logger.warning(f"Database connection lost, retrying read: {e}")
 
     def execute(self, query: str, params: tuple = ()):
         """Execute a query and return the cursor."""
-        self._ping()
-        conn = self.connect()
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        conn.commit()
-        return cursor
+        return self._write(query, params)
 
     def executemany(self, query: str, params_list: list):
         """Execute a query with multiple parameter sets."""
-        self._ping()
-        conn = self.connect()
-        cursor = conn.cursor()
-        cursor.executemany(query, params_list)
-        conn.commit()
-        return cursor
+        return self._write(query, params_list, many=True)
 
     def fetchone(self, query: str, params: tuple = ()) -> Optional[dict]:
         """Fetch a single row as dict."""
-        self._ping()
-        conn = self.connect()
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        conn.commit()
-        return cursor.fetchone()
+        return self._read(query, params, one=True)
 
     def fetchall(self, query: str, params: tuple = ()) -> list[dict]:
         """Fetch all rows as list of dicts."""
-        self._ping()
-        conn = self.connect()
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        conn.commit()
-        return cursor.fetchall()
+        return self._read(query, params, one=False)
 
     def init_schema(self, schema_path: Optional[str] = None):
-        """Initialize database schema from SQL file."""
+        """Initialize database schema from SQL file, then apply pending migrations."""
         if schema_path is None:
             schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
 
@@ -109,36 +431,39 @@ class Database:
         with open(schema_path, 'r', encoding='utf-8') as f:
             schema_sql = f.read()
 
-        self._ping()
-        conn = self.connect()
-        cursor = conn.cursor()
-        for statement in schema_sql.split(';'):
-            statement = statement.strip()
-            if statement:
-                cursor.execute(statement)
-        conn.commit()
-
-        # Also load web schema if it exists
-        web_schema_path = os.path.join(os.path.dirname(__file__), 'schema_web.sql')
-        if os.path.exists(web_schema_path):
-            with open(web_schema_path, 'r', encoding='utf-8') as f:
-                web_schema_sql = f.read()
-            for statement in web_schema_sql.split(';'):
+        with self.connection() as (conn, _):
+            cursor = self._cursor(conn)
+            for statement in schema_sql.split(';'):
                 statement = statement.strip()
                 if statement:
                     cursor.execute(statement)
             conn.commit()
-            logger.info("Web schema initialized")
 
-        cursor.close()
+            # Also load web schema if it exists
+            web_schema_path = os.path.join(os.path.dirname(__file__), 'schema_web.sql')
+            if os.path.exists(web_schema_path):
+                with open(web_schema_path, 'r', encoding='utf-8') as f:
+                    web_schema_sql = f.read()
+                for statement in web_schema_sql.split(';'):
+                    statement = statement.strip()
+                    if statement:
+                        cursor.execute(statement)
+                conn.commit()
+                logger.info("Web schema initialized")
+
+            cursor.close()
         logger.info("Database schema initialized")
 
+        # Incremental changes (indexes, new columns) live in db/migrations
+        from .migrate import Migrator
+        Migrator(self).migrate()
+
     def close(self):
-        """Close the database connection."""
-        if self._connection and self._connection.open:
-            self._connection.close()
-            self._connection = None
-            logger.info("Database connection closed")
+        """Close the pooled database connections."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+            logger.info("Database connection pool closed")
 
 
 # Global database instance
@@ -152,12 +477,24 @@ def get_database() -> Database:
     if _db_instance is None:
         from config import get_config
         config = get_config()
+        
+        metrics = None
+        if config.db_instrumentation:
+            metrics = QueryMetrics(slow_query_ms=config.db_slow_query_ms)
+            install_report_hooks(metrics)
+        
         _db_instance = Database(
             host=config.db_host,
             user=config.db_user,
             password=config.db_password,
             database=config.db_name,
             charset=config.db_charset,
+            pool_min_size=config.db_pool_min_size,
+            pool_max_size=config.db_pool_max_size,
+            pool_timeout=config.db_pool_timeout,
+            health_check_interval=config.db_health_check_seconds,
+            read_only_mode=config.db_read_only_mode,
+            metrics=metrics,
         )
 
     return _db_instance
@@ -0,0 +1,252 @@
+"""
+Query instrumentation for GoalFeed.
+Per-statement latency histograms, row and call counts keyed by a
+normalized SQL fingerprint, plus a slow-query log with the call site.
+"""
+import atexit
+import logging
+import os
+import re
+import signal
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_DB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%s|%\(\w+\)s")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST_RE = re.compile(r"(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Normalize a SQL statement so that calls differing only in values match.
+
+    Literals and placeholders become ?, IN lists and multi-row VALUES
+    collapse to a single group, whitespace is squeezed.
+
+    Args:
+        sql: SQL statement (with or without bound values)
+
+    Returns:
+        Fingerprint string
+    """
+    text = _STRING_RE.sub("?", sql)
+    text = _PLACEHOLDER_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _SPACE_RE.sub(" ", text).strip()
+    text = _VALUES_LIST_RE.sub(r"\1, ...", text)
+    text = _IN_LIST_RE.sub("(?, ...)", text)
+    return text
+
+
+def call_site() -> str:
+    """
+    Describe where a query came from: the first frame outside the database
+    layer, preceded by the repository method if there is one.
+    """
+    repo_frame = None
+    for frame in reversed(traceback.extract_stack()[:-1]):
+        filename = os.path.abspath(frame.filename)
+        if filename.startswith(_DB_DIR):
+            if os.path.basename(filename) == "repo.py" and repo_frame is None:
+                repo_frame = frame
+            continue
+        if "contextlib" in filename or "concurrent" in filename or "asyncio" in filename:
+            continue
+        site = f"{os.path.relpath(frame.filename)}:{frame.lineno} in {frame.name}"
+        if repo_frame is not None:
+            site = f"Repository.{repo_frame.name} <- {site}"
+        return site
+    if repo_frame is not None:
+        return f"Repository.{repo_frame.name}"
+    return "unknown"
+
+
+class QueryStat:
+    """Aggregated timings of one SQL fingerprint."""
+
+    __slots__ = ("calls", "rows", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, elapsed_ms: float, rows: int):
+        self.calls += 1
+        self.rows += max(0, rows)
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (ms) of the histogram bucket holding the percentile."""
+        target = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                return self.max_ms
+        return self.max_ms
+
+
+class QueryMetrics:
+    """Thread-safe collector of per-fingerprint query statistics."""
+
+    def __init__(self, slow_query_ms: float = 200.0):
+        self.slow_query_ms = slow_query_ms
+        self._stats: Dict[str, QueryStat] = {}
+        self._lock = threading.Lock()
+        self._started = time.time()
+
+    def record(self, sql: str, elapsed: float, rows: int = 0):
+        """
+        Record one executed statement.
+
+        Args:
+            sql: Statement text (as passed to cursor.execute)
+            elapsed: Duration in seconds
+            rows: Rows returned or affected
+        """
+        elapsed_ms = elapsed * 1000
+        key = fingerprint(sql)
+
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                stat = self._stats[key] = QueryStat()
+            stat.add(elapsed_ms, rows)
+
+        if self.slow_query_ms and elapsed_ms >= self.slow_query_ms:
+            logger.warning(
+                f"Slow query ({elapsed_ms:.0f} ms, {rows} rows) at {call_site()}: {key[:300]}"
+            )
+
+    def snapshot(self) -> List[dict]:
+        """Per-fingerprint statistics, most total time first."""
+        with self._lock:
+            items = list(self._stats.items())
+            rows = [
+                {
+                    "fingerprint": key,
+                    "calls": stat.calls,
+                    "rows": stat.rows,
+                    "total_ms": round(stat.total_ms, 2),
+                    "avg_ms": round(stat.total_ms / stat.calls, 2),
+                    "p50_ms": stat.percentile(0.5),
+                    "p95_ms": stat.percentile(0.95),
+                    "max_ms": round(stat.max_ms, 2),
+                    "histogram": list(stat.buckets),
+                }
+                for key, stat in items
+            ]
+        rows.sort(key=lambda r: r["total_ms"], reverse=True)
+        return rows
+
+    def report(self, top: int = 20) -> str:
+        """
+        Human-readable report of the hottest queries.
+
+        Args:
+            top: Number of fingerprints to include
+
+        Returns:
+            Multi-line report
+        """
+        rows = self.snapshot()
+        total_ms = sum(r["total_ms"] for r in rows)
+        total_calls = sum(r["calls"] for r in rows)
+        uptime = time.time() - self._started
+
+        lines = [
+            f"Query report: {total_calls} statements, {total_ms / 1000:.2f}s DB time, "
+            f"{len(rows)} fingerprints, {uptime:.0f}s uptime",
+            f"{'total ms':>10} {'share':>6} {'calls':>7} {'avg':>8} {'p50<=':>7} {'p95<=':>7} {'max':>8} {'rows':>8}  query",
+        ]
+        for r in rows[:top]:
+            share = r["total_ms"] / total_ms * 100 if total_ms else 0
+            lines.append(
+                f"{r['total_ms']:>10.1f} {share:>5.1f}% {r['calls']:>7} {r['avg_ms']:>8.2f} "
+                f"{r['p50_ms']:>7.0f} {r['p95_ms']:>7.0f} {r['max_ms']:>8.1f} {r['rows']:>8}  "
+                f"{r['fingerprint'][:160]}"
+            )
+        return "\n".join(lines)
+
+    def log_report(self, top: int = 20):
+        """Write the report to the log."""
+        if self._stats:
+            logger.info(self.report(top))
+
+    def reset(self):
+        """Drop all collected statistics."""
+        with self._lock:
+            self._stats.clear()
+            self._started = time.time()
+
+
+def install_report_hooks(metrics: QueryMetrics):
+    """
+    Log the report at interpreter exit and whenever SIGUSR1 is received.
+
+    The signal handler is only installed from the main thread on platforms
+    that have SIGUSR1. It hands the report to a short-lived thread: the
+    handler runs on the main thread, possibly while record() holds the
+    metrics lock, so taking the lock there would deadlock.
+    """
+    atexit.register(metrics.log_report)
+
+    def on_signal(signum, frame):
+        threading.Thread(
+            target=metrics.log_report, name="goalfeed-query-report", daemon=True
+        ).start()
+
+    if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+        try:
+            signal.signal(signal.SIGUSR1, on_signal)
+        except (ValueError, OSError) as e:
+            logger.debug(f"Could not install SIGUSR1 query report handler: {e}")
+
+
+class InstrumentedCursor:
+    """Cursor proxy that records every execute/executemany."""
+
+    def __init__(self, cursor, metrics: QueryMetrics):
+        self._cursor = cursor
+        self._metrics = metrics
+
+    def execute(self, query, args=None):
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(query, args)
+        finally:
+            self._metrics.record(query, time.perf_counter() - start, self._cursor.rowcount)
+
+    def executemany(self, query, args):
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(query, args)
+        finally:
+            self._metrics.record(query, time.perf_counter() - start, self._cursor.rowcount)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
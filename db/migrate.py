@@ -0,0 +1,235 @@
+"""
+Versioned schema migrations for GoalFeed.
+Applies the numbered SQL files in db/migrations/ in order and records each
+one in the schema_migrations table, so every migration runs exactly once.
+
+Usage:
+    python -m db.migrate            # apply pending migrations
+    python -m db.migrate status     # list applied / pending migrations
+"""
+import hashlib
+import logging
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pymysql
+
+from .database import Database, get_database
+
+logger = logging.getLogger(__name__)
+
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+_FILENAME_RE = re.compile(r'^(\d+)_([\w-]+)\.sql$')
+
+# "Already there" errors, raised when a migration was applied by hand before
+# the runner existed: table exists, duplicate column, duplicate key name,
+# can't drop (index/column does not exist)
+IGNORABLE_ERRORS = {1050, 1060, 1061, 1091}
+
+# Named lock (GET_LOCK) held while migrating, so web workers that boot
+# together do not apply the same migration twice
+MIGRATION_LOCK = "goalfeed_migrate"
+MIGRATION_LOCK_TIMEOUT = 60
+
+# Duplicate entry: another process recorded the migration first
+DUPLICATE_ENTRY = 1062
+
+SCHEMA_MIGRATIONS_DDL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    checksum CHAR(64) NOT NULL,
+    applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+
+@dataclass
+class Migration:
+    """A numbered SQL migration file."""
+    version: int
+    name: str
+    path: str
+
+    def read(self) -> str:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.read().encode('utf-8')).hexdigest()
+
+    def statements(self) -> List[str]:
+        """SQL statements of the file, without comment-only chunks."""
+        statements = []
+        for chunk in self.read().split(';'):
+            lines = [
+                line for line in chunk.splitlines()
+                if line.strip() and not line.strip().startswith('--')
+            ]
+            if lines:
+                statements.append("\n".join(lines))
+        return statements
+
+
+def discover_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """
+    List migration files (NNN_name.sql) ordered by version.
+
+    Raises:
+        ValueError: If two files share a version number
+    """
+    migrations: Dict[int, Migration] = {}
+    if not os.path.isdir(directory):
+        return []
+
+    for filename in os.listdir(directory):
+        match = _FILENAME_RE.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(f"Duplicate migration version {version}: {filename}")
+        migrations[version] = Migration(version, match.group(2), os.path.join(directory, filename))
+
+    return [migrations[v] for v in sorted(migrations)]
+
+
+class Migrator:
+    """Applies pending migrations and records them in schema_migrations."""
+
+    def __init__(self, db: Optional[Database] = None, directory: str = MIGRATIONS_DIR):
+        """
+        Initialize migrator.
+
+        Args:
+            db: Database instance (uses global if not provided)
+            directory: Folder holding the NNN_name.sql files
+        """
+        self.db = db or get_database()
+        self.directory = directory
+
+    def ensure_table(self):
+        """Create the schema_migrations table if needed."""
+        self.db.execute(SCHEMA_MIGRATIONS_DDL)
+
+    def applied(self) -> Dict[int, Dict]:
+        """Applied migrations keyed by version."""
+        self.ensure_table()
+        rows = self.db.fetchall("SELECT version, name, checksum, applied_at FROM schema_migrations")
+        return {row['version']: dict(row) for row in rows}
+
+    def pending(self) -> List[Migration]:
+        """Migrations not applied yet, in order."""
+        applied = self.applied()
+        return [m for m in discover_migrations(self.directory) if m.version not in applied]
+
+    def apply(self, migration: Migration):
+        """
+        Run one migration and record it.
+
+        DDL commits implicitly in MySQL, so a failing migration can leave
+        earlier statements applied; it is not recorded and the next run
+        retries it, skipping the "already there" errors.
+        """
+        logger.info(f"Applying migration {migration.version:03d}_{migration.name}")
+
+        with self.db.connection() as (conn, _):
+            cursor = self.db._cursor(conn)
+            try:
+                for statement in migration.statements():
+                    try:
+                        cursor.execute(statement)
+                    except pymysql.err.MySQLError as e:
+                        code = e.args[0] if e.args else None
+                        if code not in IGNORABLE_ERRORS:
+                            raise
+                        logger.info(f"  skipped (already applied): {e.args[1] if len(e.args) > 1 else e}")
+                try:
+                    cursor.execute(
+                        "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s)",
+                        (migration.version, migration.name, migration.checksum)
+                    )
+                except pymysql.err.IntegrityError as e:
+                    if not e.args or e.args[0] != DUPLICATE_ENTRY:
+                        raise
+                    logger.info("  already recorded by another process")
+                conn.commit()
+            finally:
+                cursor.close()
+
+    def migrate(self) -> List[Migration]:
+        """
+        Apply all pending migrations in order.
+
+        Runs under the MIGRATION_LOCK named lock; the applied versions are
+        read after taking it, so a process that waited for another one
+        finds its migrations already recorded.
+
+        Returns:
+            Migrations applied by this call
+
+        Raises:
+            RuntimeError: If the lock is not obtained within MIGRATION_LOCK_TIMEOUT
+        """
+        # GET_LOCK belongs to a connection: keep one checked out, the
+        # queries below reuse it (nested use on the same thread)
+        with self.db.connection():
+            row = self.db.fetchone(
+                "SELECT GET_LOCK(%s, %s) AS locked", (MIGRATION_LOCK, MIGRATION_LOCK_TIMEOUT)
+            )
+            if not row or row['locked'] != 1:
+                raise RuntimeError(f"Timed out waiting for the {MIGRATION_LOCK} lock")
+            try:
+                return self._migrate_locked()
+            finally:
+                self.db.fetchone("SELECT RELEASE_LOCK(%s) AS released", (MIGRATION_LOCK,))
+
+    def _migrate_locked(self) -> List[Migration]:
+        applied = self.applied()
+        done = []
+
+        for migration in discover_migrations(self.directory):
+            record = applied.get(migration.version)
+            if record is None:
+                self.apply(migration)
+                done.append(migration)
+            elif record['checksum'] != migration.checksum:
+                logger.warning(
+                    f"Migration {migration.version:03d}_{migration.name} changed after being applied"
+                )
+
+        if done:
+            logger.info(f"Applied {len(done)} migration(s)")
+        return done
+
+    def status(self) -> List[str]:
+        """One line per known migration: version, name, applied time or 'pending'."""
+        applied = self.applied()
+        lines = []
+        for migration in discover_migrations(self.directory):
+            record = applied.get(migration.version)
+            state = f"applied {record['applied_at']}" if record else "pending"
+            lines.append(f"{migration.version:03d}  {migration.name:<32} {state}")
+        return lines
+
+
+def migrate(db: Optional[Database] = None) -> List[Migration]:
+    """Apply pending migrations on the given (or global) database."""
+    return Migrator(db).migrate()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    migrator = Migrator()
+    if len(sys.argv) > 1 and sys.argv[1] == "status":
+        print("\n".join(migrator.status()) or "No migrations found")
+    else:
+        applied = migrator.migrate()
+        print(f"Applied {len(applied)} migration(s)")
@@ -1,5 +1,5 @@
 -- GoalFeed: League & Team tagging migration
--- Run once before deploy.
+-- Applied by db/migrate.py (recorded in schema_migrations).
 
 -- New table for article ↔ team associations
 CREATE TABLE IF NOT EXISTS article_teams (
@@ -0,0 +1,14 @@
+-- GoalFeed: RSS source polling state migration
+-- Applied by db/migrate.py (recorded in schema_migrations).
+
+-- HTTP validators for conditional GET (If-None-Match / If-Modified-Since)
+ALTER TABLE sources
+    ADD COLUMN IF NOT EXISTS etag VARCHAR(512) NULL AFTER last_fetched_at,
+    ADD COLUMN IF NOT EXISTS last_modified VARCHAR(64) NULL AFTER etag;
+
+-- Adaptive per-source polling state
+ALTER TABLE sources
+    ADD COLUMN IF NOT EXISTS poll_interval_seconds INT NULL AFTER last_modified,
+    ADD COLUMN IF NOT EXISTS next_poll_at DATETIME NULL AFTER poll_interval_seconds,
+    ADD COLUMN IF NOT EXISTS last_entry_at DATETIME NULL AFTER next_poll_at,
+    ADD COLUMN IF NOT EXISTS unchanged_streak INT DEFAULT 0 AFTER last_entry_at;
@@ -0,0 +1,31 @@
+-- GoalFeed: Composite indexes for the hot web and pipeline queries
+-- Applied by db/migrate.py (recorded in schema_migrations).
+-- Verify the plans with: python benchmarks/explain_indexes.py
+
+-- Listings: home/latest (is_published, ORDER BY created_at, id),
+-- category/related and counts per sport, featured carousel
+ALTER TABLE web_articles
+    ADD INDEX idx_wa_published_created (is_published, created_at, id),
+    ADD INDEX idx_wa_published_sport_created (is_published, sport, created_at, id),
+    ADD INDEX idx_wa_published_featured_created (is_published, is_featured, created_at, id);
+
+-- Leftmost prefix of idx_wa_published_created
+ALTER TABLE web_articles DROP INDEX idx_web_articles_is_published;
+
+-- Comments of an article in display order
+ALTER TABLE web_comments
+    ADD INDEX idx_web_comments_article_created (web_article_id, is_visible, created_at);
+
+-- Pipeline: post candidates (flags + ORDER BY score, created_at),
+-- digest candidates per sport, recent articles per sport
+ALTER TABLE articles
+    ADD INDEX idx_articles_pending_score (is_posted, is_duplicate, is_digested, score, created_at),
+    ADD INDEX idx_articles_sport_pending (sport, is_posted, is_duplicate, is_digested, score),
+    ADD INDEX idx_articles_sport_created (sport, created_at);
+
+-- Leftmost prefix of idx_articles_pending_score
+ALTER TABLE articles DROP INDEX idx_articles_is_posted;
+
+-- Last post time per sport
+ALTER TABLE posts
+    ADD INDEX idx_posts_sport_posted (sport, posted_at);
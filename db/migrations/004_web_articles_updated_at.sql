@@ -0,0 +1,6 @@
+-- GoalFeed: Index for the web articles version stamp (ETags)
+-- Applied by db/migrate.py (recorded in schema_migrations).
+
+-- MAX(updated_at) FROM web_articles is read on every conditional request
+ALTER TABLE web_articles
+    ADD INDEX idx_wa_updated_at (updated_at);
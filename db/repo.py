@@ -3,8 +3,9 @@ Database repository functions for GoalFeed.
 High-level database operations for articles, posts, sources, etc.
 """
 import logging
+import unicodedata
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Set
 from dataclasses import dataclass, asdict
 import json
 
@@ -13,6 +14,37 @@ from utils.timeutils import utc_now, get_start_of_day, datetime_to_iso
 
 logger = logging.getLogger(__name__)
 
+# Max values bound into a single IN (...) clause
+IN_CHUNK_SIZE = 500
+
+# Max rows per multi-row INSERT statement
+BULK_INSERT_ROWS = 200
+
+# Collation of the articles table (db/schema.sql)
+ARTICLES_COLLATION = "utf8mb4_unicode_ci"
+
+# Columns written by article upserts, in VALUES order
+ARTICLE_INSERT_COLUMNS = (
+    "id", "source_id", "title", "normalized_title", "link", "canonical_url",
+    "summary", "published_at", "sport", "category", "status", "score",
+    "content_hash", "image_url", "source_name", "source_domain",
+    "is_duplicate", "is_posted", "is_digested", "created_at", "updated_at",
+)
+
+# Columns refreshed when the article already exists (same as upsert_article)
+ARTICLE_UPDATE_COLUMNS = (
+    "title", "normalized_title", "summary", "sport", "category",
+    "status", "score", "image_url", "updated_at",
+)
+
+# Columns read by listing queries: what article cards, the carousel and
+# the keyset cursor use (never the article bodies)
+WEB_ARTICLE_CARD_COLUMNS = (
+    "id", "slug", "headline", "subtitle", "sport", "status",
+    "image_url", "image_filename", "source_name", "created_at",
+)
+WEB_ARTICLE_CARD_SELECT = ", ".join(WEB_ARTICLE_CARD_COLUMNS)
+
 
 @dataclass
 class ArticleRecord:
@@ -70,6 +102,40 @@ class WebArticleRecord:
     updated_at: Optional[str] = None
 
 
+class WebArticleCard:
+    """
+    Listing view of a web article, read with WEB_ARTICLE_CARD_COLUMNS.
+
+    Uses __slots__ to stay small; supports both attribute and item access
+    (article.slug / article["slug"]) so templates and helpers written for
+    row dicts keep working.
+    """
+    __slots__ = WEB_ARTICLE_CARD_COLUMNS
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "WebArticleCard":
+        return cls(**row)
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"WebArticleCard(id={self.id!r}, slug={self.slug!r})"
+
+
 @dataclass
 class PostRecord:
     """Post data structure for database operations."""
@@ -153,13 +219,68 @@ class Repository:
             (datetime_to_iso(utc_now()), source_id)
         )
 
-    def update_source_fetched(self, source_id: int):
-        """Update the last_fetched_at timestamp for a source."""
+    def update_source_fetched(
+        self,
+        source_id: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """
+        Update the last_fetched_at timestamp and HTTP validators for a source.
+        
+        Args:
+            source_id: Source ID
+            etag: ETag header from the last successful response
+            last_modified: Last-Modified header from the last successful response
+        """
         self.db.execute(
-            "UPDATE sources SET last_fetched_at = %s WHERE id = %s",
-            (datetime_to_iso(utc_now()), source_id)
+            """UPDATE sources
+               SET last_fetched_at = %s, etag = %s, last_modified = %s
+               WHERE id = %s""",
+            (datetime_to_iso(utc_now()), etag, last_modified, source_id)
         )
     
+    def update_source_poll_state(
+        self,
+        source_id: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        poll_interval_seconds: int,
+        next_poll_at: str,
+        last_entry_at: Optional[str],
+        unchanged_streak: int,
+        fetched: bool = True
+    ):
+        """
+        Update the adaptive polling state and HTTP validators for a source.
+        
+        Args:
+            source_id: Source ID
+            etag: ETag to send on the next poll
+            last_modified: Last-Modified to send on the next poll
+            poll_interval_seconds: Current polling interval
+            next_poll_at: When the source is next due
+            last_entry_at: Publication time of the newest entry seen
+            unchanged_streak: Consecutive polls without new entries
+            fetched: Whether the poll succeeded (updates last_fetched_at)
+        """
+        query = """UPDATE sources
+                   SET etag = %s, last_modified = %s, poll_interval_seconds = %s,
+                       next_poll_at = %s, last_entry_at = %s, unchanged_streak = %s"""
+        params = [
+            etag, last_modified, poll_interval_seconds,
+            next_poll_at, last_entry_at, unchanged_streak
+        ]
+        
+        if fetched:
+            query += ", last_fetched_at = %s"
+            params.append(datetime_to_iso(utc_now()))
+        
+        query += " WHERE id = %s"
+        params.append(source_id)
+        
+        self.db.execute(query, tuple(params))
+    
     def seed_sources(self, sources: List[Dict]):
         """
         Seed multiple sources into the database.
@@ -234,6 +355,111 @@ class Repository:
             )
             return cursor.lastrowid
     
+    def upsert_articles(self, articles: List[ArticleRecord]) -> List[int]:
+        """
+        Insert or update many articles in one transaction.
+        
+        Existing rows are resolved by canonical_url with IN (...) lookups and
+        written together with the new ones through multi-row
+        INSERT ... ON DUPLICATE KEY UPDATE on the primary key, so a cycle
+        costs a handful of round-trips and a single commit.
+        
+        Args:
+            articles: ArticleRecords to save
+            
+        Returns:
+            Article IDs, in the same order as articles
+        """
+        if not articles:
+            return []
+        
+        now = datetime_to_iso(utc_now())
+        placeholders = "(" + ", ".join(["%s"] * len(ARTICLE_INSERT_COLUMNS)) + ")"
+        # VALUES(col) rather than the MySQL 8 row alias: the target is
+        # MariaDB (see the schema), which has no "AS new" form
+        update_clause = ", ".join(f"{col} = VALUES({col})" for col in ARTICLE_UPDATE_COLUMNS)
+        urls = [a.canonical_url for a in articles]
+        
+        with self.db.get_cursor() as cursor:
+            ids = self._ids_by_canonical_url(cursor, urls)
+            pending = list(range(len(articles)))
+            first_round = True
+            
+            while pending:
+                if not first_round:
+                    # Later copies of a URL update the row written by the first
+                    missing = [p for p in pending if ids[p] is None]
+                    for position, article_id in zip(
+                        missing, self._ids_by_canonical_url(cursor, [urls[p] for p in missing])
+                    ):
+                        ids[position] = article_id
+                first_round = False
+                
+                # A URL repeated in the batch is written once per round
+                batch, later, seen = [], [], set()
+                for position in pending:
+                    key = _collation_key(urls[position])
+                    (later if key in seen else batch).append(position)
+                    seen.add(key)
+                
+                rows = []
+                for position in batch:
+                    article = articles[position]
+                    rows.append((
+                        ids[position], article.source_id,
+                        article.title, article.normalized_title,
+                        article.link, article.canonical_url, article.summary,
+                        article.published_at, article.sport, article.category,
+                        article.status, article.score, article.content_hash,
+                        article.image_url, article.source_name, article.source_domain,
+                        int(article.is_duplicate), int(article.is_posted),
+                        int(article.is_digested), now, now
+                    ))
+                
+                for start in range(0, len(rows), BULK_INSERT_ROWS):
+                    chunk = rows[start:start + BULK_INSERT_ROWS]
+                    cursor.execute(
+                        f"""INSERT INTO articles ({", ".join(ARTICLE_INSERT_COLUMNS)})
+                            VALUES {", ".join([placeholders] * len(chunk))}
+                            ON DUPLICATE KEY UPDATE {update_clause}""",
+                        tuple(value for row in chunk for value in row)
+                    )
+                
+                new = [p for p in batch if ids[p] is None]
+                for position, article_id in zip(
+                    new, self._ids_by_canonical_url(cursor, [urls[p] for p in new])
+                ):
+                    ids[position] = article_id
+                pending = later
+        
+        return ids
+    
+    def _ids_by_canonical_url(self, cursor, urls: List[str]) -> List[Optional[int]]:
+        """
+        Article ID (lowest wins) for each canonical URL, in the same order.
+        
+        The URLs are sent with their positions and joined in SQL, so matching
+        follows the column collation (case and accent folding) and every
+        result maps back to the exact value passed in.
+        """
+        ids: List[Optional[int]] = [None] * len(urls)
+        positions = [i for i, url in enumerate(urls) if url]
+        
+        for start in range(0, len(positions), IN_CHUNK_SIZE):
+            chunk = positions[start:start + IN_CHUNK_SIZE]
+            keys = " UNION ALL ".join(["SELECT %s AS pos, %s AS url"] * len(chunk))
+            cursor.execute(
+                f"""SELECT k.pos, MIN(a.id) AS id
+                    FROM ({keys}) AS k
+                    JOIN articles a ON a.canonical_url = k.url COLLATE {ARTICLES_COLLATION}
+                    GROUP BY k.pos""",
+                tuple(value for i in chunk for value in (i, urls[i]))
+            )
+            for row in cursor.fetchall():
+                ids[int(row['pos'])] = row['id']
+        
+        return ids
+    
     def get_article_by_id(self, article_id: int) -> Optional[Dict]:
         """Get an article by ID."""
         row = self.db.fetchone(
@@ -258,6 +484,93 @@ class Repository:
         )
         return dict(row) if row else None
     
+    def get_recent_canonical_urls(self, hours: int = 168) -> List[str]:
+        """
+        Get canonical URLs of articles stored in recent hours.
+        
+        Args:
+            hours: How many hours back to look
+            
+        Returns:
+            List of canonical URLs
+        """
+        cutoff = utc_now() - timedelta(hours=hours)
+        
+        rows = self.db.fetchall(
+            "SELECT canonical_url FROM articles WHERE created_at >= %s",
+            (datetime_to_iso(cutoff),)
+        )
+        return [row['canonical_url'] for row in rows]
+    
+    def get_recent_articles_for_index(self, hours: int = 72) -> List[Dict]:
+        """
+        Get the articles the near-duplicate index should hold.
+        
+        Args:
+            hours: How many hours back to look
+            
+        Returns:
+            List of dicts with id, normalized_title, summary, created_at
+        """
+        cutoff = utc_now() - timedelta(hours=hours)
+        
+        rows = self.db.fetchall(
+            """SELECT id, normalized_title, summary, created_at FROM articles
+               WHERE created_at >= %s""",
+            (datetime_to_iso(cutoff),)
+        )
+        return [dict(row) for row in rows]
+    
+    def _existing_values(self, column: str, values: Iterable[str]) -> Set[str]:
+        """
+        Return which of *values* exist in articles.<column>, chunked queries.
+        
+        The values are joined in SQL with their positions, so matching follows
+        the column collation (case and accent folding) and the result holds
+        the values passed in, not the stored spellings.
+        """
+        unique = list(dict.fromkeys(v for v in values if v))
+        found: Set[str] = set()
+        
+        for start in range(0, len(unique), IN_CHUNK_SIZE):
+            chunk = unique[start:start + IN_CHUNK_SIZE]
+            keys = " UNION ALL ".join(["SELECT %s AS pos, %s AS val"] * len(chunk))
+            rows = self.db.fetchall(
+                f"""SELECT k.pos FROM ({keys}) AS k
+                    WHERE EXISTS (
+                        SELECT 1 FROM articles a
+                        WHERE a.{column} = k.val COLLATE {ARTICLES_COLLATION}
+                    )""",
+                tuple(value for i, v in enumerate(chunk) for value in (i, v))
+            )
+            found.update(chunk[int(row['pos'])] for row in rows)
+        
+        return found
+    
+    def get_existing_canonical_urls(self, canonical_urls: Iterable[str]) -> Set[str]:
+        """
+        Get which canonical URLs already exist, in one query per chunk.
+        
+        Args:
+            canonical_urls: Canonical URLs to look up
+            
+        Returns:
+            Set of the given canonical URLs present in articles
+        """
+        return self._existing_values("canonical_url", canonical_urls)
+    
+    def get_existing_content_hashes(self, content_hashes: Iterable[str]) -> Set[str]:
+        """
+        Get which content hashes already exist, in one query per chunk.
+        
+        Args:
+            content_hashes: Content hashes to look up
+            
+        Returns:
+            Set of the given content hashes present in articles
+        """
+        return self._existing_values("content_hash", content_hashes)
+    
     def is_duplicate(self, canonical_url: str, content_hash: str) -> bool:
         """
         Check if an article is a duplicate.
@@ -418,6 +731,19 @@ class Repository:
         Returns:
             List of recent articles for comparison
         """
+        return self.get_recent_titles(hours=hours)
+    
+    def get_recent_titles(self, hours: int = 6, limit: int = 500) -> List[Dict]:
+        """
+        Get the recent-title window used for fuzzy deduplication.
+        
+        Args:
+            hours: Hours to look back
+            limit: Maximum number of rows
+            
+        Returns:
+            List of dicts with id, normalized_title, canonical_url
+        """
         cutoff = utc_now() - timedelta(hours=hours)
         cutoff_str = datetime_to_iso(cutoff)
         
@@ -425,8 +751,8 @@ class Repository:
             """SELECT id, normalized_title, canonical_url FROM articles 
                WHERE created_at >= %s
                ORDER BY created_at DESC
-               LIMIT 500""",
-            (cutoff_str,)
+               LIMIT %s""",
+            (cutoff_str, limit)
         )
         return [dict(row) for row in rows]
     
@@ -771,6 +1097,51 @@ class Repository:
         )
         return [dict(row) for row in rows]
     
+    def get_active_live_matches_with_events(self) -> List[Dict]:
+        """
+        Get active live matches, each with its events under "events".
+        
+        Two queries in total (matches, then the events of all active
+        matches) instead of one events query per match.
+        
+        Returns:
+            List of match dicts ordered like get_active_live_matches
+        """
+        matches = self.get_active_live_matches()
+        if not matches:
+            return []
+        
+        rows = self.db.fetchall(
+            """SELECT e.* FROM live_events e
+               JOIN live_matches m ON m.match_id = e.match_id
+               WHERE m.match_status NOT IN ('FT', 'AET', 'PEN', 'CANC', 'PST', 'ABD')
+               ORDER BY e.event_minute ASC, e.created_at ASC"""
+        )
+        
+        events: Dict[str, List[Dict]] = {}
+        for row in rows:
+            events.setdefault(row['match_id'], []).append(dict(row))
+        
+        return [{**match, "events": events.get(match['match_id'], [])} for match in matches]
+    
+    def get_live_version(self) -> str:
+        """
+        Cheap version stamp of the live data (active matches and events).
+        
+        Returns:
+            Opaque version string
+        """
+        row = self.db.fetchone(
+            """SELECT COUNT(*) AS matches, MAX(updated_at) AS updated,
+                      SUM(home_score + away_score + COALESCE(current_minute, 0)) AS progress,
+                      (SELECT MAX(id) FROM live_events) AS last_event
+               FROM live_matches
+               WHERE match_status NOT IN ('FT', 'AET', 'PEN', 'CANC', 'PST', 'ABD')"""
+        )
+        if not row:
+            return "0"
+        return f"{row['matches']}:{row['updated']}:{row['progress']}:{row['last_event']}"
+    
     def increment_match_events(self, match_id: str):
         """Increment the events_published counter for a match."""
         now = datetime_to_iso(utc_now())
@@ -941,6 +1312,14 @@ class Repository:
         )
         return dict(row) if row else None
 
+    def get_web_article_slug(self, web_article_id: int) -> Optional[str]:
+        """Get the slug of a web article by its ID."""
+        row = self.db.fetchone(
+            "SELECT slug FROM web_articles WHERE id = %s",
+            (web_article_id,)
+        )
+        return row['slug'] if row else None
+
     def get_web_article_by_article_id(self, article_id: int) -> Optional[Dict]:
         """Get a web article by its parent article ID."""
         row = self.db.fetchone(
@@ -953,49 +1332,200 @@ class Repository:
         self,
         page: int = 1,
         per_page: int = 12,
-        sport: Optional[str] = None
-    ) -> List[Dict]:
-        """Get paginated web articles."""
+        sport: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[WebArticleCard]:
+        """
+        Get paginated web articles (card columns only).
+        
+        Args:
+            page: Page number (1-based)
+            per_page: Articles per page; the offset is (page - 1) * per_page
+            sport: Optional sport filter
+            limit: Rows to read from that offset (default per_page; one
+                more tells whether there is a next page)
+            
+        Returns:
+            List of web article cards
+        """
         offset = (page - 1) * per_page
-        query = "SELECT * FROM web_articles WHERE is_published = 1"
+        query = f"SELECT {WEB_ARTICLE_CARD_SELECT} FROM web_articles WHERE is_published = 1"
         params: list = []
 
         if sport:
             query += " AND sport = %s"
             params.append(sport)
 
-        query += " ORDER BY created_at DESC LIMIT %s OFFSET %s"
-        params.extend([per_page, offset])
+        query += " ORDER BY created_at DESC, id DESC LIMIT %s OFFSET %s"
+        params.extend([per_page if limit is None else limit, offset])
 
         rows = self.db.fetchall(query, tuple(params))
-        return [dict(row) for row in rows]
+        return [WebArticleCard.from_row(row) for row in rows]
+
+    def get_web_articles_keyset(
+        self,
+        limit: int = 12,
+        sport: Optional[str] = None,
+        after: Optional[tuple] = None,
+        before: Optional[tuple] = None
+    ) -> List[WebArticleCard]:
+        """
+        Get a page of web articles by keyset on (created_at, id), newest first.
+        
+        Unlike OFFSET, the cost does not grow with the page number.
+        
+        Args:
+            limit: Maximum number of rows
+            sport: Optional sport filter
+            after: (created_at, id) of the last row already shown; returns older rows
+            before: (created_at, id) of the first row already shown; returns the
+                rows right before it (newer), still ordered newest first
+            
+        Returns:
+            List of web article cards
+        """
+        query = f"SELECT {WEB_ARTICLE_CARD_SELECT} FROM web_articles WHERE is_published = 1"
+        params: list = []
+        
+        if sport:
+            query += " AND sport = %s"
+            params.append(sport)
+        
+        if after:
+            query += " AND (created_at < %s OR (created_at = %s AND id < %s))"
+            params.extend([after[0], after[0], after[1]])
+            query += " ORDER BY created_at DESC, id DESC LIMIT %s"
+        elif before:
+            query += " AND (created_at > %s OR (created_at = %s AND id > %s))"
+            params.extend([before[0], before[0], before[1]])
+            query += " ORDER BY created_at ASC, id ASC LIMIT %s"
+        else:
+            query += " ORDER BY created_at DESC, id DESC LIMIT %s"
+        params.append(limit)
+        
+        rows = [WebArticleCard.from_row(row) for row in self.db.fetchall(query, tuple(params))]
+        if before and not after:
+            rows.reverse()
+        return rows
 
-    def get_featured_web_articles(self, limit: int = 4) -> List[Dict]:
-        """Get featured web articles."""
+    def get_featured_web_articles(self, limit: int = 4) -> List[WebArticleCard]:
+        """Get featured web articles (card columns only)."""
         rows = self.db.fetchall(
-            """SELECT * FROM web_articles
+            f"""SELECT {WEB_ARTICLE_CARD_SELECT} FROM web_articles
                WHERE is_published = 1 AND is_featured = 1
                ORDER BY created_at DESC LIMIT %s""",
             (limit,)
         )
-        return [dict(row) for row in rows]
+        return [WebArticleCard.from_row(row) for row in rows]
 
-    def get_latest_web_articles(self, limit: int = 12) -> List[Dict]:
-        """Get the latest web articles."""
+    def get_latest_web_articles(self, limit: int = 12) -> List[WebArticleCard]:
+        """Get the latest web articles (card columns only)."""
         rows = self.db.fetchall(
-            """SELECT * FROM web_articles
+            f"""SELECT {WEB_ARTICLE_CARD_SELECT} FROM web_articles
                WHERE is_published = 1
                ORDER BY created_at DESC LIMIT %s""",
             (limit,)
         )
+        return [WebArticleCard.from_row(row) for row in rows]
+
+    def add_view_counts(self, counts: Dict[str, int]) -> int:
+        """
+        Add buffered view counts to web articles, one UPDATE per chunk of slugs.
+        
+        updated_at is left alone: a view is not a content change (sitemap
+        lastmod and content ETags are derived from it).
+
+        Args:
+            counts: slug -> views to add
+
+        Returns:
+            Number of rows updated
+        """
+        items = [(slug, views) for slug, views in counts.items() if views > 0]
+        updated = 0
+
+        for start in range(0, len(items), IN_CHUNK_SIZE):
+            chunk = items[start:start + IN_CHUNK_SIZE]
+            cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+            placeholders = ", ".join(["%s"] * len(chunk))
+            params = [value for item in chunk for value in item]
+            params.extend(slug for slug, _ in chunk)
+            cursor = self.db.execute(
+                f"""UPDATE web_articles
+                    SET view_count = view_count + CASE slug {cases} ELSE 0 END,
+                        updated_at = updated_at
+                    WHERE slug IN ({placeholders})""",
+                tuple(params)
+            )
+            updated += cursor.rowcount
+
+        return updated
+
+    def get_web_articles_version(self) -> str:
+        """
+        Cheap version stamp of the web articles content.
+        
+        Changes whenever an article is inserted or updated (both MAX values
+        are read from an index).
+        
+        Returns:
+            Opaque version string
+        """
+        row = self.db.fetchone(
+            "SELECT MAX(id) AS last_id, MAX(updated_at) AS updated FROM web_articles"
+        )
+        if not row:
+            return "0"
+        return f"{row['last_id']}:{row['updated']}"
+
+    def get_sitemap_months(self) -> List[Dict]:
+        """
+        Published web articles grouped by creation month, for sitemap shards.
+
+        Returns:
+            List of {"month": "YYYY-MM", "articles": int, "lastmod": datetime},
+            newest month first
+        """
+        rows = self.db.fetchall(
+            """SELECT DATE_FORMAT(created_at, '%%Y-%%m') AS month,
+                      COUNT(*) AS articles, MAX(updated_at) AS lastmod
+               FROM web_articles
+               WHERE is_published = 1
+               GROUP BY month
+               ORDER BY month DESC""",
+            ()
+        )
         return [dict(row) for row in rows]
 
-    def increment_view_count(self, slug: str):
-        """Increment the view count for a web article."""
-        self.db.execute(
-            "UPDATE web_articles SET view_count = view_count + 1 WHERE slug = %s",
-            (slug,)
+    def get_sitemap_articles(
+        self,
+        start: str,
+        end: str,
+        limit: int = 50000,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        Slug and dates of the published web articles created in [start, end).
+
+        Only the columns a sitemap needs are read, never the article bodies.
+
+        Args:
+            start: Inclusive lower bound of created_at
+            end: Exclusive upper bound of created_at
+            limit: Maximum number of rows
+            offset: Rows to skip (only for months split across several shards)
+
+        Returns:
+            List of {"slug", "created_at", "updated_at"} dicts, oldest first
+        """
+        rows = self.db.fetchall(
+            """SELECT slug, created_at, updated_at FROM web_articles
+               WHERE is_published = 1 AND created_at >= %s AND created_at < %s
+               ORDER BY created_at, id
+               LIMIT %s OFFSET %s""",
+            (start, end, limit, offset)
         )
+        return [dict(row) for row in rows]
 
     def get_web_article_count_by_sport(self, sport: Optional[str] = None) -> int:
         """Get total count of published web articles, optionally by sport."""
@@ -1045,15 +1575,15 @@ class Repository:
         except Exception as e:
             logger.warning(f"Error updating primary league/team: {e}")
 
-    def get_related_web_articles(self, sport: str, exclude_slug: str, limit: int = 4) -> List[Dict]:
-        """Get related web articles by sport, excluding current."""
+    def get_related_web_articles(self, sport: str, exclude_slug: str, limit: int = 4) -> List[WebArticleCard]:
+        """Get related web articles by sport, excluding current (card columns only)."""
         rows = self.db.fetchall(
-            """SELECT * FROM web_articles
+            f"""SELECT {WEB_ARTICLE_CARD_SELECT} FROM web_articles
                WHERE is_published = 1 AND sport = %s AND slug != %s
                ORDER BY created_at DESC LIMIT %s""",
             (sport, exclude_slug, limit)
         )
-        return [dict(row) for row in rows]
+        return [WebArticleCard.from_row(row) for row in rows]
 
     # ── Comments ──
 
@@ -1160,10 +1690,14 @@ class Repository:
         )
 
     def get_user_by_session(self, session_id: str) -> Optional[Dict]:
-        """Get a user by their session token. Returns None if expired or not found."""
+        """
+        Get a user by their session token. Returns None if expired or not found.
+        
+        The user dict also carries the session's ``session_expires_at``.
+        """
         now = datetime_to_iso(utc_now())
         row = self.db.fetchone(
-            """SELECT u.* FROM users u
+            """SELECT u.*, s.expires_at AS session_expires_at FROM users u
                JOIN sessions s ON s.user_id = u.id
                WHERE s.id = %s AND s.expires_at > %s AND u.is_active = 1""",
             (session_id, now)
@@ -1186,6 +1720,12 @@ class Repository:
         )
 
 
+def _collation_key(value: str) -> str:
+    """Approximate utf8mb4_unicode_ci equality: case and accents folded."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
 # Convenience function
 def get_repository() -> Repository:
     """Get a Repository instance."""
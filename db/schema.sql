@@ -9,6 +9,12 @@ CREATE TABLE IF NOT EXISTS sources (
     weight INT DEFAULT 10,
     active TINYINT(1) DEFAULT 1,
     last_fetched_at DATETIME NULL,
+    etag VARCHAR(512) NULL,
+    last_modified VARCHAR(64) NULL,
+    poll_interval_seconds INT NULL,
+    next_poll_at DATETIME NULL,
+    last_entry_at DATETIME NULL,
+    unchanged_streak INT DEFAULT 0,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
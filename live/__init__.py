@@ -5,6 +5,7 @@ Handles real-time match tracking and publishing.
 from .live_collector import LiveCollector, LiveMatch, LiveEvent
 from .live_rules import LiveRules
 from .live_publisher import LivePublisher, publish_live_event
+from .broadcaster import LiveBroadcaster, get_live_broadcaster
 
 __all__ = [
     'LiveCollector',
@@ -13,4 +14,6 @@ __all__ = [
     'LiveRules',
     'LivePublisher',
     'publish_live_event',
+    'LiveBroadcaster',
+    'get_live_broadcaster',
 ]
@@ -0,0 +1,145 @@
+"""
+In-process broadcaster for live match updates.
+The live cycle publishes score changes and new events here; the web
+portal's SSE endpoint fans them out to every connected browser, so open
+tabs cost no database queries.
+"""
+import asyncio
+import itertools
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Messages buffered per subscriber before it is considered stalled
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class Subscription:
+    """One listener (an SSE connection) on its own event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Tuple[int, str, Any]]" = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+    def _deliver(self, message: Tuple[int, str, Any]):
+        # Runs on the subscriber's loop
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A client this far behind gets a fresh snapshot instead
+            self.overflowed = True
+
+    async def get(self, timeout: float) -> Optional[Tuple[int, str, Any]]:
+        """Next (id, type, data) message, or None after timeout."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class LiveBroadcaster:
+    """
+    Thread-safe fan-out of live updates.
+
+    publish() may be called from any thread (the bot's live cycle); each
+    message is handed to the subscribers' event loops without blocking.
+    """
+
+    def __init__(self):
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.changes = 0  # "match"/"event" messages, i.e. live data writes
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> Subscription:
+        """Register a listener on the running event loop."""
+        subscription = Subscription(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a listener."""
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def publish(self, message_type: str, data: Any) -> int:
+        """
+        Send a message to every subscriber.
+
+        Args:
+            message_type: "match", "event" or "snapshot"
+            data: JSON-serializable payload
+
+        Returns:
+            Message id
+        """
+        message = (next(self._ids), message_type, data)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        self.published += 1
+        if message_type != "snapshot":
+            self.changes += 1
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, message)
+            except RuntimeError:
+                # Loop closed: the connection is gone
+                self.unsubscribe(subscription)
+        return message[0]
+
+
+# Global broadcaster instance
+_broadcaster_instance: Optional[LiveBroadcaster] = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_live_broadcaster() -> LiveBroadcaster:
+    """Get or create the global live broadcaster."""
+    global _broadcaster_instance
+
+    if _broadcaster_instance is None:
+        with _broadcaster_lock:
+            if _broadcaster_instance is None:
+                _broadcaster_instance = LiveBroadcaster()
+
+    return _broadcaster_instance
+
+
+def match_payload(match) -> Dict:
+    """Score/status fields of a LiveMatch, shaped like a live_matches row."""
+    return {
+        "match_id": match.match_id,
+        "league_id": match.league_id,
+        "league_name": match.league_name,
+        "home_team": match.home_team,
+        "away_team": match.away_team,
+        "home_score": match.home_score,
+        "away_score": match.away_score,
+        "match_status": match.status,
+        "current_minute": match.minute or 0,
+    }
+
+
+def event_payload(match, event) -> Dict:
+    """A published LiveEvent, shaped like a live_events row."""
+    return {
+        "match_id": match.match_id,
+        "home_score": event.home_score,
+        "away_score": event.away_score,
+        "event_type": event.event_type.value,
+        "event_minute": event.minute,
+        "event_player": event.player,
+        "event_detail": event.detail,
+    }
@@ -15,6 +15,7 @@ from enum import Enum
 import requests
 
 from config import get_config, TOP_TEAMS
+from .broadcaster import get_live_broadcaster, match_payload
 
 logger = logging.getLogger(__name__)
 
@@ -563,6 +564,16 @@ class LiveCollector:
                 is_top_team_match=match.is_top_team_match
             )
             
+            # Push score/status changes to web viewers
+            if (
+                db_match is None
+                or match.home_score != previous_home_score
+                or match.away_score != previous_away_score
+                or match.status != previous_status
+                or (match.minute or 0) != (db_match.get('current_minute') or 0)
+            ):
+                get_live_broadcaster().publish("match", match_payload(match))
+            
             # Check for match finished event
             if self.check_match_finished(match, previous_status):
                 final_event = LiveEvent(
@@ -10,6 +10,7 @@ from pathlib import Path
 
 from config import get_config
 from .live_collector import LiveMatch, LiveEvent, EventType
+from .broadcaster import get_live_broadcaster, event_payload
 
 logger = logging.getLogger(__name__)
 
@@ -355,6 +356,9 @@ def publish_live_event(
             # Increment match event counter
             repo.increment_match_events(match.match_id)
             
+            # Push the event to web viewers
+            get_live_broadcaster().publish("event", event_payload(match, event))
+            
             logger.info(
                 f"✅ Published live event: {event.event_type.value} - "
                 f"{match.home_team} vs {match.away_team}"
@@ -18,9 +18,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from config import get_config, RSSSource
 from db import init_db, get_repository
-from collector import collect_all, get_best_image
-from processor import normalize_all, classify_all, rank_all, dedupe_all
-from scheduler import get_planner, PostType
+from collector import collect_results, get_best_image
+from processor import (
+    normalize_all, classify_all, rank_all, dedupe_all,
+    warm_seen_entries, get_near_dup_index, save_near_dup_index
+)
+from scheduler import get_planner, get_poll_scheduler, PostType
 from editorial import generate_caption, generate_digest_caption
 from media import download_image, process_image_with_watermark, create_placeholder_image
 from publisher import publish_article, publish_digest
@@ -294,21 +297,37 @@ def run_cycle(config, repo, logger) -> int:
         # Get sources from DB (they were seeded on init)
         db_sources = repo.get_sources(active_only=True)
         
+        # Only poll the sources whose adaptive interval has elapsed
+        poll_scheduler = get_poll_scheduler()
+        if config.collector.adaptive_polling:
+            db_sources = poll_scheduler.due_sources(db_sources)
+            if not db_sources:
+                logger.info("No sources due for polling this cycle")
+                return 0
+        
         # Convert to RSSSource objects
         sources = [
             RSSSource(
                 name=s['name'],
                 url=s['url'],
                 sport_hint=s['sport_hint'],
-                weight=s['weight']
+                weight=s['weight'],
+                source_id=s['id'],
+                etag=s.get('etag'),
+                last_modified=s.get('last_modified')
             )
             for s in db_sources
         ]
         
-        raw_items = collect_all(sources)
+        results = collect_results(sources)
+        
+        raw_items = []
+        for result in results:
+            raw_items.extend(result.items)
         
         if not raw_items:
             logger.info("No items collected this cycle")
+            poll_scheduler.record_results(results, db_sources)
             return 0
         
         # 2. Process items through pipeline
@@ -322,6 +341,7 @@ def run_cycle(config, repo, logger) -> int:
         
         if not unique:
             logger.info("All items were duplicates")
+            poll_scheduler.record_results(results, db_sources)
             return 0
         
         # Classify
@@ -336,6 +356,10 @@ def run_cycle(config, repo, logger) -> int:
         planner = get_planner()
         plans = planner.plan_publications(ranked)
         
+        # Candidates are saved: only now remember the HTTP validators, so a
+        # cycle that fails earlier refetches the same entries instead of a 304
+        poll_scheduler.record_results(results, db_sources)
+        
         if not plans:
             logger.info("No items eligible for publication this cycle")
             return 0
@@ -466,6 +490,11 @@ def main():
     
     logger.info(f"📺 Channel: {config.channel_chat_id}")
     logger.info(f"⏱️  Poll interval: {config.poll_interval_seconds}s")
+    if config.collector.adaptive_polling:
+        logger.info(
+            f"⏱️  Adaptive polling: {config.collector.min_poll_seconds}s - "
+            f"{config.collector.max_poll_seconds}s per source"
+        )
     logger.info(f"📊 Max posts: {config.max_posts_per_day}/day, {config.max_posts_per_hour}/hour")
     logger.info(f"🕐 Active window: {config.active_window_start} - {config.active_window_end} ({config.tz})")
     
@@ -488,6 +517,12 @@ def main():
     # Seed sources
     seed_sources_if_needed(repo, config)
     
+    # Load already-stored article URLs so repeats skip the pipeline
+    warm_seen_entries()
+    
+    # Restore the near-duplicate index (disk snapshot + recent articles)
+    get_near_dup_index()
+    
     # Start web server in-process if configured
     if os.getenv("WEB_IN_PROCESS", "").lower() in ("true", "1", "yes"):
         try:
@@ -509,6 +544,13 @@ def main():
     logger.info("✅ Initialization complete")
     logger.info("-" * 60)
 
+    # With adaptive polling the RSS cycle ticks at the shortest per-source
+    # interval and only fetches the sources that are due
+    if config.collector.adaptive_polling:
+        rss_interval = min(config.collector.min_poll_seconds, config.poll_interval_seconds)
+    else:
+        rss_interval = config.poll_interval_seconds
+
     # Main loop
     cycle_count = 0
     total_published = 0
@@ -522,12 +564,13 @@ def main():
         
         try:
             # Run RSS cycle if interval elapsed
-            if current_time - last_rss_cycle >= config.poll_interval_seconds:
+            if current_time - last_rss_cycle >= rss_interval:
                 logger.info(f"\n🔄 RSS Cycle {cycle_count} starting...")
                 
                 published = run_cycle(config, repo, logger)
                 total_published += published
                 last_rss_cycle = current_time
+                save_near_dup_index()
                 
                 if published > 0:
                     logger.info(f"📤 Published {published} news item(s)")
@@ -560,9 +603,9 @@ def main():
         if not shutdown_requested:
             if config.live.api_key:
                 # Use the shorter live poll interval
-                sleep_interval = min(config.live.poll_seconds, config.poll_interval_seconds)
+                sleep_interval = min(config.live.poll_seconds, rss_interval)
             else:
-                sleep_interval = config.poll_interval_seconds
+                sleep_interval = rss_interval
             
             logger.info(f"😴 Sleeping for {sleep_interval}s...")
             
@@ -574,6 +617,7 @@ def main():
                 sleep_remaining -= sleep_time
     
     # Shutdown
+    save_near_dup_index()
     logger.info("-" * 60)
     logger.info(f"📊 Total published this session: {total_published} news, {total_live_published} live events")
     logger.info("👋 GoalFeed Bot shutting down...")
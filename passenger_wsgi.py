@@ -55,6 +55,8 @@ def application(environ, start_response):
             int(environ.get("SERVER_PORT", "80")),
         ),
         "headers": headers,
+        # Responses are collected before being returned: no streaming (SSE)
+        "extensions": {"goalfeed.buffered": {}},
     }
 
     # Read request body
@@ -2,7 +2,9 @@
 from .normalize import NormalizedItem, normalize_item, normalize_all
 from .classify import classify_sport, classify_category, determine_status, classify_item, classify_all
 from .ranker import calculate_score, rank_item, rank_all
-from .dedupe import check_duplicate, dedupe_item, dedupe_all
+from .dedupe import DedupeSnapshot, load_snapshot, check_duplicate, dedupe_item, dedupe_all
+from .seen import SeenEntries, get_seen_entries, warm_seen_entries, filter_seen, mark_seen
+from .near_dup import NearDuplicateIndex, get_near_dup_index, index_items, save_near_dup_index
 
 __all__ = [
     # Normalize
@@ -20,7 +22,20 @@ __all__ = [
     'rank_item',
     'rank_all',
     # Dedupe
+    'DedupeSnapshot',
+    'load_snapshot',
     'check_duplicate',
     'dedupe_item',
-    'dedupe_all'
+    'dedupe_all',
+    # Seen-entry fast path
+    'SeenEntries',
+    'get_seen_entries',
+    'warm_seen_entries',
+    'filter_seen',
+    'mark_seen',
+    # Near-duplicate index
+    'NearDuplicateIndex',
+    'get_near_dup_index',
+    'index_items',
+    'save_near_dup_index'
 ]
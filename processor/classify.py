@@ -3,19 +3,71 @@ Classification module for GoalFeed.
 Classifies articles by sport and category using heuristics.
 """
 import logging
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Optional, Tuple
-import re
 
 from config import (
     SPORT_KEYWORDS, CATEGORY_KEYWORDS, OFFICIAL_DOMAINS,
     TEAM_ALIASES, TEAM_LEAGUE_MEMBERSHIP, LEAGUE_KEYWORDS,
 )
+from processor.keywords import KeywordAutomaton
 from processor.normalize import NormalizedItem
 
 logger = logging.getLogger(__name__)
 
 
-def classify_sport(item: NormalizedItem) -> str:
+def _build_automaton() -> KeywordAutomaton:
+    """One automaton for every sport/category/league keyword and team alias."""
+    keywords = []
+    for sport, words in SPORT_KEYWORDS.items():
+        keywords.extend((kw, ('sport', sport)) for kw in words)
+    for category, words in CATEGORY_KEYWORDS.items():
+        keywords.extend((kw, ('category', category)) for kw in words)
+    for league_slug, words in LEAGUE_KEYWORDS.items():
+        keywords.extend((kw, ('league', league_slug)) for kw in words)
+    for team_slug, info in TEAM_ALIASES.items():
+        keywords.extend((alias, ('team', team_slug)) for alias in info["aliases"])
+    return KeywordAutomaton(keywords)
+
+
+# Built once at import
+KEYWORD_AUTOMATON = _build_automaton()
+
+
+@dataclass
+class KeywordHits:
+    """Keyword matches of one item, per label, from a single scan."""
+    text: Counter = field(default_factory=Counter)  # Title + summary + categories
+    title: Counter = field(default_factory=Counter)  # Title only
+    body: Counter = field(default_factory=Counter)  # Summary + categories only
+
+
+def scan_keywords(item: NormalizedItem) -> KeywordHits:
+    """
+    Find all keyword and team-alias hits of an item in one pass.
+    
+    Args:
+        item: NormalizedItem to scan
+        
+    Returns:
+        KeywordHits with counts keyed by (kind, label)
+    """
+    title = item.title.lower()
+    body = ((item.summary or "") + " " + " ".join(item.categories)).lower()
+    text = title + " " + body
+    
+    hits = KEYWORD_AUTOMATON.find(text)
+    body_start = len(title) + 1
+    
+    return KeywordHits(
+        text=KEYWORD_AUTOMATON.count(hits),
+        title=KEYWORD_AUTOMATON.count(hits, 0, len(title)),
+        body=KEYWORD_AUTOMATON.count(hits, body_start),
+    )
+
+
+def classify_sport(item: NormalizedItem, hits: Optional[KeywordHits] = None) -> str:
     """
     Classify the sport of an article.
     
@@ -25,6 +77,7 @@ def classify_sport(item: NormalizedItem) -> str:
     
     Args:
         item: NormalizedItem to classify
+        hits: Precomputed keyword hits (scanned here if not provided)
         
     Returns:
         Sport identifier (football_eu, nba, tennis)
@@ -33,25 +86,14 @@ def classify_sport(item: NormalizedItem) -> str:
     if item.source_sport_hint:
         return item.source_sport_hint
     
-    # Combine text for analysis
-    text_to_analyze = " ".join([
-        item.title.lower(),
-        (item.summary or "").lower(),
-        " ".join(item.categories).lower()
-    ])
+    if hits is None:
+        hits = scan_keywords(item)
     
     # Count keyword matches for each sport
-    sport_scores = {}
-    
-    for sport, keywords in SPORT_KEYWORDS.items():
-        score = 0
-        for keyword in keywords:
-            # Use word boundaries for better matching
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            matches = len(re.findall(pattern, text_to_analyze))
-            score += matches
-        
-        sport_scores[sport] = score
+    sport_scores = {
+        sport: hits.text[('sport', sport)]
+        for sport in SPORT_KEYWORDS
+    }
     
     # Return sport with highest score, default to "other"
     if sport_scores:
@@ -62,7 +104,7 @@ def classify_sport(item: NormalizedItem) -> str:
     return "other"
 
 
-def classify_category(item: NormalizedItem) -> str:
+def classify_category(item: NormalizedItem, hits: Optional[KeywordHits] = None) -> str:
     """
     Classify the category of an article.
     
@@ -70,33 +112,19 @@ def classify_category(item: NormalizedItem) -> str:
     
     Args:
         item: NormalizedItem to classify
+        hits: Precomputed keyword hits (scanned here if not provided)
         
     Returns:
         Category identifier
     """
-    # Combine text for analysis
-    text_to_analyze = " ".join([
-        item.title.lower(),
-        (item.summary or "").lower(),
-        " ".join(item.categories).lower()
-    ])
+    if hits is None:
+        hits = scan_keywords(item)
     
-    # Count keyword matches for each category
-    category_scores = {}
-    
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        score = 0
-        for keyword in keywords:
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            matches = len(re.findall(pattern, text_to_analyze))
-            
-            # Give title matches more weight
-            title_pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            title_matches = len(re.findall(title_pattern, item.title.lower()))
-            
-            score += matches + (title_matches * 2)  # Title matches worth more
-        
-        category_scores[category] = score
+    # Count keyword matches for each category; title matches worth more
+    category_scores = {
+        category: hits.text[('category', category)] + hits.title[('category', category)] * 2
+        for category in CATEGORY_KEYWORDS
+    }
     
     # Check for "breaking" keywords first (highest priority)
     if category_scores.get('breaking', 0) >= 2:
@@ -169,15 +197,13 @@ def determine_status(item: NormalizedItem) -> str:
     return "CONFIRMADO"
 
 
-def _detect_league_context(text: str) -> Optional[str]:
-    """Detect which league is being discussed based on keywords."""
-    text_lower = text.lower()
+def _detect_league_context(text: str = "", hits: Optional[Counter] = None) -> Optional[str]:
+    """Detect which league is being discussed based on keywords (or precomputed hits)."""
+    if hits is None:
+        hits = KEYWORD_AUTOMATON.count(KEYWORD_AUTOMATON.find(text.lower()))
     league_scores = {}
-    for league_slug, keywords in LEAGUE_KEYWORDS.items():
-        score = 0
-        for kw in keywords:
-            pattern = r'\b' + re.escape(kw.lower()) + r'\b'
-            score += len(re.findall(pattern, text_lower))
+    for league_slug in LEAGUE_KEYWORDS:
+        score = hits[('league', league_slug)]
         if score > 0:
             league_scores[league_slug] = score
     if league_scores:
@@ -185,35 +211,32 @@ def _detect_league_context(text: str) -> Optional[str]:
     return None
 
 
-def classify_teams(item: NormalizedItem) -> list:
+def classify_teams(item: NormalizedItem, hits: Optional[KeywordHits] = None) -> list:
     """
     Classify which teams are mentioned in an article.
 
     Uses word-boundary matching on aliases. Headline matches get 3x weight.
     For multi-league teams, league context keywords disambiguate.
 
+    Args:
+        item: NormalizedItem to classify
+        hits: Precomputed keyword hits (scanned here if not provided)
+
     Returns:
         List of dicts: [{team_slug, league_slug, score}, ...] sorted by score desc.
     """
-    title = item.title.lower()
-    body = ((item.summary or "") + " " + " ".join(item.categories)).lower()
-    full_text = title + " " + body
+    if hits is None:
+        hits = scan_keywords(item)
 
     # Detect league context once
-    league_context = _detect_league_context(full_text)
+    league_context = _detect_league_context(hits=hits.text)
 
     results = {}  # key: (team_slug, league_slug) -> score
 
     for team_slug, info in TEAM_ALIASES.items():
         primary_league = info["league"]
-        aliases = info["aliases"]
 
-        score = 0
-        for alias in aliases:
-            pattern = r'\b' + re.escape(alias.lower()) + r'\b'
-            title_hits = len(re.findall(pattern, title))
-            body_hits = len(re.findall(pattern, body))
-            score += title_hits * 3 + body_hits
+        score = hits.title[('team', team_slug)] * 3 + hits.body[('team', team_slug)]
 
         if score < 2:
             continue
@@ -247,10 +270,13 @@ def classify_item(item: NormalizedItem) -> NormalizedItem:
     Returns:
         Same item with classification fields filled
     """
-    item.sport = classify_sport(item)
-    item.category = classify_category(item)
+    # One keyword scan feeds every classifier
+    hits = scan_keywords(item)
+    
+    item.sport = classify_sport(item, hits)
+    item.category = classify_category(item, hits)
     item.status = determine_status(item)
-    item.teams = classify_teams(item)
+    item.teams = classify_teams(item, hits)
 
     logger.debug(
         f"Classified: '{item.title[:40]}...' -> "
@@ -3,16 +3,158 @@ Deduplication module for GoalFeed.
 Prevents duplicate articles from being processed or posted.
 """
 import logging
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from config import get_config
 from processor.normalize import NormalizedItem
 from db.repo import get_repository
+from processor.seen import mark_seen
+from processor.near_dup import get_near_dup_index
 
 logger = logging.getLogger(__name__)
 
+# Similarity threshold for duplicates inside the same batch
+BATCH_SIMILARITY_THRESHOLD = 0.88
+
+# Query rows scored per cdist call (bounds the matrix held in memory)
+CDIST_CHUNK_ROWS = 1000
+
+
+@dataclass
+class DedupeSnapshot:
+    """
+    Database state needed to dedupe one batch, loaded once per cycle.
+    
+    Replaces the per-item URL / hash lookups and the per-item reload of
+    the recent-title window.
+    """
+    existing_urls: Set[str] = field(default_factory=set)
+    existing_hashes: Set[str] = field(default_factory=set)
+    recent_titles: List[Dict] = field(default_factory=list)
+    
+    # Best recent-window match per normalized title, precomputed in one pass
+    title_matches: Dict[str, Optional[Dict]] = field(default_factory=dict)
+
+
+def similarity_chunks(
+    queries: List[str],
+    choices: List[str],
+    threshold: float = 0.88
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Score every query against every choice with fuzz.ratio via cdist.
+    
+    Rows are produced in chunks so 10k x 10k comparisons stay within a
+    bounded amount of memory. Scores below the threshold come back as 0,
+    which lets rapidfuzz skip most of the work for dissimilar pairs.
+    
+    Args:
+        queries: Normalized titles to check
+        choices: Normalized titles to compare against
+        threshold: Similarity threshold (0.0-1.0)
+        
+    Yields:
+        (first query index, chunk of ratios in the 0-100 range)
+    """
+    if not queries or not choices:
+        return
+    
+    workers = get_config().dedupe_workers
+    for start in range(0, len(queries), CDIST_CHUNK_ROWS):
+        # Slightly below the threshold: the exact >= check is done by the caller
+        yield start, process.cdist(
+            queries[start:start + CDIST_CHUNK_ROWS],
+            choices,
+            scorer=fuzz.ratio,
+            score_cutoff=max(0.0, threshold * 100 - 1e-6),
+            dtype=np.float64,
+            workers=workers
+        )
+
+
+def match_titles(
+    queries: List[str],
+    recent: List[Dict],
+    threshold: float = 0.88
+) -> List[Optional[Dict]]:
+    """
+    Find the most similar recent article for each query title.
+    
+    Same result as calling best_title_match once per query, computed as
+    one similarity matrix.
+    
+    Args:
+        queries: Normalized titles to check
+        recent: Recent article dicts with a normalized_title key
+        threshold: Similarity threshold (0.0-1.0)
+        
+    Returns:
+        One article dict (or None) per query
+    """
+    matches: List[Optional[Dict]] = [None] * len(queries)
+    choices = [article['normalized_title'] for article in recent]
+    
+    for start, scores in similarity_chunks(queries, choices, threshold):
+        best = scores.argmax(axis=1)  # First index wins ties, like the scalar loop
+        for offset, col in enumerate(best):
+            if scores[offset, col] / 100.0 >= threshold:
+                matches[start + offset] = recent[col]
+    
+    return matches
+
+
+def similar_pairs(titles: List[str], threshold: float = 0.88) -> List[Set[int]]:
+    """
+    Find, for each title, the other titles of the same batch it is similar to.
+    
+    Args:
+        titles: Normalized titles of a batch
+        threshold: Similarity threshold (0.0-1.0)
+        
+    Returns:
+        For each title index, the set of indices with ratio >= threshold
+    """
+    neighbours: List[Set[int]] = [set() for _ in titles]
+    
+    for start, scores in similarity_chunks(titles, titles, threshold):
+        rows, cols = np.nonzero(scores / 100.0 >= threshold)
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            if start + row != col:
+                neighbours[start + row].add(col)
+    
+    return neighbours
+
+
+def load_snapshot(items: List[NormalizedItem]) -> DedupeSnapshot:
+    """
+    Resolve all canonical URLs and content hashes of a batch with one
+    IN (...) query each, and load the recent-title window once.
+    
+    Args:
+        items: NormalizedItem objects about to be deduped
+        
+    Returns:
+        DedupeSnapshot for the batch
+    """
+    config = get_config()
+    repo = get_repository()
+    
+    snapshot = DedupeSnapshot(
+        existing_urls=repo.get_existing_canonical_urls(i.canonical_url for i in items),
+        existing_hashes=repo.get_existing_content_hashes(i.content_hash for i in items),
+        recent_titles=repo.get_recent_titles(hours=config.dedupe_hours_window),
+    )
+    
+    titles = list(dict.fromkeys(i.normalized_title for i in items))
+    matches = match_titles(titles, snapshot.recent_titles, config.dedupe_similarity_threshold)
+    snapshot.title_matches = dict(zip(titles, matches))
+    
+    return snapshot
+
 
 def is_url_duplicate(canonical_url: str) -> bool:
     """
@@ -65,6 +207,25 @@ def find_similar_title(
     # Get recent articles for comparison
     recent = repo.get_similar_titles_recent(normalized_title, hours)
     
+    return best_title_match(normalized_title, recent, threshold)
+
+
+def best_title_match(
+    normalized_title: str,
+    recent: List[Dict],
+    threshold: float = 0.88
+) -> Optional[dict]:
+    """
+    Find the most similar title among already-loaded recent articles.
+    
+    Args:
+        normalized_title: Normalized title to compare
+        recent: Recent article dicts with a normalized_title key
+        threshold: Similarity threshold (0.0-1.0)
+        
+    Returns:
+        Most similar article dict or None
+    """
     best_match = None
     best_ratio = 0.0
     
@@ -88,6 +249,34 @@ def find_similar_title(
     return best_match
 
 
+def find_near_duplicate(item: NormalizedItem) -> Optional[dict]:
+    """
+    Find a stored story close to the item in the MinHash/LSH index.
+    
+    Catches cross-source duplicates older than the fuzzy-title window.
+    
+    Args:
+        item: NormalizedItem to check
+        
+    Returns:
+        Dict with id and similarity of the closest story, or None
+    """
+    index = get_near_dup_index()
+    if index is None:
+        return None
+    
+    matches = index.query(item.normalized_title, item.summary)
+    if not matches:
+        return None
+    
+    article_id, similarity = matches[0]
+    logger.debug(
+        f"Found near-duplicate story (jaccard~{similarity:.2f}): "
+        f"'{item.normalized_title[:40]}' ~ article {article_id}"
+    )
+    return {'id': article_id, 'similarity': similarity}
+
+
 def is_update_article(item: NormalizedItem) -> bool:
     """
     Check if an article is an update to existing news (not just duplicate).
@@ -117,12 +306,16 @@ def is_update_article(item: NormalizedItem) -> bool:
     return False
 
 
-def check_duplicate(item: NormalizedItem) -> Tuple[bool, str]:
+def check_duplicate(
+    item: NormalizedItem,
+    snapshot: Optional[DedupeSnapshot] = None
+) -> Tuple[bool, str]:
     """
     Full duplicate check for an item.
     
     Args:
         item: NormalizedItem to check
+        snapshot: Preloaded batch state (queries the database if not provided)
         
     Returns:
         Tuple of (is_duplicate, reason)
@@ -130,19 +323,52 @@ def check_duplicate(item: NormalizedItem) -> Tuple[bool, str]:
     config = get_config()
     
     # Check URL duplicate
-    if is_url_duplicate(item.canonical_url):
+    if snapshot is not None:
+        url_dup = item.canonical_url in snapshot.existing_urls
+    else:
+        url_dup = is_url_duplicate(item.canonical_url)
+    if url_dup:
         return True, "url_duplicate"
     
     # Check hash duplicate
-    if is_hash_duplicate(item.content_hash):
+    if snapshot is not None:
+        hash_dup = item.content_hash in snapshot.existing_hashes
+    else:
+        hash_dup = is_hash_duplicate(item.content_hash)
+    if hash_dup:
         return True, "hash_duplicate"
     
     # Check fuzzy title match
-    similar = find_similar_title(
-        item.normalized_title,
-        threshold=config.dedupe_similarity_threshold,
-        hours=config.dedupe_hours_window
-    )
+    if snapshot is not None:
+        if item.normalized_title in snapshot.title_matches:
+            similar = snapshot.title_matches[item.normalized_title]
+        else:
+            similar = best_title_match(
+                item.normalized_title,
+                snapshot.recent_titles,
+                threshold=config.dedupe_similarity_threshold
+            )
+    else:
+        similar = find_similar_title(
+            item.normalized_title,
+            threshold=config.dedupe_similarity_threshold,
+            hours=config.dedupe_hours_window
+        )
+    
+    reason = "title_similar"
+    
+    # Check near-duplicate stories across the whole index horizon
+    if not similar:
+        similar = find_near_duplicate(item)
+        reason = "near_duplicate"
+        if similar and not config.near_dup_reject:
+            # Log-only mode: keep the item, record the would-be rejection so
+            # the threshold can be checked against real pairs first
+            logger.info(
+                f"Near-duplicate (log only, jaccard~{similar['similarity']:.2f}): "
+                f"'{item.title[:60]}' ~ article {similar['id']}"
+            )
+            return False, "near_duplicate_logged"
     
     if similar:
         # Check if this is an update (allowed)
@@ -152,27 +378,30 @@ def check_duplicate(item: NormalizedItem) -> Tuple[bool, str]:
             )
             return False, "update_allowed"
         
-        return True, "title_similar"
+        return True, reason
     
     return False, "unique"
 
 
-def dedupe_item(item: NormalizedItem) -> bool:
+def dedupe_item(item: NormalizedItem, snapshot: Optional[DedupeSnapshot] = None) -> bool:
     """
     Check if item is duplicate and mark if so.
     
     Args:
         item: NormalizedItem to check
+        snapshot: Preloaded batch state (queries the database if not provided)
         
     Returns:
         True if item should be processed (not duplicate)
     """
-    is_dup, reason = check_duplicate(item)
+    is_dup, reason = check_duplicate(item, snapshot)
     
     if is_dup:
         logger.debug(
             f"Duplicate ({reason}): '{item.title[:50]}'"
         )
+        if reason == "url_duplicate":
+            mark_seen([item.canonical_url])
         return False
     
     return True
@@ -191,8 +420,19 @@ def dedupe_all(items: list[NormalizedItem]) -> list[NormalizedItem]:
     unique_items = []
     duplicate_count = 0
     
-    # Also check against items in this batch
-    seen_titles = set()
+    if not items:
+        return unique_items
+    
+    # One round-trip per lookup kind for the whole batch
+    snapshot = load_snapshot(items)
+    
+    # Also check against items in this batch: score all batch titles
+    # against each other once, then walk the items in order
+    titles = list(dict.fromkeys(item.normalized_title for item in items))
+    title_index = {title: i for i, title in enumerate(titles)}
+    neighbours = similar_pairs(titles, BATCH_SIMILARITY_THRESHOLD)
+    
+    seen_titles: Set[int] = set()
     seen_urls = set()
     
     for item in items:
@@ -201,26 +441,20 @@ def dedupe_all(items: list[NormalizedItem]) -> list[NormalizedItem]:
             duplicate_count += 1
             continue
         
-        # Quick title similarity check within batch
-        is_batch_dup = False
-        for seen_title in seen_titles:
-            ratio = fuzz.ratio(item.normalized_title, seen_title) / 100.0
-            if ratio >= 0.88:
-                is_batch_dup = True
-                break
-        
-        if is_batch_dup:
+        # Title similarity check within batch (identical titles count too)
+        index = title_index[item.normalized_title]
+        if index in seen_titles or neighbours[index] & seen_titles:
             duplicate_count += 1
             continue
         
-        # Check against database
-        if not dedupe_item(item):
+        # Check against database snapshot
+        if not dedupe_item(item, snapshot):
             duplicate_count += 1
             continue
         
         # Item is unique
         unique_items.append(item)
-        seen_titles.add(item.normalized_title)
+        seen_titles.add(index)
         seen_urls.add(item.canonical_url)
     
     logger.info(
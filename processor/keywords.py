@@ -0,0 +1,137 @@
+"""
+Multi-keyword matching for GoalFeed.
+Aho-Corasick automaton that finds every keyword occurrence in one pass,
+with the same word-boundary and counting rules as ``re.findall(r'\\bkw\\b')``.
+"""
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the re module (\\w)."""
+    return ch.isalnum() or ch == '_'
+
+
+def _at_boundary(text: str, pos: int) -> bool:
+    """True if a regex \\b matches at pos in text."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over lowercase keywords.
+
+    Each keyword can belong to several labels (e.g. a word that is both a
+    league keyword and a team alias); hits are reported per label.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, Hashable]]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: (keyword, label) pairs; a keyword listed twice for the
+                same label counts twice, like looping over both entries
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._patterns: List[str] = []
+        self._labels: List[List[Hashable]] = []
+
+        pattern_ids: Dict[str, int] = {}
+        for keyword, label in keywords:
+            keyword = keyword.lower()
+            if not keyword:
+                continue
+            if keyword not in pattern_ids:
+                pattern_ids[keyword] = len(self._patterns)
+                self._patterns.append(keyword)
+                self._labels.append([])
+                self._insert(keyword, pattern_ids[keyword])
+            self._labels[pattern_ids[keyword]].append(label)
+
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, pattern_id: int):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Find all keyword occurrences that sit on word boundaries.
+
+        Args:
+            text: Lowercase text to scan
+
+        Returns:
+            (start, end, pattern_id) tuples, ordered by end position
+        """
+        hits = []
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+        state = 0
+
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for pattern_id in out[state]:
+                end = pos + 1
+                start = end - len(patterns[pattern_id])
+                if _at_boundary(text, start) and _at_boundary(text, end):
+                    hits.append((start, end, pattern_id))
+
+        return hits
+
+    def count(self, hits: List[Tuple[int, int, int]], start: int = 0, end: int = None) -> Counter:
+        """
+        Count hits per label inside text[start:end].
+
+        Repeated occurrences of a keyword are counted without overlap,
+        left to right, as re.findall would.
+
+        Args:
+            hits: Output of find()
+            start: First position of the region
+            end: End of the region (None for the rest of the text)
+
+        Returns:
+            Counter of label -> number of keyword matches
+        """
+        counts: Counter = Counter()
+        last_end: Dict[int, int] = {}
+
+        for hit_start, hit_end, pattern_id in hits:
+            if hit_start < start or (end is not None and hit_end > end):
+                continue
+            if hit_start < last_end.get(pattern_id, start):
+                continue
+            last_end[pattern_id] = hit_end
+            for label in self._labels[pattern_id]:
+                counts[label] += 1
+
+        return counts
@@ -0,0 +1,395 @@
+"""
+Near-duplicate index for GoalFeed.
+MinHash signatures over title and summary shingles, bucketed with LSH so
+that a new item is compared only against the stories that share a band,
+however many articles the horizon holds.
+"""
+import calendar
+import hashlib
+import logging
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from config import get_config
+from processor.normalize import NormalizedItem
+from utils.text import normalize_title
+from utils.timeutils import iso_to_datetime
+
+logger = logging.getLogger(__name__)
+
+
+# Mersenne prime used by the universal hash family (a * x + b) mod p
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Fixed seed so signatures stay comparable across restarts and snapshots
+PERMUTATION_SEED = 1337
+
+# Summary words used for shingling (leads carry the story, tails drift)
+SUMMARY_MAX_WORDS = 60
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def shingles(normalized_title: str, summary: Optional[str] = None) -> Set[str]:
+    """
+    Build the shingle set of a story.
+
+    Title words and word bigrams capture short headlines; word trigrams of
+    the summary lead separate stories that share a generic headline.
+
+    Args:
+        normalized_title: Normalized title
+        summary: Optional summary text
+
+    Returns:
+        Set of shingle strings
+    """
+    result: Set[str] = set()
+
+    words = _WORD_RE.findall(normalized_title or "")
+    result.update(f"t:{w}" for w in words)
+    result.update(f"t:{a} {b}" for a, b in zip(words, words[1:]))
+
+    if summary:
+        words = _WORD_RE.findall(normalize_title(summary))[:SUMMARY_MAX_WORDS]
+        result.update(f"s:{a} {b} {c}" for a, b, c in zip(words, words[1:], words[2:]))
+
+    return result
+
+
+def _to_timestamp(value) -> Optional[float]:
+    """Convert a DB datetime (naive UTC) or ISO string into a Unix time."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = iso_to_datetime(value)
+    return calendar.timegm(value.utctimetuple())
+
+
+class NearDuplicateIndex:
+    """
+    MinHash + LSH index of recently stored articles.
+
+    Signatures of ``num_perm`` hashes are split into ``bands`` bands; two
+    stories become candidates when any band matches, and are reported as
+    near-duplicates when their estimated Jaccard similarity reaches
+    ``threshold``. Entries older than ``horizon_hours`` are pruned.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        threshold: float = 0.5,
+        horizon_hours: int = 72
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.horizon_hours = horizon_hours
+
+        rng = np.random.RandomState(PERMUTATION_SEED)
+        self._a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._timestamps: Dict[int, float] = {}
+        self._buckets: List[Dict[bytes, Set[int]]] = [{} for _ in range(bands)]
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._signatures
+
+    def signature(self, normalized_title: str, summary: Optional[str] = None) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of a story.
+
+        Args:
+            normalized_title: Normalized title
+            summary: Optional summary text
+
+        Returns:
+            uint64 array of length num_perm, or None if there is no text
+        """
+        tokens = shingles(normalized_title, summary)
+        if not tokens:
+            return None
+
+        # 32-bit shingle hashes keep a * x + b below 2**63 (no overflow)
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(t.encode('utf-8'), digest_size=4).digest(), 'little')
+             for t in tokens),
+            dtype=np.uint64,
+            count=len(tokens)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % np.uint64(MERSENNE_PRIME)
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def insert(
+        self,
+        key: int,
+        normalized_title: str,
+        summary: Optional[str] = None,
+        timestamp: Optional[float] = None
+    ):
+        """
+        Add a story to the index (no-op if the key is already indexed).
+
+        Args:
+            key: Article ID
+            normalized_title: Normalized title
+            summary: Optional summary text
+            timestamp: Unix time the story was stored (defaults to now)
+        """
+        if key in self._signatures:
+            return
+        signature = self.signature(normalized_title, summary)
+        if signature is not None:
+            self._add(key, signature, timestamp or time.time())
+
+    def _add(self, key: int, signature: np.ndarray, timestamp: float):
+        self._signatures[key] = signature
+        self._timestamps[key] = timestamp
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+        self.dirty = True
+
+    def remove(self, key: int):
+        """Remove a story from the index."""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        self._timestamps.pop(key, None)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+        self.dirty = True
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Drop entries older than the horizon.
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = (now or time.time()) - self.horizon_hours * 3600
+        expired = [key for key, ts in self._timestamps.items() if ts < cutoff]
+        for key in expired:
+            self.remove(key)
+        return len(expired)
+
+    def query(
+        self,
+        normalized_title: str,
+        summary: Optional[str] = None
+    ) -> List[tuple]:
+        """
+        Find indexed stories similar to the given one.
+
+        Args:
+            normalized_title: Normalized title
+            summary: Optional summary text
+
+        Returns:
+            List of (article_id, estimated_jaccard), most similar first
+        """
+        if not self._signatures:
+            return []
+
+        signature = self.signature(normalized_title, summary)
+        if signature is None:
+            return []
+
+        candidates: Set[int] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        if not candidates:
+            return []
+
+        keys = list(candidates)
+        similarities = (np.stack([self._signatures[k] for k in keys]) == signature).mean(axis=1)
+        matches = [
+            (key, float(similarity))
+            for key, similarity in zip(keys, similarities)
+            if similarity >= self.threshold
+        ]
+
+        matches.sort(key=lambda m: (-m[1], m[0]))
+        return matches
+
+    def save(self, path: str):
+        """
+        Snapshot the index to disk (atomic replace).
+
+        Args:
+            path: Target .npz file
+        """
+        keys = list(self._signatures)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                keys=np.array(keys, dtype=np.int64),
+                timestamps=np.array([self._timestamps[k] for k in keys], dtype=np.float64),
+                signatures=(
+                    np.stack([self._signatures[k] for k in keys])
+                    if keys else np.empty((0, self.num_perm), dtype=np.uint64)
+                ),
+                params=np.array([self.num_perm, self.bands, PERMUTATION_SEED], dtype=np.int64),
+            )
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+    def load(self, path: str) -> int:
+        """
+        Restore entries from a snapshot, skipping expired ones.
+
+        Snapshots written with different num_perm/bands are ignored.
+
+        Args:
+            path: Snapshot .npz file
+
+        Returns:
+            Number of entries loaded
+        """
+        with np.load(path, allow_pickle=False) as data:
+            params = data['params'].tolist()
+            if params != [self.num_perm, self.bands, PERMUTATION_SEED]:
+                logger.warning(f"Ignoring near-duplicate snapshot with different parameters: {params}")
+                return 0
+
+            cutoff = time.time() - self.horizon_hours * 3600
+            loaded = 0
+            for key, ts, signature in zip(
+                data['keys'].tolist(), data['timestamps'].tolist(), data['signatures']
+            ):
+                if ts >= cutoff and key not in self._signatures:
+                    self._add(key, signature.copy(), ts)
+                    loaded += 1
+
+        self.dirty = False
+        return loaded
+
+    def warm(self, hours: Optional[int] = None) -> int:
+        """
+        Index articles stored within the horizon that are not indexed yet.
+
+        Args:
+            hours: Hours to load (defaults to the horizon)
+
+        Returns:
+            Number of entries added
+        """
+        from db.repo import get_repository
+
+        rows = get_repository().get_recent_articles_for_index(hours or self.horizon_hours)
+        added = 0
+        for row in rows:
+            if row['id'] in self._signatures:
+                continue
+            self.insert(
+                row['id'],
+                row['normalized_title'],
+                row.get('summary'),
+                _to_timestamp(row.get('created_at'))
+            )
+            added += 1
+        return added
+
+
+# Global near-duplicate index instance
+_index_instance: Optional[NearDuplicateIndex] = None
+
+
+def get_near_dup_index() -> Optional[NearDuplicateIndex]:
+    """
+    Get the global near-duplicate index, or None if disabled.
+
+    The first call restores the disk snapshot and tops it up from the
+    articles table.
+    """
+    global _index_instance
+
+    config = get_config()
+    if not config.near_dup_enabled:
+        return None
+
+    if _index_instance is None:
+        index = NearDuplicateIndex(
+            num_perm=config.near_dup_num_perm,
+            bands=config.near_dup_bands,
+            threshold=config.near_dup_threshold,
+            horizon_hours=config.near_dup_horizon_hours,
+        )
+
+        path = config.near_dup_snapshot_path
+        if path and os.path.exists(path):
+            try:
+                loaded = index.load(path)
+                logger.info(f"Near-duplicate index restored {loaded} entries from {path}")
+            except Exception as e:
+                logger.warning(f"Could not load near-duplicate snapshot: {e}")
+
+        try:
+            added = index.warm()
+            logger.info(f"Near-duplicate index warmed with {added} articles ({index.horizon_hours}h)")
+        except Exception as e:
+            logger.warning(f"Could not warm near-duplicate index: {e}")
+
+        _index_instance = index
+
+    return _index_instance
+
+
+def index_items(items: Iterable[NormalizedItem]):
+    """Add stored items (with article_id set) to the near-duplicate index."""
+    index = get_near_dup_index()
+    if index is None:
+        return
+
+    for item in items:
+        article_id = getattr(item, 'article_id', None)
+        if article_id:
+            index.insert(article_id, item.normalized_title, item.summary)
+
+
+def save_near_dup_index():
+    """Prune expired entries and snapshot the index to disk if it changed."""
+    if _index_instance is None:
+        return
+
+    path = get_config().near_dup_snapshot_path
+    _index_instance.prune()
+    if not path or not _index_instance.dirty:
+        return
+
+    try:
+        _index_instance.save(path)
+        logger.debug(f"Near-duplicate index saved ({len(_index_instance)} entries)")
+    except Exception as e:
+        logger.warning(f"Could not save near-duplicate index: {e}")
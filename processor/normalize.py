@@ -15,6 +15,7 @@ from utils.text import (
     clean_html
 )
 from utils.timeutils import get_date_bucket, utc_now
+from processor.seen import filter_seen
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +120,9 @@ def normalize_all(raw_items: list[RawItem]) -> list[NormalizedItem]:
     """
     Normalize a list of raw items.
     
+    Entries already stored as articles are dropped first (seen-entry fast
+    path), so they never reach normalization or deduplication.
+    
     Args:
         raw_items: List of RawItem objects
         
@@ -126,6 +130,8 @@ def normalize_all(raw_items: list[RawItem]) -> list[NormalizedItem]:
         List of NormalizedItem objects
     """
     normalized = []
+    total = len(raw_items)
+    raw_items = filter_seen(raw_items)
     
     for raw_item in raw_items:
         try:
@@ -135,5 +141,5 @@ def normalize_all(raw_items: list[RawItem]) -> list[NormalizedItem]:
             logger.warning(f"Error normalizing item '{raw_item.title[:50]}': {e}")
             continue
     
-    logger.info(f"Normalized {len(normalized)} of {len(raw_items)} items")
+    logger.info(f"Normalized {len(normalized)} of {total} items")
     return normalized
@@ -3,10 +3,11 @@ Ranking module for GoalFeed.
 Calculates importance scores for articles.
 """
 import logging
-from typing import List, Optional
-import re
+from collections import Counter
+from typing import Dict, List, Optional, Set
 
 from config import get_config
+from processor.keywords import KeywordAutomaton
 from processor.normalize import NormalizedItem
 from utils.timeutils import get_recency_minutes
 from db.repo import get_repository
@@ -54,6 +55,14 @@ BIG_ENTITIES = {
 }
 
 
+# Entity matchers per sport, built once at import. Each entity is labelled
+# with its first word so similar entities are only counted once.
+ENTITY_AUTOMATONS = {
+    sport: KeywordAutomaton((entity, entity.split()[0]) for entity in entities)
+    for sport, entities in BIG_ENTITIES.items()
+}
+
+
 # Category score bonuses
 CATEGORY_BONUSES = {
     "breaking": 15,
@@ -122,22 +131,15 @@ def calculate_entity_score(item: NormalizedItem) -> int:
     Returns:
         Entity score (0-25)
     """
-    text = (item.title + " " + (item.summary or "")).lower()
-    sport = item.sport
-    
-    entities = BIG_ENTITIES.get(sport, [])
+    automaton = ENTITY_AUTOMATONS.get(item.sport)
+    if automaton is None:
+        return 0
     
-    matches = 0
-    matched_entities = set()
+    text = (item.title + " " + (item.summary or "")).lower()
     
-    for entity in entities:
-        pattern = r'\b' + re.escape(entity.lower()) + r'\b'
-        if re.search(pattern, text):
-            # Avoid double-counting similar entities
-            base_entity = entity.split()[0]  # First word
-            if base_entity not in matched_entities:
-                matches += 1
-                matched_entities.add(base_entity)
+    # Avoid double-counting similar entities: one match per first word
+    matched_entities = automaton.count(automaton.find(text))
+    matches = len(matched_entities)
     
     # Score: 5 points per entity, max 25
     return min(25, matches * 5)
@@ -156,38 +158,84 @@ def calculate_category_score(item: NormalizedItem) -> int:
     return CATEGORY_BONUSES.get(item.category, 0)
 
 
-def calculate_repetition_penalty(item: NormalizedItem) -> int:
+# Common words needed for a recent post to count as the same topic
+REPETITION_MIN_OVERLAP = 3
+
+
+class RepetitionIndex:
+    """
+    Inverted index of recently posted titles (token -> post positions).
+    
+    Built once per ranking cycle so each item costs one lookup per title
+    token instead of a DB query plus a pass over every post.
+    """
+    
+    def __init__(self, recent_posts: List[Dict]):
+        self.postings: Dict[str, Set[int]] = {}
+        
+        for position, post in enumerate(recent_posts):
+            if not post.get('article_title'):
+                continue
+            
+            for token in set(post['article_title'].lower().split()):
+                self.postings.setdefault(token, set()).add(position)
+    
+    def similar_count(self, tokens: Set[str], min_overlap: int = REPETITION_MIN_OVERLAP) -> int:
+        """
+        Count recent posts sharing at least min_overlap tokens.
+        
+        Args:
+            tokens: Distinct tokens of the item title
+            min_overlap: Minimum number of common tokens
+            
+        Returns:
+            Number of similar recent posts
+        """
+        overlaps = Counter()
+        for token in tokens:
+            overlaps.update(self.postings.get(token, ()))
+        
+        return sum(1 for count in overlaps.values() if count >= min_overlap)
+
+
+def build_repetition_index(hours: int = 24) -> RepetitionIndex:
+    """
+    Load recent posts once and index their titles.
+    
+    Args:
+        hours: Hours of posts to index
+        
+    Returns:
+        RepetitionIndex (empty if posts could not be loaded)
+    """
+    try:
+        return RepetitionIndex(get_repository().get_recent_posts(hours=hours))
+    except Exception as e:
+        logger.warning(f"Error loading recent posts for repetition penalty: {e}")
+        return RepetitionIndex([])
+
+
+def calculate_repetition_penalty(
+    item: NormalizedItem,
+    index: Optional[RepetitionIndex] = None
+) -> int:
     """
     Calculate repetition penalty (-10 to 0).
     Penalize if similar articles already posted today.
     
     Args:
         item: NormalizedItem to check
+        index: Per-cycle index of recent posts (loaded here if not provided)
         
     Returns:
         Penalty (negative value or 0)
     """
     try:
-        repo = get_repository()
-        
-        # Get recent posted articles
-        recent_posts = repo.get_recent_posts(hours=24)
-        
-        # Check for similar topics
-        similar_count = 0
-        item_keywords = set(item.normalized_title.split())
+        if index is None:
+            index = RepetitionIndex(get_repository().get_recent_posts(hours=24))
         
-        for post in recent_posts:
-            if not post.get('article_title'):
-                continue
-            
-            post_title = post['article_title'].lower()
-            post_keywords = set(post_title.split())
-            
-            # Check overlap
-            overlap = len(item_keywords & post_keywords)
-            if overlap >= 3:  # At least 3 common words
-                similar_count += 1
+        # Check for similar topics (at least 3 common words)
+        similar_count = index.similar_count(set(item.normalized_title.split()))
         
         # Penalty for repeated topics
         if similar_count >= 2:
@@ -202,7 +250,7 @@ def calculate_repetition_penalty(item: NormalizedItem) -> int:
         return 0
 
 
-def calculate_score(item: NormalizedItem) -> int:
+def calculate_score(item: NormalizedItem, repetition_index: Optional[RepetitionIndex] = None) -> int:
     """
     Calculate total importance score (0-100).
     
@@ -215,6 +263,7 @@ def calculate_score(item: NormalizedItem) -> int:
     
     Args:
         item: NormalizedItem to score
+        repetition_index: Per-cycle index of recent posts
         
     Returns:
         Total score (0-100)
@@ -223,7 +272,7 @@ def calculate_score(item: NormalizedItem) -> int:
     source = calculate_source_score(item)
     entity = calculate_entity_score(item)
     category = calculate_category_score(item)
-    penalty = calculate_repetition_penalty(item)
+    penalty = calculate_repetition_penalty(item, repetition_index)
     
     total = recency + source + entity + category + penalty
     
@@ -239,17 +288,18 @@ def calculate_score(item: NormalizedItem) -> int:
     return total
 
 
-def rank_item(item: NormalizedItem) -> NormalizedItem:
+def rank_item(item: NormalizedItem, repetition_index: Optional[RepetitionIndex] = None) -> NormalizedItem:
     """
     Calculate and set the score for an item.
     
     Args:
         item: NormalizedItem to rank
+        repetition_index: Per-cycle index of recent posts
         
     Returns:
         Same item with score set
     """
-    item.score = calculate_score(item)
+    item.score = calculate_score(item, repetition_index)
     return item
 
 
@@ -263,9 +313,12 @@ def rank_all(items: list[NormalizedItem]) -> list[NormalizedItem]:
     Returns:
         List sorted by score (descending)
     """
+    # Recent posts are loaded and indexed once for the whole cycle
+    repetition_index = build_repetition_index(hours=24) if items else None
+    
     for item in items:
         try:
-            rank_item(item)
+            rank_item(item, repetition_index)
         except Exception as e:
             logger.warning(f"Error ranking item '{item.title[:50]}': {e}")
             item.score = 0
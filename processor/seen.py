@@ -0,0 +1,214 @@
+"""
+Seen-entry fast path for GoalFeed.
+Remembers the canonical URLs of entries stored as articles within the
+history horizon so that repeats can be dropped before normalization and
+deduplication.
+"""
+import hashlib
+import logging
+import math
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+from config import get_config
+from collector.rss_collector import RawItem
+from utils.text import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Uses less memory than a set for large histories, at the cost of a small
+    false-positive rate (a false positive drops a genuinely new entry).
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(1, capacity)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        # Enhanced double hashing (Dillinger & Manolios)
+        for i in range(self.num_hashes):
+            yield h1 % self.num_bits
+            h1 += h2
+            h2 += i
+
+    def add(self, value: str):
+        for pos in self._positions(value):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class SeenEntries:
+    """
+    Membership set of canonical URLs already stored as articles.
+
+    Entries live in time buckets (``buckets`` slices of ``horizon_hours``);
+    whole buckets are dropped once older than the horizon, so memory stays
+    bounded for the life of the bot. A URL that aged out simply falls
+    through to the database check in the dedupe stage.
+    """
+
+    def __init__(
+        self,
+        use_bloom: bool = False,
+        capacity: int = 500000,
+        error_rate: float = 1e-6,
+        horizon_hours: float = 168,
+        buckets: int = 7
+    ):
+        self.use_bloom = use_bloom
+        self.buckets = max(1, buckets)
+        # Each Bloom bucket takes its share of the capacity and error budget
+        self.bucket_capacity = max(1, capacity // self.buckets)
+        self.bucket_error_rate = error_rate / self.buckets
+        self.horizon_seconds = horizon_hours * 3600
+        self.bucket_seconds = self.horizon_seconds / self.buckets
+        # (bucket start, entries, entry count), oldest first
+        self._buckets: deque = deque()
+        self.warmed = False
+
+    def _new_container(self):
+        if self.use_bloom:
+            return BloomFilter(self.bucket_capacity, self.bucket_error_rate)
+        return set()
+
+    def _expire(self, now: float):
+        while self._buckets and self._buckets[0][0] + self.bucket_seconds + self.horizon_seconds <= now:
+            self._buckets.popleft()
+
+    def _current(self, now: float) -> list:
+        self._expire(now)
+        if not self._buckets or now - self._buckets[-1][0] >= self.bucket_seconds:
+            self._buckets.append([now, self._new_container(), 0])
+        return self._buckets[-1]
+
+    @property
+    def size(self) -> int:
+        return sum(bucket[2] for bucket in self._buckets)
+
+    def add(self, canonical_url: str):
+        """Mark a canonical URL as seen."""
+        if canonical_url and canonical_url not in self:
+            bucket = self._current(time.time())
+            bucket[1].add(canonical_url)
+            bucket[2] += 1
+
+    def add_many(self, canonical_urls: Iterable[str]):
+        """Mark several canonical URLs as seen."""
+        for url in canonical_urls:
+            self.add(url)
+
+    def __contains__(self, canonical_url: str) -> bool:
+        if not canonical_url:
+            return False
+        self._expire(time.time())
+        return any(canonical_url in bucket[1] for bucket in reversed(self._buckets))
+
+    def __len__(self) -> int:
+        self._expire(time.time())
+        return self.size
+
+    def warm(self, hours: int):
+        """
+        Load canonical URLs of recently stored articles.
+
+        Args:
+            hours: How many hours of article history to load
+        """
+        from db.repo import get_repository
+
+        urls = get_repository().get_recent_canonical_urls(hours=hours)
+        self.add_many(urls)
+        self.warmed = True
+        logger.info(f"Seen-entry cache warmed with {len(urls)} URLs ({hours}h)")
+
+
+# Global seen-entry instance
+_seen_instance: Optional[SeenEntries] = None
+
+
+def get_seen_entries() -> Optional[SeenEntries]:
+    """Get the global seen-entry cache, or None if disabled."""
+    global _seen_instance
+
+    config = get_config()
+    if not config.seen_filter_enabled:
+        return None
+
+    if _seen_instance is None:
+        _seen_instance = SeenEntries(
+            use_bloom=config.seen_filter_bloom,
+            capacity=config.seen_filter_capacity,
+            error_rate=config.seen_filter_error_rate,
+            horizon_hours=config.seen_filter_warm_hours,
+        )
+
+    return _seen_instance
+
+
+def warm_seen_entries() -> Optional[SeenEntries]:
+    """Warm the global seen-entry cache from the articles table."""
+    seen = get_seen_entries()
+    if seen is not None and not seen.warmed:
+        try:
+            seen.warm(hours=get_config().seen_filter_warm_hours)
+        except Exception as e:
+            logger.warning(f"Could not warm seen-entry cache: {e}")
+    return seen
+
+
+def mark_seen(canonical_urls: Iterable[str]):
+    """Record canonical URLs that now exist in the articles table."""
+    seen = get_seen_entries()
+    if seen is not None:
+        seen.add_many(canonical_urls)
+
+
+def filter_seen(raw_items: list[RawItem]) -> list[RawItem]:
+    """
+    Drop raw items whose canonical URL is already stored as an article.
+
+    These would be rejected as ``url_duplicate`` by the dedupe stage anyway.
+
+    Args:
+        raw_items: List of RawItem objects
+
+    Returns:
+        Items not seen before
+    """
+    seen = get_seen_entries()
+    if seen is None or not len(seen):
+        return raw_items
+
+    fresh = []
+    for raw_item in raw_items:
+        try:
+            if canonicalize_url(raw_item.link) in seen:
+                continue
+        except Exception:
+            pass
+        fresh.append(raw_item)
+
+    skipped = len(raw_items) - len(fresh)
+    if skipped:
+        logger.info(f"Skipped {skipped} already-seen entries")
+        # Still URL duplicates as far as the daily stats are concerned
+        try:
+            from db.repo import get_repository
+            get_repository().increment_articles_duplicated(skipped)
+        except Exception:
+            pass
+
+    return fresh
@@ -1,6 +1,7 @@
 """Scheduler module for GoalFeed."""
 from .rules import RulesChecker, get_rules_checker
 from .planner import Planner, PublishPlan, PostType, get_planner
+from .poll_scheduler import PollScheduler, PollState, get_poll_scheduler
 
 __all__ = [
     'RulesChecker',
@@ -8,5 +9,8 @@ __all__ = [
     'Planner',
     'PublishPlan',
     'PostType',
-    'get_planner'
+    'get_planner',
+    'PollScheduler',
+    'PollState',
+    'get_poll_scheduler'
 ]
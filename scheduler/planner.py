@@ -11,6 +11,8 @@ from config import get_config
 from processor.normalize import NormalizedItem
 from scheduler.rules import get_rules_checker
 from db.repo import get_repository, ArticleRecord
+from processor.seen import mark_seen
+from processor.near_dup import index_items
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,25 @@ class Planner:
         self.rules = get_rules_checker()
         self.repo = get_repository()
     
+    def _to_record(self, item: NormalizedItem) -> ArticleRecord:
+        """Build the ArticleRecord stored for a candidate item."""
+        return ArticleRecord(
+            title=item.title,
+            normalized_title=item.normalized_title,
+            link=item.link,
+            canonical_url=item.canonical_url,
+            summary=item.summary,
+            published_at=item.published_at.isoformat() if item.published_at else None,
+            sport=item.sport,
+            category=item.category,
+            status=item.status,
+            score=item.score,
+            content_hash=item.content_hash,
+            image_url=item.image_url,
+            source_name=item.source_name,
+            source_domain=item.source_domain
+        )
+    
     def save_candidates(self, items: List[NormalizedItem]) -> List[int]:
         """
         Save candidate articles to database.
@@ -52,35 +73,34 @@ class Planner:
         Returns:
             List of article IDs
         """
+        records = [self._to_record(item) for item in items]
+        
+        try:
+            # One transaction with multi-row upserts for the whole cycle
+            saved = self.repo.upsert_articles(records)
+        except Exception as e:
+            logger.error(f"Bulk article save failed, saving one by one: {e}")
+            saved = []
+            for record in records:
+                try:
+                    saved.append(self.repo.upsert_article(record))
+                except Exception as e:
+                    logger.error(f"Error saving article: {e}")
+                    saved.append(None)
+        
         article_ids = []
+        saved_items = []
+        for item, article_id in zip(items, saved):
+            if not article_id:
+                continue
+            article_ids.append(article_id)
+            saved_items.append(item)
+            
+            # Store ID in item for later use
+            item.article_id = article_id
         
-        for item in items:
-            try:
-                record = ArticleRecord(
-                    title=item.title,
-                    normalized_title=item.normalized_title,
-                    link=item.link,
-                    canonical_url=item.canonical_url,
-                    summary=item.summary,
-                    published_at=item.published_at.isoformat() if item.published_at else None,
-                    sport=item.sport,
-                    category=item.category,
-                    status=item.status,
-                    score=item.score,
-                    content_hash=item.content_hash,
-                    image_url=item.image_url,
-                    source_name=item.source_name,
-                    source_domain=item.source_domain
-                )
-                
-                article_id = self.repo.upsert_article(record)
-                article_ids.append(article_id)
-                
-                # Store ID in item for later use
-                item.article_id = article_id
-                
-            except Exception as e:
-                logger.error(f"Error saving article: {e}")
+        mark_seen(item.canonical_url for item in saved_items)
+        index_items(saved_items)
         
         if article_ids:
             self.repo.increment_articles_fetched(len(article_ids))
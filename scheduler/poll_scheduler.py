@@ -0,0 +1,206 @@
+"""
+Adaptive feed polling for GoalFeed.
+Learns each source's publish cadence and decides when to poll it next.
+"""
+import logging
+import statistics
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import pytz
+
+from config import get_config
+from collector.rss_collector import FetchResult
+from db.repo import get_repository
+from utils.timeutils import utc_now, datetime_to_iso, iso_to_datetime
+
+logger = logging.getLogger(__name__)
+
+
+# How many of the newest entries are used to estimate the publish gap
+CADENCE_SAMPLE_SIZE = 20
+
+# Weight of the newest cadence estimate in the moving average
+CADENCE_SMOOTHING = 0.5
+
+# Poll roughly twice per expected new entry
+POLLS_PER_ENTRY = 2
+
+
+@dataclass
+class PollState:
+    """Polling state of a source, persisted in the sources table."""
+    poll_interval_seconds: int
+    next_poll_at: Optional[datetime] = None
+    last_entry_at: Optional[datetime] = None
+    unchanged_streak: int = 0
+
+
+def _as_utc(value) -> Optional[datetime]:
+    """Coerce a DB value (datetime or ISO string) into an aware UTC datetime."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = iso_to_datetime(value)
+    if value.tzinfo is None:
+        return pytz.UTC.localize(value)
+    return value.astimezone(pytz.UTC)
+
+
+def estimate_publish_gap(published: List[datetime]) -> Optional[float]:
+    """
+    Estimate the typical gap between entries of a feed.
+
+    Args:
+        published: Entry publication datetimes (any order)
+
+    Returns:
+        Median gap in seconds, or None if there is not enough data
+    """
+    newest = sorted(published, reverse=True)[:CADENCE_SAMPLE_SIZE]
+    gaps = [
+        (a - b).total_seconds()
+        for a, b in zip(newest, newest[1:])
+        if a > b
+    ]
+    if not gaps:
+        return None
+    return statistics.median(gaps)
+
+
+class PollScheduler:
+    """
+    Per-source adaptive polling scheduler.
+
+    Sources that publish often are polled down to ``min_poll_seconds``;
+    sources that keep answering 304 or with nothing new back off
+    geometrically up to ``max_poll_seconds``.
+    """
+
+    def __init__(self):
+        self.config = get_config()
+        self.repo = get_repository()
+
+    def _bound(self, seconds: float) -> int:
+        """Clamp an interval to the configured bounds."""
+        collector = self.config.collector
+        return int(max(collector.min_poll_seconds, min(collector.max_poll_seconds, seconds)))
+
+    def load_state(self, row: Dict) -> PollState:
+        """Build a PollState from a sources row."""
+        return PollState(
+            poll_interval_seconds=self._bound(
+                row.get('poll_interval_seconds') or self.config.poll_interval_seconds
+            ),
+            next_poll_at=_as_utc(row.get('next_poll_at')),
+            last_entry_at=_as_utc(row.get('last_entry_at')),
+            unchanged_streak=row.get('unchanged_streak') or 0,
+        )
+
+    def is_due(self, row: Dict, now: Optional[datetime] = None) -> bool:
+        """Check whether a source should be polled now."""
+        next_poll_at = _as_utc(row.get('next_poll_at'))
+        if next_poll_at is None:
+            return True
+        return next_poll_at <= (now or utc_now())
+
+    def due_sources(self, rows: List[Dict]) -> List[Dict]:
+        """Filter source rows down to those due for polling."""
+        now = utc_now()
+        return [row for row in rows if self.is_due(row, now)]
+
+    def next_state(self, state: PollState, result: FetchResult) -> PollState:
+        """
+        Compute the polling state after a fetch.
+
+        Args:
+            state: State before the fetch
+            result: Outcome of the fetch
+
+        Returns:
+            New PollState
+        """
+        now = utc_now()
+        interval = state.poll_interval_seconds
+        last_entry_at = state.last_entry_at
+        streak = state.unchanged_streak
+
+        published = [_as_utc(i.published) for i in result.items if i.published]
+        newest = max(published) if published else None
+        has_new = newest is not None and (last_entry_at is None or newest > last_entry_at)
+
+        if not result.ok:
+            # Keep the cadence, just retry a bit later
+            interval = self._bound(interval * self.config.collector.poll_backoff_factor)
+        elif result.not_modified or not has_new:
+            streak += 1
+            interval = self._bound(interval * self.config.collector.poll_backoff_factor)
+        else:
+            streak = 0
+            last_entry_at = newest
+            gap = estimate_publish_gap(published)
+            if gap is not None:
+                target = gap / POLLS_PER_ENTRY
+                interval = self._bound(
+                    CADENCE_SMOOTHING * target + (1 - CADENCE_SMOOTHING) * interval
+                )
+
+        return PollState(
+            poll_interval_seconds=interval,
+            next_poll_at=now + timedelta(seconds=interval),
+            last_entry_at=last_entry_at,
+            unchanged_streak=streak,
+        )
+
+    def record_results(self, results: List[FetchResult], rows: List[Dict]):
+        """
+        Persist HTTP validators and the next polling state for each fetch.
+
+        Call once the cycle's candidates are saved: a cycle that fails before
+        that leaves validators, next_poll_at and the unchanged streak as they
+        were, so the sources are polled again next cycle without backing off.
+
+        Args:
+            results: Fetch results of this cycle
+            rows: Source rows the results were fetched from
+        """
+        rows_by_id = {row['id']: row for row in rows}
+
+        for result in results:
+            source_id = result.source.source_id
+            if not source_id:
+                continue
+
+            try:
+                if not self.config.collector.adaptive_polling:
+                    if result.ok:
+                        self.repo.update_source_fetched(
+                            source_id,
+                            etag=result.etag,
+                            last_modified=result.last_modified
+                        )
+                    continue
+
+                state = self.next_state(self.load_state(rows_by_id.get(source_id, {})), result)
+                self.repo.update_source_poll_state(
+                    source_id,
+                    etag=result.etag,
+                    last_modified=result.last_modified,
+                    poll_interval_seconds=state.poll_interval_seconds,
+                    next_poll_at=datetime_to_iso(state.next_poll_at),
+                    last_entry_at=datetime_to_iso(state.last_entry_at) if state.last_entry_at else None,
+                    unchanged_streak=state.unchanged_streak,
+                    fetched=result.ok
+                )
+                logger.debug(
+                    f"Next poll for {result.source.name} in {state.poll_interval_seconds}s "
+                    f"(unchanged streak={state.unchanged_streak})"
+                )
+            except Exception as e:
+                logger.warning(f"Could not update polling state for {result.source.name}: {e}")
+
+
+def get_poll_scheduler() -> PollScheduler:
+    """Get a PollScheduler instance."""
+    return PollScheduler()
@@ -3,6 +3,7 @@ FastAPI application factory for GoalFeed Web Portal.
 """
 import os
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
@@ -12,6 +13,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from config import get_config, SPORT_DISPLAY, STATUS_CONFIG
+from db.database import RoundTripStats, request_round_trips
 from web.i18n import t, get_lang, get_js_translations
 from web.auth import get_current_user
 
@@ -110,6 +112,16 @@ WEB_ICONS = {
 del _S, _SL
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Flush write-behind state when the server shuts down."""
+    yield
+    from web.view_counter import get_view_counter
+    from web.page_cache import get_page_cache
+    get_view_counter().stop()
+    get_page_cache().log_stats()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     config = get_config()
@@ -119,11 +131,33 @@ def create_app() -> FastAPI:
         description="Portal de noticias deportivas",
         docs_url=None,
         redoc_url=None,
+        lifespan=lifespan,
     )
 
     # Middleware
     app.add_middleware(GZipMiddleware, minimum_size=500)
 
+    @app.middleware("http")
+    async def db_round_trips(request: Request, call_next):
+        """Count DB round-trips (and those saved by read-only mode) per request."""
+        stats = RoundTripStats()
+        token = request_round_trips.set(stats)
+        try:
+            response = await call_next(request)
+        finally:
+            request_round_trips.reset(token)
+
+        if stats.queries:
+            # Internal detail: never sent to clients (or CDNs) unless asked for
+            if config.web.debug_headers:
+                response.headers["X-DB-Round-Trips"] = str(stats.round_trips)
+                response.headers["X-DB-Round-Trips-Saved"] = str(stats.saved)
+            logger.debug(
+                f"{request.method} {request.url.path}: {stats.queries} queries, "
+                f"{stats.round_trips} round-trips ({stats.saved} saved)"
+            )
+        return response
+
     # Static files
     STATIC_DIR.mkdir(parents=True, exist_ok=True)
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
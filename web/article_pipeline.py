@@ -10,6 +10,7 @@ from typing import Optional
 from config import get_config
 from db import get_repository, WebArticleRecord
 from web.image_service import save_article_image
+from web.page_cache import invalidate_page_cache
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +146,9 @@ def create_web_article_from_item(item) -> Optional[int]:
         web_id = repo.insert_web_article(web_article)
         logger.info(f"Created web article: {slug} (id={web_id})")
 
+        # New article on home/category pages; drop cached HTML everywhere
+        invalidate_page_cache()
+
         # Save team associations
         teams = getattr(item, 'teams', None)
         if teams and web_id:
@@ -4,21 +4,28 @@ Password hashing, session management, and current-user resolution.
 """
 import secrets
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
 import bcrypt
 from fastapi import Request
 from fastapi.responses import Response
 
 from db import get_repository
-from utils.timeutils import utc_now, datetime_to_iso
+from utils.timeutils import utc_now, datetime_to_iso, iso_to_datetime
 
 logger = logging.getLogger(__name__)
 
 SESSION_COOKIE = "gf_session"
 SESSION_MAX_AGE_DAYS = 30
 
+# request.state attribute holding the user resolved for the current request
+_REQUEST_USER_ATTR = "gf_current_user"
+_MISSING = object()
+
 
 # ── Password hashing ──
 
@@ -61,17 +68,123 @@ def create_session(user_id: int, response: Response) -> str:
     return token
 
 
+class SessionCache:
+    """
+    TTL + LRU cache of session token -> user (None for unknown tokens).
+
+    An entry never outlives its session's expires_at. Logout drops the
+    entry in this process; other worker processes notice within
+    ``ttl_seconds``, which is why the TTL is kept short.
+    """
+
+    def __init__(self, ttl_seconds: float = 30, max_entries: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Look up a session token.
+
+        Returns:
+            (found, user); user is None for a token known to be invalid
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[token]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, token: str, user: Optional[Dict], session_expires_at=None):
+        """
+        Cache the lookup result for a token.
+
+        Args:
+            token: Session token
+            user: User dict, or None if the session is invalid
+            session_expires_at: When the session expires (datetime in UTC
+                or ISO string); caps the entry's lifetime
+        """
+        ttl = self.ttl_seconds
+        if session_expires_at:
+            if isinstance(session_expires_at, str):
+                session_expires_at = iso_to_datetime(session_expires_at)
+            if session_expires_at.tzinfo is None:
+                session_expires_at = session_expires_at.replace(tzinfo=utc_now().tzinfo)
+            ttl = min(ttl, (session_expires_at - utc_now()).total_seconds())
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[token] = (time.monotonic() + ttl, user)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token: str):
+        """Forget a token (after logout)."""
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Global session cache instance
+_session_cache: Optional[SessionCache] = None
+
+
+def get_session_cache() -> SessionCache:
+    """Get or create the process-wide session cache."""
+    global _session_cache
+
+    if _session_cache is None:
+        from config import get_config
+        web = get_config().web
+        _session_cache = SessionCache(
+            ttl_seconds=web.session_cache_seconds,
+            max_entries=web.session_cache_max_entries,
+        )
+
+    return _session_cache
+
+
 def get_current_user(request: Request) -> Optional[Dict]:
     """
     Read the session cookie, look up the session in the DB,
     and return the user dict (or None if not authenticated).
+
+    The result is memoized on the request (routes and templates may call
+    this several times per render) and cached per token for a short TTL.
     """
     token = request.cookies.get(SESSION_COOKIE)
     if not token:
         return None
 
-    repo = get_repository()
-    user = repo.get_user_by_session(token)
+    user = getattr(request.state, _REQUEST_USER_ATTR, _MISSING)
+    if user is not _MISSING:
+        return user
+
+    cache = get_session_cache()
+    found, user = cache.get(token)
+    if not found:
+        repo = get_repository()
+        user = repo.get_user_by_session(token)
+        expires_at = user.pop("session_expires_at", None) if user else None
+        cache.set(token, user, expires_at)
+
+    setattr(request.state, _REQUEST_USER_ATTR, user)
     return user
 
 
@@ -81,6 +194,8 @@ def destroy_session(request: Request, response: Response):
     if token:
         repo = get_repository()
         repo.delete_session(token)
+        get_session_cache().invalidate(token)
+        setattr(request.state, _REQUEST_USER_ATTR, None)
 
     response.delete_cookie(SESSION_COOKIE, path="/")
 
@@ -0,0 +1,64 @@
+"""
+Conditional responses for the GoalFeed web portal.
+Strong ETags built from cheap content version stamps, so a matching
+If-None-Match gets a 304 before anything is queried, rendered or serialized.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+# Cache-Control per resource: shared caches (CDN / reverse proxy) may keep
+# responses for max-age and must revalidate with the ETag afterwards
+LIVE_CACHE_CONTROL = "public, max-age=5, must-revalidate"
+ARTICLES_CACHE_CONTROL = "public, max-age=30, must-revalidate"
+SITEMAP_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from version parts (version stamp, query params...).
+
+    Returns:
+        Quoted ETag value
+    """
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match lists etag (or is *)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    # Weak comparison as RFC 9110 requires for If-None-Match
+    return "*" in candidates or any(
+        (value[2:] if value.startswith("W/") else value) == etag for value in candidates
+    )
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Optional[Response]:
+    """
+    Return a 304 response if the client already has this version.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        cache_control: Cache-Control value to repeat on the 304
+
+    Returns:
+        304 Response, or None if the full response must be sent
+    """
+    if not etag_matches(request, etag):
+        return None
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def with_validators(response: Response, etag: str, cache_control: str) -> Response:
+    """Attach ETag and Cache-Control to a full response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return response
@@ -0,0 +1,122 @@
+"""
+Shared live-matches snapshot for the GoalFeed web portal.
+One materialized copy of the active matches and their events, with the
+/api/live JSON body pre-serialized, rebuilt only when the live data
+changes. Every viewer of /live, /api/live and the SSE stream reads it.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+from db import get_async_repository
+from live.broadcaster import LiveBroadcaster, get_live_broadcaster
+from web.conditional import make_etag
+
+logger = logging.getLogger(__name__)
+
+
+class LiveSnapshot:
+    """
+    Active matches with events, their JSON body and ETag.
+
+    The live cycle publishing through the broadcaster (same process)
+    marks the snapshot stale at once; writes from another process are
+    picked up by a version check made at most every ``check_seconds``.
+    Concurrent refreshes share one check (and one rebuild).
+    """
+
+    def __init__(self, broadcaster: LiveBroadcaster, check_seconds: float = 5):
+        self.broadcaster = broadcaster
+        self.check_seconds = check_seconds
+
+        self.version: Optional[str] = None
+        self.matches: List[Dict] = []
+        self.body: bytes = b'{"matches": []}'
+        self.etag: str = make_etag("live", None)
+
+        self._checked = 0.0
+        self._changes = -1
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.rebuilds = 0
+
+    def _is_stale(self) -> bool:
+        return (
+            self.version is None
+            or self.broadcaster.changes != self._changes
+            or time.monotonic() - self._checked >= self.check_seconds
+        )
+
+    def _get_lock(self) -> asyncio.Lock:
+        # One lock per event loop (Passenger runs each request on a new loop)
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Rebuild the snapshot if the live data changed.
+
+        Args:
+            force: Check the version even if the snapshot looks fresh
+
+        Returns:
+            True if the snapshot was rebuilt
+        """
+        if not force and not self._is_stale():
+            return False
+
+        checked = self._checked
+        async with self._get_lock():
+            # Another request checked while this one waited for the lock
+            if self._checked != checked and not self._is_stale():
+                return False
+            return await self._refresh()
+
+    async def _refresh(self) -> bool:
+        repo = get_async_repository()
+        changes = self.broadcaster.changes
+        version = await repo.get_live_version()
+        self._checked = time.monotonic()
+        self._changes = changes
+
+        if version == self.version:
+            return False
+
+        matches = await repo.get_active_live_matches_with_events()
+        self.matches = jsonable_encoder(matches)
+        self.body = json.dumps({"matches": self.matches}, ensure_ascii=False).encode("utf-8")
+        self.etag = make_etag("live", version)
+        self.version = version
+        self.rebuilds += 1
+        logger.debug(f"Live snapshot rebuilt: {len(matches)} matches, {len(self.body)} bytes")
+        return True
+
+    async def get(self) -> "LiveSnapshot":
+        """The current snapshot, refreshed first if it may be stale."""
+        await self.refresh()
+        return self
+
+
+# Global live snapshot instance
+_snapshot_instance: Optional[LiveSnapshot] = None
+
+
+def get_live_snapshot() -> LiveSnapshot:
+    """Get or create the global live snapshot."""
+    global _snapshot_instance
+
+    if _snapshot_instance is None:
+        from config import get_config
+        _snapshot_instance = LiveSnapshot(
+            get_live_broadcaster(),
+            check_seconds=get_config().live.stream_poll_seconds,
+        )
+
+    return _snapshot_instance
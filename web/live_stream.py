@@ -0,0 +1,105 @@
+"""
+Server-Sent Events stream of live matches for the GoalFeed web portal.
+Browsers get a snapshot on connect and then the deltas pushed through the
+live broadcaster. A single version check per process (not per viewer)
+covers updates written by a live cycle running in another process.
+"""
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Optional
+
+from fastapi import Request
+
+from live.broadcaster import LiveBroadcaster, get_live_broadcaster
+from web.live_snapshot import get_live_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(message_id: Optional[int], message_type: str, data) -> str:
+    """Encode one SSE message."""
+    lines = []
+    if message_id is not None:
+        lines.append(f"id: {message_id}")
+    lines.append(f"event: {message_type}")
+    lines.append(f"data: {json.dumps(data, default=str, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class LiveStream:
+    """Feeds SSE connections from the broadcaster plus a shared version watcher."""
+
+    def __init__(
+        self,
+        broadcaster: LiveBroadcaster,
+        poll_seconds: float = 5,
+        heartbeat_seconds: float = 15
+    ):
+        self.broadcaster = broadcaster
+        self.poll_seconds = poll_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self._watcher: Optional[asyncio.Task] = None
+
+    async def _watch(self):
+        """Publish a fresh snapshot whenever the live data version changes."""
+        snapshot = get_live_snapshot()
+        published = snapshot.version
+        while self.broadcaster.subscriber_count:
+            await asyncio.sleep(self.poll_seconds)
+            try:
+                await snapshot.refresh(force=True)
+                # Also covers rebuilds triggered by a /api/live request
+                if snapshot.version != published:
+                    published = snapshot.version
+                    self.broadcaster.publish("snapshot", snapshot.matches)
+            except Exception as e:
+                logger.warning(f"Live stream version check failed: {e}")
+        self._watcher = None
+
+    def _ensure_watcher(self):
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.get_running_loop().create_task(self._watch())
+
+    async def events(self, request: Request) -> AsyncIterator[str]:
+        """SSE body for one client."""
+        subscription = self.broadcaster.subscribe()
+        self._ensure_watcher()
+        try:
+            yield f"retry: {int(self.poll_seconds * 1000)}\n\n"
+            yield format_sse(None, "snapshot", (await get_live_snapshot().get()).matches)
+
+            while not await request.is_disconnected():
+                message = await subscription.get(self.heartbeat_seconds)
+
+                if subscription.overflowed:
+                    while not subscription.queue.empty():
+                        subscription.queue.get_nowait()
+                    subscription.overflowed = False
+                    yield format_sse(None, "snapshot", (await get_live_snapshot().get()).matches)
+                elif message is None:
+                    yield ": ping\n\n"
+                else:
+                    yield format_sse(*message)
+        finally:
+            self.broadcaster.unsubscribe(subscription)
+
+
+# Global live stream instance
+_stream_instance: Optional[LiveStream] = None
+
+
+def get_live_stream() -> LiveStream:
+    """Get or create the global live stream."""
+    global _stream_instance
+
+    if _stream_instance is None:
+        from config import get_config
+        live = get_config().live
+        _stream_instance = LiveStream(
+            get_live_broadcaster(),
+            poll_seconds=live.stream_poll_seconds,
+            heartbeat_seconds=live.stream_heartbeat_seconds,
+        )
+
+    return _stream_instance
@@ -0,0 +1,307 @@
+"""
+Rendered-page cache for the GoalFeed web portal.
+Keeps the HTML of home, category and article pages for a short TTL, keyed
+by path, query string and language. Content only changes when the pipeline
+publishes, so publishing bumps a version file that every web worker checks;
+the bot and the web server run as separate processes. A single page (an
+article that got a comment) is evicted through a per-path marker file.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+
+from web.auth import SESSION_COOKIE
+from web.i18n import get_lang
+
+logger = logging.getLogger(__name__)
+
+
+# How often the shared version file is stat()ed, at most
+VERSION_CHECK_SECONDS = 1.0
+
+
+class PageCache:
+    """
+    TTL + LRU cache of rendered HTML.
+
+    Requests carrying a session cookie bypass the cache, since pages embed
+    the logged-in user (nav, comment form). Entries are dropped when the
+    version changes (see invalidate), when their path is evicted (see
+    invalidate_path) or after ``ttl_seconds``. With
+    ``disk_dir`` set, pages are also stored on disk so that every worker
+    process of the server shares them.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60,
+        max_entries: int = 500,
+        version_path: Optional[str] = None,
+        disk_dir: Optional[str] = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version_path = version_path
+        self.disk_dir = disk_dir
+
+        self._entries: "OrderedDict[str, Tuple[float, Tuple, int, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._file_version = 0
+        self._version_checked = 0.0
+        self._path_versions: Dict[str, Tuple[float, int]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    # ── Versioning ──
+
+    def _version(self) -> Tuple[int, int]:
+        """Current (local generation, shared file mtime) pair."""
+        now = time.monotonic()
+        if self.version_path and now - self._version_checked >= VERSION_CHECK_SECONDS:
+            self._version_checked = now
+            try:
+                self._file_version = os.stat(self.version_path).st_mtime_ns
+            except OSError:
+                self._file_version = 0
+        return self._generation, self._file_version
+
+    def invalidate(self):
+        """
+        Drop every cached page, in this process and in the other workers.
+
+        Safe to call from processes that do not serve pages (the bot):
+        only the shared version file is touched there.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+        if self.version_path:
+            try:
+                directory = os.path.dirname(self.version_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.version_path, 'w') as f:
+                    f.write(str(time.time()))
+                self._version_checked = 0.0
+            except OSError as e:
+                logger.warning(f"Could not bump page cache version: {e}")
+
+    def _marker_path(self, path: str) -> str:
+        digest = hashlib.sha1(path.encode('utf-8')).hexdigest()
+        return os.path.join(f"{self.version_path}.paths", digest)
+
+    def _path_version(self, path: str) -> int:
+        """Time (ns) the page at *path* was last evicted by any process, 0 if never."""
+        if not self.version_path:
+            return 0
+        now = time.monotonic()
+        checked = self._path_versions.get(path)
+        if checked is not None and now - checked[0] < VERSION_CHECK_SECONDS:
+            return checked[1]
+        try:
+            version = os.stat(self._marker_path(path)).st_mtime_ns
+        except OSError:
+            version = 0
+        if len(self._path_versions) >= self.max_entries:
+            self._path_versions.clear()
+        self._path_versions[path] = (now, version)
+        return version
+
+    def invalidate_path(self, path: str):
+        """
+        Drop the cached copies of one page (every language and query string),
+        in this process and in the other workers.
+
+        Args:
+            path: URL path of the page, e.g. /article/<slug>
+        """
+        with self._lock:
+            for key in [k for k in self._entries if self._path_of(k) == path]:
+                del self._entries[key]
+
+        if self.version_path:
+            marker = self._marker_path(path)
+            try:
+                os.makedirs(os.path.dirname(marker), exist_ok=True)
+                with open(marker, 'w') as f:
+                    f.write(path)
+                self._path_versions[path] = (time.monotonic(), os.stat(marker).st_mtime_ns)
+            except OSError as e:
+                logger.warning(f"Could not evict cached page {path}: {e}")
+
+    # ── Lookup / store ──
+
+    @staticmethod
+    def _path_of(key: str) -> str:
+        return key.split("|", 1)[1].split("?", 1)[0]
+
+    def key_for(self, request: Request) -> str:
+        """Cache key: path, query string and language."""
+        return f"{get_lang(request)}|{request.url.path}?{request.url.query}"
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".html")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        # Written before the last invalidation or too old
+        evicted = max(self._version()[1], self._path_version(self._path_of(key)))
+        if stat.st_mtime_ns < evicted or time.time() - stat.st_mtime > self.ttl_seconds:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, body: bytes):
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write page cache file: {e}")
+
+    def lookup(self, request: Request) -> Optional[Response]:
+        """
+        Return the cached page for the request, or None.
+
+        None is also returned for requests that must bypass the cache; pass
+        the rendered response to store() either way.
+        """
+        if not self.enabled or request.method != "GET":
+            return None
+        if SESSION_COOKIE in request.cookies:
+            self.bypasses += 1
+            return None
+
+        key = self.key_for(request)
+        version = self._version()
+        evicted = self._path_version(request.url.path)
+        now = time.monotonic()
+        body = None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, entry_version, stored, entry_body = entry
+                if expires > now and entry_version == version and stored >= evicted:
+                    self._entries.move_to_end(key)
+                    body = entry_body
+                else:
+                    del self._entries[key]
+
+        if body is None and self.disk_dir:
+            body = self._read_disk(key)
+            if body is not None:
+                self._remember(key, body, version)
+
+        if body is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return HTMLResponse(content=body, headers={"X-Page-Cache": "HIT"})
+
+    def _remember(self, key: str, body: bytes, version: Tuple[int, int]):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, version, time.time_ns(), body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def store(self, request: Request, response: Response) -> Response:
+        """
+        Cache a freshly rendered page (200 responses of cacheable requests).
+
+        Returns:
+            The same response, tagged with X-Page-Cache
+        """
+        if not self.enabled or request.method != "GET":
+            return response
+        if SESSION_COOKIE in request.cookies:
+            response.headers["X-Page-Cache"] = "BYPASS"
+            return response
+        if response.status_code != 200 or not getattr(response, "body", None):
+            return response
+
+        key = self.key_for(request)
+        self._remember(key, response.body, self._version())
+        if self.disk_dir:
+            self._write_disk(key, response.body)
+
+        response.headers["X-Page-Cache"] = "MISS"
+        return response
+
+    # ── Metrics ──
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+    def log_stats(self):
+        """Write the counters to the log."""
+        if self.hits or self.misses or self.bypasses:
+            logger.info(f"Page cache: {self.stats()}")
+
+
+# Global page cache instance
+_page_cache_instance: Optional[PageCache] = None
+
+
+def get_page_cache() -> PageCache:
+    """Get or create the global page cache."""
+    global _page_cache_instance
+
+    if _page_cache_instance is None:
+        from config import get_config
+        web = get_config().web
+        _page_cache_instance = PageCache(
+            ttl_seconds=web.page_cache_seconds,
+            max_entries=web.page_cache_max_entries,
+            version_path=web.page_cache_version_path or None,
+            disk_dir=web.page_cache_dir or None,
+        )
+
+    return _page_cache_instance
+
+
+def invalidate_page_cache():
+    """Drop cached pages everywhere (call after publishing content)."""
+    get_page_cache().invalidate()
+
+
+def invalidate_page_path(path: str):
+    """Drop the cached copies of one page everywhere (e.g. a new comment)."""
+    get_page_cache().invalidate_path(path)
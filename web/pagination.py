@@ -0,0 +1,164 @@
+"""
+Keyset pagination helpers for the GoalFeed web portal.
+Listings page on (created_at, id) with opaque cursors, and reuse article
+totals for a short while instead of running COUNT(*) on every page.
+"""
+import base64
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from db import AsyncRepository, WebArticleCard
+from utils.timeutils import iso_to_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def encode_cursor(article: WebArticleCard) -> str:
+    """Encode the (created_at, id) position of an article as an opaque cursor."""
+    created_at = article["created_at"]
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = f"{created_at}|{article['id']}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        (created_at, id), or None if the cursor is missing or malformed
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, article_id = raw.rsplit("|", 1)
+        return iso_to_datetime(created_at), int(article_id)
+    except Exception:
+        logger.debug(f"Ignoring malformed pagination cursor: {cursor[:40]}")
+        return None
+
+
+class TotalsCache:
+    """Small TTL cache for listing totals (COUNT(*) per sport)."""
+
+    def __init__(self, ttl_seconds: float = 120):
+        self.ttl_seconds = ttl_seconds
+        self._values: Dict[Optional[str], Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Optional[str]) -> Optional[int]:
+        with self._lock:
+            entry = self._values.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        return None
+
+    def set(self, key: Optional[str], value: int):
+        with self._lock:
+            self._values[key] = (time.monotonic(), value)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+_totals_cache: Optional[TotalsCache] = None
+
+
+def get_totals_cache() -> TotalsCache:
+    """Get the process-wide totals cache."""
+    global _totals_cache
+    if _totals_cache is None:
+        from config import get_config
+        _totals_cache = TotalsCache(get_config().web.count_cache_seconds)
+    return _totals_cache
+
+
+async def get_cached_total(repo: AsyncRepository, sport: Optional[str] = None) -> int:
+    """
+    Count published web articles, reusing a recent count when available.
+
+    Args:
+        repo: Async repository
+        sport: Optional sport filter
+
+    Returns:
+        Total number of published articles (possibly a few seconds stale)
+    """
+    cache = get_totals_cache()
+    total = cache.get(sport)
+    if total is None:
+        total = await repo.get_web_article_count_by_sport(sport=sport)
+        cache.set(sport, total)
+    return total
+
+
+@dataclass
+class ArticlePage:
+    """One page of a listing with the cursors to its neighbours."""
+    articles: List[WebArticleCard] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+async def load_article_page(
+    repo: AsyncRepository,
+    per_page: int,
+    sport: Optional[str] = None,
+    page: int = 1,
+    after: Optional[str] = None,
+    before: Optional[str] = None
+) -> ArticlePage:
+    """
+    Load a listing page by keyset when a cursor is given.
+
+    Links built from next_cursor/prev_cursor cost the same at page 500 as
+    at page 1. A bare ?page=N (old links) falls back to OFFSET.
+
+    Args:
+        repo: Async repository
+        per_page: Articles per page
+        sport: Optional sport filter
+        page: Page number (display, and OFFSET fallback)
+        after: Cursor of the last article of the previous page
+        before: Cursor of the first article of the following page
+
+    Returns:
+        ArticlePage
+    """
+    after_key = decode_cursor(after)
+    before_key = decode_cursor(before) if after_key is None else None
+
+    if after_key or before_key:
+        # One extra row tells whether there is another page beyond this one
+        rows = await repo.get_web_articles_keyset(
+            limit=per_page + 1, sport=sport, after=after_key, before=before_key
+        )
+        if after_key:
+            has_next, has_prev = len(rows) > per_page, True
+            rows = rows[:per_page]
+        else:
+            has_next, has_prev = True, len(rows) > per_page
+            rows = rows[-per_page:]
+    elif page > 1:
+        rows = await repo.get_web_articles_paginated(
+            page=page, per_page=per_page, sport=sport, limit=per_page + 1
+        )
+        has_next, has_prev = len(rows) > per_page, True
+        rows = rows[:per_page]
+    else:
+        rows = await repo.get_web_articles_keyset(limit=per_page + 1, sport=sport)
+        has_next, has_prev = len(rows) > per_page, False
+        rows = rows[:per_page]
+
+    return ArticlePage(
+        articles=rows,
+        next_cursor=encode_cursor(rows[-1]) if rows and has_next else None,
+        prev_cursor=encode_cursor(rows[0]) if rows and has_prev else None,
+    )
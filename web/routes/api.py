@@ -2,48 +2,91 @@
 import logging
 import html
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
-from db import get_repository
+from db import get_repository, get_async_repository
 from web.auth import get_current_user
+from web.conditional import (
+    ARTICLES_CACHE_CONTROL,
+    LIVE_CACHE_CONTROL,
+    make_etag,
+    not_modified,
+    with_validators,
+)
+from web.live_snapshot import get_live_snapshot
+from web.live_stream import get_live_stream
+from web.page_cache import invalidate_page_path
+from web.pagination import get_cached_total, load_article_page
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api")
 
 
 @router.get("/articles")
-async def api_articles(request: Request, page: int = 1, sport: str = None):
-    """JSON API for articles."""
-    repo = get_repository()
+async def api_articles(
+    request: Request,
+    page: int = 1,
+    sport: str = None,
+    after: str = None,
+    before: str = None,
+):
+    """JSON API for articles. Follow next_cursor/prev_cursor via ?after=/?before=."""
+    repo = get_async_repository()
     config = request.app.state.config
     per_page = config.web.articles_per_page
 
-    articles = repo.get_web_articles_paginated(page=page, per_page=per_page, sport=sport)
-    total = repo.get_web_article_count_by_sport(sport=sport)
+    version = await repo.get_web_articles_version()
+    etag = make_etag("articles", version, per_page, page, sport, after, before)
+    cached = not_modified(request, etag, ARTICLES_CACHE_CONTROL)
+    if cached:
+        return cached
+
+    listing = await load_article_page(
+        repo, per_page, sport=sport, page=page, after=after, before=before
+    )
+    total = await get_cached_total(repo, sport=sport)
 
-    return JSONResponse({
-        "articles": articles,
+    return with_validators(JSONResponse({
+        "articles": jsonable_encoder([article.to_dict() for article in listing.articles]),
         "page": page,
         "total": total,
         "per_page": per_page,
-    })
+        "next_cursor": listing.next_cursor,
+        "prev_cursor": listing.prev_cursor,
+    }), etag, ARTICLES_CACHE_CONTROL)
 
 
 @router.get("/live")
 async def api_live(request: Request):
-    """JSON API for live matches."""
-    repo = get_repository()
+    """JSON API for live matches (shared pre-serialized snapshot)."""
+    snapshot = await get_live_snapshot().get()
+
+    cached = not_modified(request, snapshot.etag, LIVE_CACHE_CONTROL)
+    if cached:
+        return cached
+
+    return with_validators(
+        Response(content=snapshot.body, media_type="application/json"),
+        snapshot.etag,
+        LIVE_CACHE_CONTROL,
+    )
+
 
-    matches = repo.get_active_live_matches()
-    enriched = []
-    for match in matches:
-        events = repo.get_match_events(match['match_id'])
-        enriched.append({**match, "events": events})
+@router.get("/live/stream")
+async def api_live_stream(request: Request):
+    """Server-Sent Events: live snapshot on connect, then pushed updates."""
+    # Buffering servers (Passenger WSGI bridge) cannot stream; 204 tells
+    # EventSource not to reconnect and live.js falls back to polling
+    if "goalfeed.buffered" in request.scope.get("extensions", {}):
+        return Response(status_code=204)
 
-    return JSONResponse({
-        "matches": enriched,
-    })
+    return StreamingResponse(
+        get_live_stream().events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # --- Comments API ---
@@ -51,8 +94,8 @@ async def api_live(request: Request):
 @router.get("/comments/{web_article_id}")
 async def api_get_comments(web_article_id: int):
     """Get comments for an article."""
-    repo = get_repository()
-    comments = repo.get_comments(web_article_id)
+    repo = get_async_repository()
+    comments = await repo.get_comments(web_article_id)
     return JSONResponse({"comments": comments})
 
 
@@ -88,6 +131,10 @@ async def api_post_comment(
             comment_text=clean_text,
             user_id=user["id"],
         )
+        # The article page renders its comments
+        slug = repo.get_web_article_slug(web_article_id)
+        if slug:
+            invalidate_page_path(f"/article/{slug}")
 
         return JSONResponse({
             "id": comment_id,
@@ -3,8 +3,10 @@ import logging
 from fastapi import APIRouter, Request, HTTPException
 from fastapi.responses import HTMLResponse
 
-from db import get_repository
+from db import get_async_repository
 from web.auth import get_current_user
+from web.page_cache import get_page_cache
+from web.view_counter import get_view_counter
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -13,33 +15,39 @@ router = APIRouter()
 @router.get("/article/{slug}", response_class=HTMLResponse)
 async def article_detail(request: Request, slug: str):
     """Display a single article."""
-    repo = get_repository()
+    cache = get_page_cache()
+    cached = cache.lookup(request)
+    if cached:
+        get_view_counter().record(slug)
+        return cached
+
+    repo = get_async_repository()
     templates = request.app.state.templates
 
-    article = repo.get_web_article_by_slug(slug)
+    article = await repo.get_web_article_by_slug(slug)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    # Increment view count
-    repo.increment_view_count(slug)
+    # Count the view; written to the DB in batches by the view counter
+    get_view_counter().record(slug)
 
     # Get related articles
-    related = repo.get_related_web_articles(
+    related = await repo.get_related_web_articles(
         sport=article['sport'],
         exclude_slug=slug,
         limit=4
     )
 
     # Get comments
-    comments = repo.get_comments(article['id'])
+    comments = await repo.get_comments(article['id'])
 
     # Real user from session
     current_user = get_current_user(request)
 
-    return templates.TemplateResponse("article_detail.html", {
+    return cache.store(request, templates.TemplateResponse("article_detail.html", {
         "request": request,
         "article": article,
         "related": related,
         "comments": comments,
         "current_user": current_user,
-    })
+    }))
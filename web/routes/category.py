@@ -4,35 +4,46 @@ from fastapi import APIRouter, Request, HTTPException
 from fastapi.responses import HTMLResponse
 
 from config import SPORT_DISPLAY
-from db import get_repository
+from db import get_async_repository
+from web.page_cache import get_page_cache
+from web.pagination import get_cached_total, load_article_page
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 @router.get("/category/{sport}", response_class=HTMLResponse)
-async def category(request: Request, sport: str, page: int = 1):
+async def category(request: Request, sport: str, page: int = 1, after: str = None, before: str = None):
     """Articles filtered by sport."""
     if sport not in SPORT_DISPLAY:
         raise HTTPException(status_code=404, detail="Categoría no encontrada")
 
-    repo = get_repository()
+    cache = get_page_cache()
+    cached = cache.lookup(request)
+    if cached:
+        return cached
+
+    repo = get_async_repository()
     templates = request.app.state.templates
     config = request.app.state.config
     per_page = config.web.articles_per_page
 
-    articles = repo.get_web_articles_paginated(page=page, per_page=per_page, sport=sport)
-    total = repo.get_web_article_count_by_sport(sport=sport)
+    listing = await load_article_page(
+        repo, per_page, sport=sport, page=page, after=after, before=before
+    )
+    total = await get_cached_total(repo, sport=sport)
     total_pages = max(1, (total + per_page - 1) // per_page)
 
     sport_info = SPORT_DISPLAY[sport]
 
-    return templates.TemplateResponse("category.html", {
+    return cache.store(request, templates.TemplateResponse("category.html", {
         "request": request,
-        "articles": articles,
+        "articles": listing.articles,
         "sport": sport,
         "sport_info": sport_info,
         "page": page,
+        "next_cursor": listing.next_cursor,
+        "prev_cursor": listing.prev_cursor,
         "total_pages": total_pages,
         "total": total,
-    })
+    }))
@@ -3,7 +3,7 @@ import logging
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
-from db import get_repository
+from web.live_snapshot import get_live_snapshot
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -12,18 +12,10 @@ router = APIRouter()
 @router.get("/live", response_class=HTMLResponse)
 async def live(request: Request):
     """Live matches page with auto-refresh."""
-    repo = get_repository()
     templates = request.app.state.templates
-
-    matches = repo.get_active_live_matches()
-
-    # Enrich matches with their events
-    enriched = []
-    for match in matches:
-        events = repo.get_match_events(match['match_id'])
-        enriched.append({**match, "events": events})
+    snapshot = await get_live_snapshot().get()
 
     return templates.TemplateResponse("live.html", {
         "request": request,
-        "matches": enriched,
+        "matches": snapshot.matches,
     })
@@ -1,10 +1,11 @@
 """Sitemap and robots.txt routes."""
 import logging
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response
 
 from config import get_config
-from db import get_repository
+from web.conditional import SITEMAP_CACHE_CONTROL, make_etag, not_modified, with_validators
+from web.sitemap import SITEMAP_MEDIA_TYPE, get_sitemap_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -12,38 +13,42 @@ router = APIRouter()
 
 @router.get("/sitemap.xml")
 async def sitemap(request: Request):
-    """Dynamic sitemap."""
-    config = get_config()
-    base_url = config.web.base_url
-    repo = get_repository()
-
-    articles = repo.get_latest_web_articles(limit=500)
-
-    xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    xml += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-
-    # Homepage
-    xml += f'  <url><loc>{base_url}/</loc><changefreq>hourly</changefreq><priority>1.0</priority></url>\n'
-
-    # Category pages
-    for sport in ["football_eu", "nba", "tennis"]:
-        xml += f'  <url><loc>{base_url}/category/{sport}</loc><changefreq>hourly</changefreq><priority>0.8</priority></url>\n'
-
-    # Live page
-    xml += f'  <url><loc>{base_url}/live</loc><changefreq>always</changefreq><priority>0.9</priority></url>\n'
-
-    # Articles
-    for article in articles:
-        lastmod = article.get('updated_at', article.get('created_at', ''))
-        if lastmod:
-            lastmod_tag = f'<lastmod>{lastmod[:10]}</lastmod>'
-        else:
-            lastmod_tag = ''
-        xml += f'  <url><loc>{base_url}/article/{article["slug"]}</loc>{lastmod_tag}<priority>0.7</priority></url>\n'
-
-    xml += '</urlset>'
-
-    return Response(content=xml, media_type="application/xml")
+    """Sitemap index: static pages plus one shard per month of articles."""
+    cache = get_sitemap_cache()
+    version = await cache.refresh()
+
+    etag = make_etag("sitemap", cache.base_url, version)
+    cached = not_modified(request, etag, SITEMAP_CACHE_CONTROL)
+    if cached:
+        return cached
+
+    return with_validators(
+        Response(content=cache.index_body(), media_type=SITEMAP_MEDIA_TYPE),
+        etag, SITEMAP_CACHE_CONTROL
+    )
+
+
+@router.get("/sitemaps/{name}.xml")
+async def sitemap_shard(request: Request, name: str):
+    """Child sitemap listed in the index."""
+    cache = get_sitemap_cache()
+    await cache.refresh()
+
+    shard = cache.shards.get(name)
+    if shard is None:
+        raise HTTPException(status_code=404)
+
+    # The gzip file and the identity body are different representations
+    gzip_file = cache.gzip_file(request, shard)
+    etag = make_etag("sitemap", cache.base_url, name, shard.version)
+    if gzip_file:
+        etag = etag[:-1] + '-gz"'
+
+    response = not_modified(request, etag, SITEMAP_CACHE_CONTROL)
+    if response is None:
+        response = with_validators(cache.response(shard, gzip_file), etag, SITEMAP_CACHE_CONTROL)
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
 
 
 @router.get("/robots.txt")
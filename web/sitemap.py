@@ -0,0 +1,278 @@
+"""
+Sharded sitemap for the GoalFeed web portal.
+/sitemap.xml is a sitemap index pointing at one child sitemap for the static
+pages plus one per month of articles. Shards are streamed from a narrow
+(slug, dates) projection and kept until their month changes, optionally as
+gzip files on disk that are served as-is to crawlers.
+"""
+import asyncio
+import glob
+import gzip
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from db import get_async_repository
+
+logger = logging.getLogger(__name__)
+
+
+# Protocol limit of URLs per sitemap file
+SITEMAP_MAX_URLS = 50000
+
+# Article URLs encoded per streamed chunk
+STREAM_BATCH_SIZE = 500
+
+# Category pages listed in the static shard
+SITEMAP_CATEGORIES = ("football_eu", "nba", "tennis")
+
+SITEMAP_MEDIA_TYPE = "application/xml"
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+URLSET_OPEN = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_CLOSE = '</urlset>\n'
+INDEX_OPEN = '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+INDEX_CLOSE = '</sitemapindex>\n'
+
+
+def _w3c_date(value) -> str:
+    """YYYY-MM-DD of a datetime (or DB string), '' if unknown."""
+    if not value:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)[:10]
+
+
+def _month_bounds(month: str) -> Tuple[str, str]:
+    """[start, end) created_at bounds of a 'YYYY-MM' month."""
+    year, number = (int(part) for part in month.split("-"))
+    next_year, next_number = (year + 1, 1) if number == 12 else (year, number + 1)
+    return f"{year:04d}-{number:02d}-01 00:00:00", f"{next_year:04d}-{next_number:02d}-01 00:00:00"
+
+
+@dataclass
+class SitemapShard:
+    """One child sitemap: the static pages or (part of) a month of articles."""
+    name: str
+    version: str
+    lastmod: str = ""
+    month: Optional[str] = None
+    offset: int = 0
+
+
+class SitemapCache:
+    """
+    Sitemap index and shard bodies, keyed by content version.
+
+    The shard list comes from a per-month GROUP BY that is only re-run when
+    the web articles version changes. A month shard's version is its article
+    count and newest updated_at, so publishing today only rebuilds the
+    current month; older shards keep being served from memory (or disk).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_urls: int = SITEMAP_MAX_URLS,
+        disk_dir: Optional[str] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.max_urls = max_urls
+        self.disk_dir = disk_dir
+
+        self.version: Optional[str] = None
+        self.shards: Dict[str, SitemapShard] = {}
+        self._index: Optional[bytes] = None
+        self._bodies: Dict[str, Tuple[str, bytes]] = {}
+
+        self.builds = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    async def refresh(self) -> str:
+        """
+        Reload the shard list if articles were published or updated.
+
+        Returns:
+            Current web articles version
+        """
+        repo = get_async_repository()
+        version = await repo.get_web_articles_version()
+        if version == self.version:
+            return version
+
+        months = await repo.get_sitemap_months()
+        newest = _w3c_date(max((row["lastmod"] for row in months if row["lastmod"]), default=None))
+
+        shards = {"pages": SitemapShard("pages", f"pages:{newest}", newest)}
+        for row in months:
+            month_version = f"{row['articles']}:{row['lastmod']}"
+            parts = max(1, -(-int(row["articles"]) // self.max_urls))
+            for part in range(parts):
+                name = f"articles-{row['month']}" + (f"-{part + 1}" if part else "")
+                shards[name] = SitemapShard(
+                    name, month_version, _w3c_date(row["lastmod"]),
+                    month=row["month"], offset=part * self.max_urls,
+                )
+
+        self._bodies = {
+            name: entry for name, entry in self._bodies.items()
+            if name in shards and shards[name].version == entry[0]
+        }
+        self.shards = shards
+        self._index = None
+        self.version = version
+        return version
+
+    def index_body(self) -> bytes:
+        """XML of the sitemap index (call refresh first)."""
+        if self._index is None:
+            entries = [
+                f'  <sitemap><loc>{self.base_url}/sitemaps/{shard.name}.xml</loc>'
+                + (f'<lastmod>{shard.lastmod}</lastmod>' if shard.lastmod else '')
+                + '</sitemap>\n'
+                for shard in self.shards.values()
+            ]
+            self._index = (XML_HEADER + INDEX_OPEN + "".join(entries) + INDEX_CLOSE).encode("utf-8")
+        return self._index
+
+    def _static_urls(self) -> str:
+        base_url = self.base_url
+        urls = [f'  <url><loc>{base_url}/</loc><changefreq>hourly</changefreq><priority>1.0</priority></url>\n']
+        for sport in SITEMAP_CATEGORIES:
+            urls.append(f'  <url><loc>{base_url}/category/{sport}</loc><changefreq>hourly</changefreq><priority>0.8</priority></url>\n')
+        urls.append(f'  <url><loc>{base_url}/live</loc><changefreq>always</changefreq><priority>0.9</priority></url>\n')
+        return "".join(urls)
+
+    def _article_urls(self, rows: List[Dict]) -> str:
+        base_url = self.base_url
+        urls = []
+        for row in rows:
+            lastmod = _w3c_date(row.get("updated_at") or row.get("created_at"))
+            lastmod_tag = f'<lastmod>{lastmod}</lastmod>' if lastmod else ''
+            urls.append(f'  <url><loc>{base_url}/article/{escape(row["slug"])}</loc>{lastmod_tag}<priority>0.7</priority></url>\n')
+        return "".join(urls)
+
+    async def stream(self, shard: SitemapShard) -> AsyncIterator[bytes]:
+        """
+        Generate a shard chunk by chunk, caching it once fully sent.
+
+        Args:
+            shard: Shard to build
+
+        Yields:
+            UTF-8 XML chunks
+        """
+        chunks = [(XML_HEADER + URLSET_OPEN).encode("utf-8")]
+        yield chunks[-1]
+
+        if shard.month is None:
+            chunks.append(self._static_urls().encode("utf-8"))
+            yield chunks[-1]
+        else:
+            start, end = _month_bounds(shard.month)
+            rows = await get_async_repository().get_sitemap_articles(
+                start, end, limit=self.max_urls, offset=shard.offset
+            )
+            for batch in range(0, len(rows), STREAM_BATCH_SIZE):
+                chunks.append(self._article_urls(rows[batch:batch + STREAM_BATCH_SIZE]).encode("utf-8"))
+                yield chunks[-1]
+
+        chunks.append(URLSET_CLOSE.encode("utf-8"))
+        yield chunks[-1]
+
+        await self._store(shard, b"".join(chunks))
+
+    async def _store(self, shard: SitemapShard, body: bytes):
+        current = self.shards.get(shard.name)
+        if current is None or current.version != shard.version:
+            return
+        self._bodies[shard.name] = (shard.version, body)
+        self.builds += 1
+        if self.disk_dir:
+            await asyncio.to_thread(self._write_disk, shard, body)
+
+    def _disk_path(self, shard: SitemapShard) -> str:
+        digest = hashlib.sha1(f"{self.base_url}|{shard.version}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.disk_dir, f"{shard.name}.{digest}.xml.gz")
+
+    def _write_disk(self, shard: SitemapShard, body: bytes):
+        path = self._disk_path(shard)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(body, compresslevel=9, mtime=0))
+            os.replace(tmp_path, path)
+            # Older versions of the same shard
+            for stale in glob.glob(os.path.join(self.disk_dir, f"{shard.name}.*.xml.gz")):
+                if stale != path:
+                    os.remove(stale)
+        except OSError as e:
+            logger.warning(f"Could not write sitemap shard {shard.name}: {e}")
+
+    def gzip_file(self, request: Request, shard: SitemapShard) -> Optional[str]:
+        """Precompressed file to send as-is, if the client accepts gzip and it exists."""
+        if not self.disk_dir or "gzip" not in request.headers.get("accept-encoding", "").lower():
+            return None
+        path = self._disk_path(shard)
+        return path if os.path.exists(path) else None
+
+    def response(self, shard: SitemapShard, gzip_file: Optional[str] = None) -> Response:
+        """
+        Response for a shard: precompressed file, cached body or a fresh stream.
+
+        Args:
+            shard: Shard to send
+            gzip_file: Result of gzip_file() for the request, sent with
+                Content-Encoding: gzip when set
+
+        Returns:
+            Response without validators
+        """
+        if gzip_file:
+            return FileResponse(
+                gzip_file,
+                media_type=SITEMAP_MEDIA_TYPE,
+                headers={"Content-Encoding": "gzip"},
+            )
+
+        cached = self._bodies.get(shard.name)
+        if cached and cached[0] == shard.version:
+            return Response(content=cached[1], media_type=SITEMAP_MEDIA_TYPE)
+
+        gzip_path = self._disk_path(shard) if self.disk_dir else None
+        if gzip_path and os.path.exists(gzip_path):
+            # Built by another worker; keep it for the next requests too
+            with open(gzip_path, 'rb') as f:
+                body = gzip.decompress(f.read())
+            self._bodies[shard.name] = (shard.version, body)
+            return Response(content=body, media_type=SITEMAP_MEDIA_TYPE)
+
+        return StreamingResponse(self.stream(shard), media_type=SITEMAP_MEDIA_TYPE)
+
+
+# Global sitemap cache instance
+_sitemap_instance: Optional[SitemapCache] = None
+
+
+def get_sitemap_cache() -> SitemapCache:
+    """Get or create the global sitemap cache."""
+    global _sitemap_instance
+
+    if _sitemap_instance is None:
+        from config import get_config
+        web = get_config().web
+        _sitemap_instance = SitemapCache(
+            web.base_url,
+            disk_dir=web.sitemap_dir or None,
+        )
+
+    return _sitemap_instance
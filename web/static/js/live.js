@@ -1,4 +1,4 @@
-// GoalFeed Live — Auto-refresh for /live page
+// GoalFeed Live — Push updates (SSE) for /live page, polling as fallback
 
 (function () {
     var I18N = window.GF_I18N || {};
@@ -25,36 +25,103 @@
         return EVENT_ICONS[eventType] || EVENT_ICONS['default'];
     }
 
+    var FINISHED = ['FT', 'AET', 'PEN', 'CANC', 'PST', 'ABD'];
+    var matches = [];  // current state, same shape as /api/live "matches"
+
+    function renderMatches() {
+        if (timeEl) {
+            var now = new Date();
+            var locale = (window.GF_LANG === 'en') ? 'en-GB' : 'es-ES';
+            timeEl.textContent = (I18N['updated'] || 'Actualizado') + ' ' + now.toLocaleTimeString(locale, { hour: '2-digit', minute: '2-digit' });
+        }
+
+        var container = document.getElementById('live-matches-container');
+        if (!container) return;
+
+        if (matches.length === 0) {
+            container.innerHTML = '<div class="gf-empty"><p class="gf-empty__text">' + escapeHtml(I18N['no_live'] || 'No hay partidos en vivo en este momento.') + '</p></div>';
+            return;
+        }
+
+        var html = '<div class="gf-live-list">';
+        matches.forEach(function (match) {
+            html += buildMatchCard(match);
+        });
+        html += '</div>';
+        container.innerHTML = html;
+    }
+
+    function findMatch(matchId) {
+        for (var i = 0; i < matches.length; i++) {
+            if (matches[i].match_id === matchId) return matches[i];
+        }
+        return null;
+    }
+
+    function applyMatch(update) {
+        var match = findMatch(update.match_id);
+        if (FINISHED.indexOf(update.match_status) !== -1) {
+            matches = matches.filter(function (m) { return m.match_id !== update.match_id; });
+            return;
+        }
+        if (!match) {
+            match = { events: [] };
+            matches.unshift(match);
+        }
+        for (var key in update) {
+            if (Object.prototype.hasOwnProperty.call(update, key)) match[key] = update[key];
+        }
+    }
+
+    function applyEvent(evt) {
+        var match = findMatch(evt.match_id);
+        if (!match) return;
+        match.home_score = evt.home_score;
+        match.away_score = evt.away_score;
+        match.events = (match.events || []).concat([evt]).sort(function (a, b) {
+            return (a.event_minute || 0) - (b.event_minute || 0);
+        });
+    }
+
     function refreshLive() {
         fetch('/api/live')
             .then(function (res) { return res.json(); })
             .then(function (data) {
-                if (timeEl) {
-                    var now = new Date();
-                    var locale = (window.GF_LANG === 'en') ? 'en-GB' : 'es-ES';
-                    timeEl.textContent = (I18N['updated'] || 'Actualizado') + ' ' + now.toLocaleTimeString(locale, { hour: '2-digit', minute: '2-digit' });
-                }
-
-                var container = document.getElementById('live-matches-container');
-                if (!container) return;
-
-                if (!data.matches || data.matches.length === 0) {
-                    container.innerHTML = '<div class="gf-empty"><p class="gf-empty__text">' + escapeHtml(I18N['no_live'] || 'No hay partidos en vivo en este momento.') + '</p></div>';
-                    return;
-                }
-
-                var html = '<div class="gf-live-list">';
-                data.matches.forEach(function (match) {
-                    html += buildMatchCard(match);
-                });
-                html += '</div>';
-                container.innerHTML = html;
+                matches = data.matches || [];
+                renderMatches();
             })
             .catch(function (err) {
                 console.error('Error refreshing live data:', err);
             });
     }
 
+    var pollTimer = null;
+
+    function startPolling() {
+        if (!pollTimer) pollTimer = setInterval(refreshLive, REFRESH_INTERVAL);
+    }
+
+    function startStream() {
+        var source = new EventSource('/api/live/stream');
+
+        source.addEventListener('snapshot', function (e) {
+            matches = JSON.parse(e.data) || [];
+            renderMatches();
+        });
+        source.addEventListener('match', function (e) {
+            applyMatch(JSON.parse(e.data));
+            renderMatches();
+        });
+        source.addEventListener('event', function (e) {
+            applyEvent(JSON.parse(e.data));
+            renderMatches();
+        });
+        source.onerror = function () {
+            // The browser reconnects on its own unless the stream is refused
+            if (source.readyState === EventSource.CLOSED) startPolling();
+        };
+    }
+
     function buildMatchCard(match) {
         var statusHtml = '';
         if (['1H', '2H', 'ET', 'LIVE'].indexOf(match.match_status) !== -1) {
@@ -103,6 +170,10 @@
             '</div>';
     }
 
-    // Start auto-refresh
-    setInterval(refreshLive, REFRESH_INTERVAL);
+    // Push updates when supported, auto-refresh otherwise
+    if (window.EventSource) {
+        startStream();
+    } else {
+        startPolling();
+    }
 })();
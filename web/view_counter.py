@@ -0,0 +1,136 @@
+"""
+Write-behind view counter for the GoalFeed web portal.
+Article views are aggregated per slug in memory and written in batches
+(one UPDATE per flush) by a background thread, so page views never wait
+on a database write.
+"""
+import atexit
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """
+    Buffered per-slug view counts.
+
+    Counts are flushed every ``flush_interval`` seconds, as soon as
+    ``max_pending`` views are buffered, and on shutdown. A failed flush puts
+    the counts back so they go out with the next one.
+    """
+
+    def __init__(self, flush_interval: float = 10.0, max_pending: int = 500, repo=None):
+        """
+        Initialize the counter.
+
+        Args:
+            flush_interval: Seconds between periodic flushes
+            max_pending: Buffered views that trigger an early flush
+            repo: Repository used for flushing (global one if not provided)
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._repo = repo
+        self._counts: Dict[str, int] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """Views buffered and not yet written."""
+        return self._pending
+
+    def record(self, slug: str, views: int = 1):
+        """Count a view (no I/O; the flusher thread writes it later)."""
+        with self._lock:
+            self._counts[slug] = self._counts.get(slug, 0) + views
+            self._pending += views
+            pending = self._pending
+
+        if self._thread is None:
+            self.start()
+        if pending >= self.max_pending:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        Write buffered counts to the database.
+
+        Returns:
+            Number of views written
+        """
+        with self._flush_lock:
+            with self._lock:
+                counts, self._counts = self._counts, {}
+                views, self._pending = self._pending, 0
+
+            if not counts:
+                return 0
+
+            try:
+                repo = self._repo
+                if repo is None:
+                    from db import get_repository
+                    repo = get_repository()
+                repo.add_view_counts(counts)
+            except Exception as e:
+                logger.warning(f"View count flush failed, keeping {views} views for retry: {e}")
+                with self._lock:
+                    for slug, count in counts.items():
+                        self._counts[slug] = self._counts.get(slug, 0) + count
+                    self._pending += views
+                return 0
+
+            logger.debug(f"Flushed {views} views for {len(counts)} articles")
+            return views
+
+    def start(self):
+        """Start the background flusher (idempotent)."""
+        with self._lock:
+            if self._thread is not None or self._stopped.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="goalfeed-view-counter", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if not self._stopped.is_set():
+                self.flush()
+
+    def stop(self):
+        """Stop the flusher and write whatever is still buffered."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval)
+        self.flush()
+
+
+# Global view counter instance
+_counter_instance: Optional[ViewCounter] = None
+
+
+def get_view_counter() -> ViewCounter:
+    """Get or create the global view counter (flushed at interpreter exit)."""
+    global _counter_instance
+
+    if _counter_instance is None:
+        from config import get_config
+        config = get_config()
+        _counter_instance = ViewCounter(
+            flush_interval=config.web.view_flush_seconds,
+            max_pending=config.web.view_flush_max_pending,
+        )
+        atexit.register(_counter_instance.stop)
+
+    return _counter_instance